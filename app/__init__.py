@@ -5,13 +5,15 @@ from flask_bootstrap import Bootstrap5
 from flask import g, Flask, render_template
 from flask_mailing import ConnectionConfig
 from flask_security import current_user, SQLAlchemyUserDatastore, Security
-import sqlalchemy as sa
 from instance.config import app_config
 
 from .api import api_bp
 from .common import mail
+from .common.dashboard_counters import counter_reconciler, register_counter_hooks
+from .common.sla import get_sla_policy
+from .common.sla_scheduler import breach_scheduler
 from .model import db, migrate
-from .model.lookup_tables import OfficeHours, AppDefaults
+from .model.lookup_tables import AppDefaults
 from .model.model_user import User, Role
 
 from .views.admin import admin_bp
@@ -31,10 +33,7 @@ from .views.security.security import MyMailUtil
 def load_user_settings():
     """Load user-specific settings into Flask's g object."""
     if current_user.is_authenticated and current_user.location_id:
-        office_hours = db.session.execute(
-            sa.select(OfficeHours)
-            .where(OfficeHours.id == current_user.location_id)
-        ).scalars().first()
+        office_hours = get_sla_policy(current_user.location_id)  # cached per location, no query per request
 
         g.user_timezone = office_hours.timezone if office_hours else "UTC"
         g.date_format = office_hours.date_format if office_hours else "%Y-%m-%d"
@@ -147,6 +146,7 @@ def create_app(config=None):
     app.register_error_handler(404, page_not_found)
     db.init_app(app)
     migrate.init_app(app, db)
+    register_counter_hooks(app)
     bootstrap = Bootstrap5()
     bootstrap.init_app(app)
 
@@ -160,3 +160,12 @@ def create_app(config=None):
 
     return app
 
+
+def start_background_jobs(app):
+    """
+    Start the SLA breach scheduler and the dashboard counter reconciler. Called by the serving entry points, wsgi.py
+    and run.py, rather than create_app, so flask commands, seeding and migrations do not run them.
+    """
+    breach_scheduler.start(app)
+    counter_reconciler.start(app)
+
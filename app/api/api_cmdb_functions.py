@@ -5,10 +5,11 @@ import sqlalchemy as sa
 from sqlalchemy.exc import SQLAlchemyError
 
 from ..common.exception_handler import log_exception
+from ..common.filter_vocabulary import resolve_filter_name
 from ..model import db
 from ..model.model_category import Category
 from ..model.model_cmdb import CmdbConfigurationItem, ChangeFreeze
-from ..model.lookup_tables import Compliance, Importance
+from ..model.lookup_tables import Compliance
 from ..common.ticket_utils import datetime_to_string, date_to_string
 from . import api_bp
 
@@ -20,25 +21,16 @@ def handle_cmdb_params(stmt, params):
     p_name = params['name']
     p_name = p_name.replace('\n', ' ')
 
-    cmdb = db.session.execute(
-            sa.select(CmdbConfigurationItem)
-            .where(CmdbConfigurationItem.status != 'disposed')
-        ).scalars()
-
-    ci_categories = [ticket.category.name for ticket in cmdb]
-    importance = [ticket.importance for ticket in db.session.execute(sa.select(Importance)).scalars()]
-    statuses = [ticket.status for ticket in cmdb]
-    ticket_types = [ticket.ticket_type for ticket in cmdb]
-
-    if p_name in ci_categories:
-        return stmt.where(
-            CmdbConfigurationItem.category.has(Category.name == p_name)), f'CI with category "{p_name}"'
-    elif p_name in statuses:
+    kind, ids = resolve_filter_name(p_name, 'ci_category', 'ci_status', 'ci_type', 'importance')
+
+    if kind == 'ci_category':
+        return stmt.where(CmdbConfigurationItem.category_id.in_(ids)), f'CI with category "{p_name}"'
+    elif kind == 'ci_status':
         return stmt.where(CmdbConfigurationItem.status == p_name), f"Change with status '{p_name}'"
-    elif p_name in ticket_types:
+    elif kind == 'ci_type':
         return stmt.where(CmdbConfigurationItem.ticket_type == p_name), f"Change with ticket type '{p_name}'"
-    elif p_name in importance:
-        return stmt.where(CmdbConfigurationItem.importance.has(Importance.importance == p_name)), f"Change with metallic '{p_name}'"
+    elif kind == 'importance':
+        return stmt.where(CmdbConfigurationItem.importance_id.in_(ids)), f"Change with metallic '{p_name}'"
     else:
         return stmt, 'No filtering applied'
 
@@ -1,191 +1,534 @@
+import base64
+import binascii
+import json
+import math
+
 import pytz
 from flask import g, current_app, jsonify
 from flask_login import current_user
 import sqlalchemy as sa
+from sqlalchemy.orm import aliased
 from ..model import db
 from ..model.model_change import Change
 from ..model.model_cmdb import CmdbConfigurationItem
 from ..model.model_idea import Idea
 from ..model.model_knowledge import KnowledgeBase
+from ..model.lookup_tables import KBATypesLookup, VendorLookup
 from ..model.model_interaction import Ticket
+from ..model.model_problem import Problem
 from ..model.model_release import Release
-from ..model.model_user import Team, User
+from ..model.model_user import Role, Team, User
+from ..model.relationship_tables import user_roles
+from ..common.model_versions import model_version
+from ..common.response_versions import not_modified, response_etag, tag_response
+from ..common.table_counts import count_rows
 from ..common.ticket_utils import format_time
 
 
-def apply_filters(model, stmt, filters):
-    if not filters:
-        return stmt, 'No filters provided'
-
-    filter_by = filters[0]
-    field = filter_by.get('field', '').strip().lower()
-    value = filter_by.get('value')
-
-    match field:
-        case 'article_type':
-            return stmt.where(model.article_type == value), f'Article type: "{value}"'
-
-        case 'author':
-            return stmt.join(model.author).filter(
-                User.full_name.ilike(f'{value}%')), f'Author: "{value}"'
+# What each table model returns from /get_paginated/: its own columns and the display names of related records, as
+# label: (relationship, column of the related model, value when there is no related record). get_paginated_results
+# selects just these as plain rows and create_row_response serialises them, so no entities are built for a page.
+# The display names come in through the page's own joins and User roles in one more query, see create_table_rows,
+# so a page is a fixed number of queries and there are no relationships left to eager load.
+_TICKET_COLUMNS = ('ticket_number', 'ticket_type', 'status', 'created_at', 'short_desc')
+TABLE_PROJECTIONS = {
+    Ticket: {
+        'columns': (*_TICKET_COLUMNS, 'priority', 'sla_respond_by', 'sla_resolve_by', 'sla_response_breach',
+                    'sla_resolve_breach'),
+        'names': {
+            'requester_name': ('requester', 'full_name', None),
+            'supporter_name': ('supporter', 'full_name', 'Not assigned'),
+            'support_team_name': ('support_team', 'name', None),
+        },
+    },
+    Problem: {
+        'columns': (*_TICKET_COLUMNS, 'priority'),
+        'names': {
+            'requester_name': ('requester', 'full_name', None),
+            'supporter_name': ('supporter', 'full_name', None),
+        },
+    },
+    Change: {
+        'columns': (*_TICKET_COLUMNS, 'cab_approval_status', 'change_type', 'risk_set', 'start_date', 'start_time',
+                    'end_time'),
+        'names': {
+            'requester_name': ('requester', 'full_name', 'None'),
+            'supporter_name': ('supporter', 'full_name', 'None'),
+        },
+    },
+    Idea: {
+        'columns': (*_TICKET_COLUMNS, 'likelihood', 'vote_count', 'vote_score'),
+        'names': {
+            'requester_name': ('requester', 'full_name', None),
+            'category_name': ('category', 'name', 'not specified'),
+        },
+    },
+    KnowledgeBase: {
+        'columns': (*_TICKET_COLUMNS, 'title', 'times_viewed', 'times_useful'),
+        'names': {
+            'author_name': ('author', 'full_name', None),
+            'category_name': ('category', 'name', 'not specified'),
+            'article_type_name': ('article_type', 'article_type', None),
+        },
+    },
+    User: {
+        'columns': ('id', 'full_name', 'occupation', 'last_login_at', 'current_login_ip', 'phone', 'email', 'active'),
+        'names': {
+            'department_name': ('department', 'name', None),
+            'manager_name': ('manager', 'full_name', 'not specified'),
+            'team_name': ('team', 'name', 'not specified'),
+        },
+    },
+    CmdbConfigurationItem: {
+        'columns': (*_TICKET_COLUMNS, 'name'),
+        'names': {
+            'requester_name': ('owner', 'full_name', None),
+            'category_name': ('category', 'name', 'not specified'),
+            'support_team_name': ('support_team', 'name', None),
+        },
+    },
+    Release: {
+        'columns': (*_TICKET_COLUMNS, 'release_name', 'requester_id'),
+        'names': {
+            'requester_name': ('requester', 'full_name', None),
+            'release_type_name': ('release_type', 'release_type', None),
+            'support_team_name': ('support_team', 'name', None),
+        },
+    },
+}
+
+
+def apply_table_projection(model, stmt):
+    """
+    Swaps the entity selected by stmt for the model's TABLE_PROJECTIONS columns, outer joining an alias of each
+    related model for its display name so joins already made for filtering are left alone.
+    """
+    projection = TABLE_PROJECTIONS[model]
+    columns = [getattr(model, name) for name in projection['columns']]
+    joins = []
+    for label, (relationship, column, default) in projection['names'].items():
+        related = aliased(getattr(model, relationship).property.mapper.class_)
+        value = getattr(related, column)
+        if default is not None:
+            value = sa.case((related.id.is_(None), default), else_=value)
+        columns.append(value.label(label))
+        joins.append(getattr(model, relationship).of_type(related))
+
+    stmt = stmt.with_only_columns(*columns)
+    for join in joins:
+        stmt = stmt.outerjoin(join)
+    return stmt
+
+
+def table_versions(model):
+    """
+    Versions of model and of every model apply_table_projection joins in for a display name, see
+    common/model_versions.py. A page of the table is unchanged for as long as all of them are.
+    """
+    related = [getattr(model, relationship).property.mapper.class_
+               for relationship, _, _ in TABLE_PROJECTIONS[model]['names'].values()]
+    return tuple(model_version(version_model) for version_model in dict.fromkeys([model, *related]))
 
-        case 'email':
-            return stmt.where(model.email.ilike(f'{value}%')), f'Email: "{value}"'
 
-        case 'full_name':
-            return stmt.where(model.full_name.ilike(f'{value}%')), f'Full name: "{value}"'
+MAX_TICKET_NUMBER = 2147483647  # ticket_number is a Postgres integer
 
-        case 'requested_by' | 'owned_by':
-            return stmt.join(model.requester).where(
-                User.full_name.ilike(f'{value}%')), f'Requester: "{value}"'
 
-        case 'supported_by':
-            return stmt.join(model.supporter).where(
-                User.full_name.ilike(f'{value}%')), f'Supporter: "{value}"'
+def starts_with(column, value):
+    """Case-insensitive prefix match written as lower(column) LIKE 'value%' so a text_pattern_ops index can serve it."""
+    pattern = str(value).lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return sa.func.lower(column).like(f'{pattern}%', escape='\\')
 
-        case 'support_team':
-            return stmt.join(model.support_team).where(
-                Team.name.ilike(f'{value}%')), f'Team: "{value}"'
 
-        case 'ticket_number':
-            return stmt.filter(
-                sa.cast(model.ticket_number, sa.String).like(f'{value}%')), f'Ticket #: "{value}"'
+def ticket_number_starts_with(column, value):
+    """
+    Ticket numbers whose digits start with value, as integer ranges on the ticket_number index rather than a LIKE
+    over the number cast to text: '12' is 12, 120-129, 1200-1299 and so on.
+    """
+    prefix = str(value).strip()
+    if not (prefix.isascii() and prefix.isdigit()) or (prefix.startswith('0') and prefix != '0'):
+        return sa.false()
+
+    ranges = []
+    low, width = int(prefix), 1
+    while low <= MAX_TICKET_NUMBER:
+        ranges.append(column.between(low, min(low + width - 1, MAX_TICKET_NUMBER)))
+        if low == 0:
+            break
+        low, width = low * 10, width * 10
+    return sa.or_(*ranges) if ranges else sa.false()
+
+
+def vendor_starts_with(model, value):
+    vendors = sa.select(VendorLookup.id).where(starts_with(VendorLookup.vendor, value))
+    return sa.or_(model.vendor_sales_id.in_(vendors), model.vendor_support_id.in_(vendors))
+
+
+# Table filter fields: field -> (description, attribute the model must have, predicate for a model and value)
+FILTER_FIELDS = {
+    'article_type': ('Article type', 'article_type',
+                     lambda model, value: model.article_type.has(starts_with(KBATypesLookup.article_type, value))),
+    'author': ('Author', 'author', lambda model, value: model.author.has(starts_with(User.full_name, value))),
+    'email': ('Email', 'email', lambda model, value: starts_with(model.email, value)),
+    'full_name': ('Full name', 'full_name', lambda model, value: starts_with(model.full_name, value)),
+    'name': ('Name', 'name', lambda model, value: starts_with(model.name, value)),
+    'owned_by': ('Owner', 'owner', lambda model, value: model.owner.has(starts_with(User.full_name, value))),
+    'phone': ('Phone', 'phone', lambda model, value: starts_with(model.phone, value)),
+    'priority': ('Priority', 'priority', lambda model, value: model.priority == value),
+    'requested_by': ('Requester', 'requester',
+                     lambda model, value: model.requester.has(starts_with(User.full_name, value))),
+    'supported_by': ('Supporter', 'supporter',
+                     lambda model, value: model.supporter.has(starts_with(User.full_name, value))),
+    'support_team': ('Team', 'support_team',
+                     lambda model, value: model.support_team.has(starts_with(Team.name, value))),
+    'status': ('Status', 'status', lambda model, value: model.status == value),
+    'ticket_number': ('Ticket #', 'ticket_number',
+                      lambda model, value: ticket_number_starts_with(model.ticket_number, value)),
+    'ticket_type': ('Type', 'ticket_type', lambda model, value: model.ticket_type == value),
+    'vendor': ('Vendor', 'vendor_sales_id', vendor_starts_with),
+}
 
-        case 'phone':
-            return stmt.where(model.phone.ilike(f'{value}%')), f'Phone: "{value}"'
 
-        case 'name':
-            return stmt.where(model.name.ilike(f'{value}%')), f'Name: "{value}"'
+def apply_filters(model, stmt, filters):
+    """
+    Adds every Tabulator filter to stmt, combined with AND. Filters without a value are skipped.
 
-        case _:
-            return stmt, f'Unrecognized filter field: "{field}"'
+    Raises:
+        ValueError: if a field is not in FILTER_FIELDS or does not apply to the model, before anything is queried.
+    """
+    criteria = []
+    descriptions = []
+    for filter_by in filters:
+        field = str(filter_by.get('field') or '').strip().lower()
+        value = filter_by.get('value')
+
+        if field not in FILTER_FIELDS:
+            raise ValueError(f'Unrecognized filter field: "{field}"')
+        description, attribute, predicate = FILTER_FIELDS[field]
+        if not hasattr(model, attribute):
+            raise ValueError(f'{model.__name__} cannot be filtered by "{field}"')
+
+        if value is None or str(value).strip() == '':
+            continue
+        criteria.append(predicate(model, value))
+        descriptions.append(f'{description}: "{value}"')
+
+    if not criteria:
+        return stmt, 'No filters provided'
+    return stmt.where(sa.and_(*criteria)), ', '.join(descriptions)
 
 
-def create_ticket_response(ticket, model, user_timezone):
+def create_row_response(row, model, user_timezone, roles=None):
     """
-    Creates a dictionary response for a ticket based on its model. The response is used by table.js
-    The field names match the table column names defined there.
+    The dictionary table.js shows for a row selected with apply_table_projection. The field names match the table
+    column names defined there.
 
     Args:
-        ticket: The ticket object.
-        model: The model class of the ticket.
+        row: The projected row.
+        model: The model class the row is from.
         user_timezone: The user's timezone.
-
-    Returns:
-        A dictionary containing the ticket's information.
+        roles: For User rows, role names by user id.
     """
     response = {}
 
     # common fields for all models except User
-    if hasattr(ticket, 'ticket_number'):
+    if hasattr(model, 'ticket_number'):
         response.update({
-            'ticket_number': ticket.ticket_number,
-            'ticket_type': ticket.ticket_type,
-            'status': ticket.status,
-            'created': format_time(ticket.created_at, user_timezone),
+            'ticket_number': row.ticket_number,
+            'ticket_type': row.ticket_type,
+            'status': row.status,
+            'created': format_time(row.created_at, user_timezone),
         })
 
-    # Common fields for all models except Cmdb, KnowledgeBase, and User
-    if hasattr(ticket, 'get_requester_name'):
+    # Common fields for all models except KnowledgeBase and User
+    if hasattr(model, 'get_requester_name'):
         response.update({
-            'requested_by': ticket.get_requester_name(),
-            'shortDesc': ticket.short_desc
+            'requested_by': row.requester_name,
+            'shortDesc': row.short_desc
         })
 
     # Fields specific to Ticket and Problem models
-    if hasattr(ticket, 'priority'):
-        response['priority'] = ticket.priority
+    if hasattr(model, 'priority'):
+        response['priority'] = row.priority
 
     # Fields specific to Ticket, Problem, and Change models
-    if hasattr(ticket, 'get_supporter_name'):
-        response['supported_by'] = ticket.get_supporter_name() or 'Unassigned'
+    if hasattr(model, 'get_supporter_name'):
+        response['supported_by'] = row.supporter_name or 'Unassigned'
 
     if model == Ticket:
         response.update({
-            'respond_by': format_time(ticket.sla_respond_by, user_timezone) if ticket.sla_respond_by else None,
-            'resolve_by': format_time(ticket.sla_resolve_by, user_timezone) if ticket.sla_resolve_by else None,
-            'sla_response_breach': ticket.sla_response_breach,
-            'sla_resolve_breach': ticket.sla_resolve_breach,
-            'support_team': ticket.get_support_team_name() if ticket.support_team else None,
+            'respond_by': format_time(row.sla_respond_by, user_timezone) if row.sla_respond_by else None,
+            'resolve_by': format_time(row.sla_resolve_by, user_timezone) if row.sla_resolve_by else None,
+            'sla_response_breach': row.sla_response_breach,
+            'sla_resolve_breach': row.sla_resolve_breach,
+            'support_team': row.support_team_name,
         })
     elif model == Idea:
         response.update({
-            'likelihood': ticket.likelihood,
-            'votes': ticket.vote_count,
-            'score': ticket.vote_score,
-            'category': ticket.category.name if ticket.category else 'not specified',
+            'likelihood': row.likelihood,
+            'votes': row.vote_count,
+            'score': row.vote_score,
+            'category': row.category_name,
         })
     elif model == Change:
         response.update({
-            'cab_approval_status': ticket.cab_approval_status,
-            'change_type': ticket.change_type,
-            'risk': ticket.risk_set,
-            'start_date': ticket.start_date.strftime(g.date_format),
-            'start_at': ticket.start_time.strftime('%H:%M') if ticket.start_time else None,
-            'end_at': ticket.end_time.strftime('%H:%M') if ticket.end_time else None,
+            'cab_approval_status': row.cab_approval_status,
+            'change_type': row.change_type,
+            'risk': row.risk_set,
+            'start_date': row.start_date.strftime(g.date_format),
+            'start_at': row.start_time.strftime('%H:%M') if row.start_time else None,
+            'end_at': row.end_time.strftime('%H:%M') if row.end_time else None,
         })
     elif model == KnowledgeBase:
         response.update({
-            'author': ticket.get_author_name(),
-            'title': ticket.get_title(),
-            'article_category': ticket.category.name if ticket.category else 'not specified',
-            'article_type': ticket.get_article_type(),
-            'short_desc': ticket.short_desc,
-            'times_viewed': ticket.get_times_viewed(),
-            'times_useful': ticket.get_times_useful(),
+            'author': row.author_name,
+            'title': row.title or None,
+            'article_category': row.category_name,
+            'article_type': row.article_type_name,
+            'short_desc': row.short_desc,
+            'times_viewed': row.times_viewed or 0,
+            'times_useful': row.times_useful or 0,
         })
     elif model == User:
         response.update({
-            'id': ticket.id,
-            'full_name': ticket.full_name,
-            'occupation': ticket.occupation or 'not specified',
-            'last_login_at': ticket.last_login_at,
-            'current_login_ip': ticket.current_login_ip,
-            'phone': ticket.phone,
-            'email': ticket.email,
-            'department': ticket.get_department(),
-            'manager': ticket.manager.full_name if ticket.manager else 'not specified',
-            'team': ticket.team.name if ticket.team else 'not specified',
-            'active': ticket.active,
-            'role': [role.name for role in ticket.roles],
+            'id': row.id,
+            'full_name': row.full_name,
+            'occupation': row.occupation or 'not specified',
+            'last_login_at': row.last_login_at,
+            'current_login_ip': row.current_login_ip,
+            'phone': row.phone,
+            'email': row.email,
+            'department': row.department_name,
+            'manager': row.manager_name,
+            'team': row.team_name,
+            'active': row.active,
+            'role': roles.get(row.id, []) if roles else [],
         })
     elif model == CmdbConfigurationItem:
         response.update({
-            'name': ticket.name,
-            'category': ticket.category.name if ticket.category else 'not specified',
-            'ticket_type': ticket.ticket_type,
-            'owned_by': ticket.get_requester_name(),
-            'support_team': ticket.get_support_team(),
+            'name': row.name,
+            'category': row.category_name,
+            'ticket_type': row.ticket_type,
+            'owned_by': row.requester_name,
+            'support_team': row.support_team_name,
         })
     elif model == Release:
         response.update({
-            'release_type': ticket.release_type.release_type,
-            'support_team': ticket.get_support_team_name(),
-            'release_name': ticket.get_release_name()
+            'release_type': row.release_type_name,
+            'support_team': row.support_team_name,
+            'release_name': row.release_name if row.requester_id else None
         })
 
     return response
 
 
-def get_paginated_results(model, data, handle_params_func):
+def create_table_rows(rows, model, user_timezone):
+    """create_row_response for a page of rows. Role names for User rows are read for the whole page in one query."""
+    roles = {}
+    if model == User and rows:
+        role_rows = db.session.execute(
+            sa.select(user_roles.c.user_id, Role.name)
+            .join(Role, Role.id == user_roles.c.role_id)
+            .where(user_roles.c.user_id.in_([row.id for row in rows]))
+        ).all()
+        for user_id, name in role_rows:
+            roles.setdefault(user_id, []).append(name)
+
+    return [create_row_response(row, model, user_timezone, roles) for row in rows]
+
+
+# Records listed as children of each kind of parent: (child model, column holding the parent's id). Every child
+# table is read by get_child_rows in a single UNION ALL, so a page of children is one query whatever their kinds.
+CHILD_SOURCES = {
+    'Ticket': ((Ticket, 'parent_id'),),
+    'Problem': ((Ticket, 'problem_id'),),
+    'Change': ((Ticket, 'change_id'), (Problem, 'change_id'), (Release, 'change_id')),
+}
+_CHILD_NAMES = {
+    'requester_name': ('requester', 'full_name'),
+    'supporter_name': ('supporter', 'full_name'),
+    'support_team_name': ('support_team', 'name'),
+}
+
+
+def _child_select(model, parent_column, parent_id):
+    """The columns every child listing shows, selected from one child model. Missing fields are NULL."""
+    names = TABLE_PROJECTIONS[model]['names']
+    columns = [sa.literal(model.__name__).label('child_model')]
+    columns += [getattr(model, name) for name in _TICKET_COLUMNS]
+    columns.append(model.priority if hasattr(model, 'priority') else sa.cast(sa.null(), sa.String).label('priority'))
+
+    joins = []
+    for label, (relationship, column) in _CHILD_NAMES.items():
+        related = aliased(getattr(model, relationship).property.mapper.class_)
+        value = getattr(related, column)
+        default = names[label][2] if label in names else None
+        if default is not None:
+            value = sa.case((related.id.is_(None), default), else_=value)
+        columns.append(value.label(label))
+        joins.append(getattr(model, relationship).of_type(related))
+
+    stmt = sa.select(*columns).where(getattr(model, parent_column) == parent_id)
+    for join in joins:
+        stmt = stmt.outerjoin(join)
+    return stmt
+
+
+def get_child_rows(parent_type, parent_id, page, per_page):
     """
-    Generic function to handle paginated results and dynamic filtering for any model.
+    A page of the children of a parent record, of every kind in CHILD_SOURCES, in ticket number order. The children
+    are one UNION ALL with the kind of each row in child_model, paged once and counted in the same query by a window
+    function, so per_page holds across kinds and the total is that of every kind.
+
+    Args:
+        parent_type: Key of CHILD_SOURCES.
+        parent_id: Id of the parent record.
+        page: Page number, from 1.
+        per_page: Rows per page.
+
+    Returns:
+        dict: {'items': the rows, 'total': number of children}.
+    """
+    selects = [_child_select(model, column, parent_id) for model, column in CHILD_SOURCES[parent_type]]
+    children = (selects[0] if len(selects) == 1 else sa.union_all(*selects)).subquery('children')
+
+    page = max(page, 1)
+    rows = db.session.execute(
+        sa.select(children, sa.func.count().over().label('total'))
+        .order_by(children.c.ticket_number, children.c.child_model)
+        .limit(per_page)
+        .offset((page - 1) * per_page)
+    ).all()
+
+    if rows:
+        total = rows[0].total
+    elif page > 1:  # past the last page, there is no row to read the total from
+        total = db.session.scalar(sa.select(sa.func.count()).select_from(children))
+    else:
+        total = 0
+    return {'items': rows, 'total': total}
+
+
+def create_child_response(row, user_timezone):
+    """The child table dictionary for a row from get_child_rows."""
+    return {
+        'ticket_number': row.ticket_number,
+        'ticket_type': row.ticket_type,
+        'status': row.status,
+        'created': format_time(row.created_at, user_timezone),
+        'requested_by': row.requester_name,
+        'shortDesc': row.short_desc,
+        'priority': row.priority,
+        'supported_by': row.supporter_name or 'Unassigned',
+        'support_team': row.support_team_name,
+        'child_model': row.child_model,
+    }
+
+
+def keyset_columns(model):
+    """Columns results are ordered by in cursor paging mode, ending in a unique one so every row has its own key."""
+    if model == User:
+        return sa.func.coalesce(model.last_name, ''), model.id
+    return model.ticket_number, model.id
+
+
+def encode_cursor(values):
+    """Opaque cursor for the keyset values of the last row of a page."""
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor, key):
+    """
+    Keyset values from a cursor made by encode_cursor for the given keyset columns. Raises ValueError if the cursor
+    is not one, or does not hold one value of the right type for each column, so nothing else is ever compared.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (AttributeError, binascii.Error, UnicodeError, json.JSONDecodeError) as e:
+        raise ValueError(f'Invalid cursor: {cursor}') from e
+    if not isinstance(values, list) or len(values) != len(key):
+        raise ValueError(f'Invalid cursor: {cursor}')
+    for value, column in zip(values, key):
+        # bool is an int to isinstance, but never a key value
+        if isinstance(value, bool) or not isinstance(value, column.type.python_type):
+            raise ValueError(f'Invalid cursor: {cursor}')
+    return values
+
+
+def get_cursor_results(model, stmt, data, page, per_page):
+    """
+    Keyset (seek) paging: rows after the 'after' cursor in keyset_columns order, so any page costs the same as the
+    first. The exact total is only counted when 'exact_total' is set. A page requested without a cursor, for example
+    after jumping straight to it, falls back to an offset.
+
+    Returns:
+        dict of data rows, next_cursor (None on the last page), last_page and, if counted, last_row.
+    """
+    key = keyset_columns(model)
+    stmt = stmt.order_by(None).order_by(*key)
+
+    total = None
+    if data.get('exact_total'):
+        total, _ = count_rows(model, stmt)
+
+    after = data.get('after')
+    if after:
+        values = decode_cursor(after, key)
+        stmt = stmt.where(sa.tuple_(*key) > sa.tuple_(*values))
+    elif page > 1:
+        stmt = stmt.offset((page - 1) * per_page)
+
+    cursor_columns = [column.label(f'cursor_{index}') for index, column in enumerate(key)]
+    rows = db.session.execute(stmt.add_columns(*cursor_columns).limit(per_page + 1)).all()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    response = {
+        'items': rows,
+        'next_cursor': encode_cursor(list(rows[-1][-len(key):])) if has_more else None,
+        'last_page': page + 1 if has_more else page,
+    }
+    if total is not None:
+        response['last_row'] = total
+        response['total_exact'] = True
+    return response
+
+
+def get_offset_results(model, stmt, page, per_page, estimate=False):
+    """
+    Offset paging of plain rows, numbered the same way as db.paginate with error_out=False. The total comes from
+    count_rows, so it may be remembered from an earlier page or, with estimate, be the planner's estimate.
+    """
+    page = max(page, 1)
+    per_page = per_page if per_page >= 1 else 20
+
+    total, exact = count_rows(model, stmt, estimate=estimate)
+    rows = db.session.execute(stmt.limit(per_page).offset((page - 1) * per_page)).all()
+    return {
+        'items': rows,
+        'last_page': math.ceil(total / per_page) if total else 0,
+        'last_row': total,
+        'total_exact': exact,
+    }
+
+
+def build_table_statement(model, data, handle_params_func):
+    """
+    The select behind a table view: open records of the model in table order, narrowed by the request's scope,
+    params and filters. Shared by /get_paginated/ and the table export so both list the same rows.
 
     Args:
         model: SQLAlchemy model to stmt.
-        data: The request data containing parameters for pagination and filtering.
+        data: The request data containing the scope, params and filters.
         handle_params_func: Function to handle model-specific 'params' logic.
 
     Returns:
-        A paginated JSON response.
+        tuple: (stmt, filter_description).
+
+    Raises:
+        ValueError: A filter names a field the model cannot be filtered on.
     """
-    # data = request_data
-    page = data.get('page', 1)  # Default to page 1
-    per_page = data.get('size', current_app.config['ROWS_PER_PAGE'])
     scope = data.get('scope')
 
-    user_timezone = pytz.timezone(data.get('timezone', 'UTC'))  # Default to UTC if not provided
-
     # Handle model-specific params
     params = data.get('params')
     if model == User:
@@ -225,14 +568,86 @@ def get_paginated_results(model, data, handle_params_func):
     filters = data.get('filter', [])
     if filters:
         stmt, filter_description = apply_filters(model, stmt, filters)
+
+    return stmt, filter_description
+
+
+def iter_table_rows(model, stmt, user_timezone, batch_size):
+    """
+    create_row_response for every row stmt selects, read from a server side cursor batch_size rows at a time so
+    only one batch is held in memory however many rows there are.
+    """
+    result = db.session.execute(apply_table_projection(model, stmt).execution_options(yield_per=batch_size))
+    for rows in result.partitions():
+        yield from create_table_rows(rows, model, user_timezone)
+
+
+def get_paginated_results(model, data, handle_params_func):
+    """
+    Generic function to handle paginated results and dynamic filtering for any model.
+
+    With 'paging': 'cursor' in the request data rows are paged by keyset instead of by offset, see
+    get_cursor_results. Scopes with their own fixed ordering are always paged by offset. Only the columns in the
+    model's TABLE_PROJECTIONS are selected. Totals are remembered briefly between pages; for an unfiltered view of
+    a large table the total is estimated unless 'exact_total' is set, and total_exact in the response says which.
+
+    Responses carry an ETag from the versions of the model's records and of the records its rows take display names
+    from, see table_versions, which change with every committed write to them, so a client re-asking for a page it
+    already holds with If-None-Match gets an empty 304 without a query being run.
+
+    Args:
+        model: SQLAlchemy model to stmt.
+        data: The request data containing parameters for pagination and filtering.
+        handle_params_func: Function to handle model-specific 'params' logic.
+
+    Returns:
+        A paginated JSON response.
+    """
+    # data = request_data
+    page = data.get('page', 1)  # Default to page 1
+    per_page = data.get('size', current_app.config['ROWS_PER_PAGE'])
+    scope = data.get('scope')
+
+    user_timezone = pytz.timezone(data.get('timezone', 'UTC'))  # Default to UTC if not provided
+
+    try:
+        stmt, filter_description = build_table_statement(model, data, handle_params_func)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    etag = response_etag(table_versions(model), data)
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
+
+    stmt = apply_table_projection(model, stmt)
+    if data.get('paging') == 'cursor' and scope not in ('top', 'published'):
+        try:
+            results = get_cursor_results(model, stmt, data, page, per_page)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        response = {
+            'filter_description': filter_description,
+            'paging': 'cursor',
+            'next_cursor': results['next_cursor'],
+            'last_page': results['last_page'],
+            'data': create_table_rows(results['items'], model, user_timezone),
+        }
+        if 'last_row' in results:
+            response['last_row'] = results['last_row']
+            response['total_exact'] = results['total_exact']
+        return tag_response(jsonify(response), etag)
+
     # Paginate results
-    paginated_items = db.paginate(stmt, page=page, per_page=per_page, error_out=False)
-    items = paginated_items.items
+    unfiltered = not (scope or data.get('params') or data.get('filter'))
+    results = get_offset_results(model, stmt, page, per_page, estimate=unfiltered and not data.get('exact_total'))
     # Build response
     response = {
         'filter_description': filter_description,
-        'last_page': paginated_items.pages,
-        'last_row': paginated_items.total,
-        'data': [create_ticket_response(item, model, user_timezone) for item in items],
+        'last_page': results['last_page'],
+        'last_row': results['last_row'],
+        'total_exact': results['total_exact'],
+        'data': create_table_rows(results['items'], model, user_timezone),
     }
-    return jsonify(response)
+    return tag_response(jsonify(response), etag)
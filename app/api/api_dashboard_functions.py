@@ -1,5 +1,4 @@
-from collections import Counter
-from flask import request, jsonify
+from flask import current_app, request, jsonify
 from flask_security import login_required
 import sqlalchemy as sa
 from . import api_bp
@@ -9,8 +8,10 @@ from ..model.model_knowledge import KnowledgeBase
 from ..model.model_interaction import Ticket
 from ..model.model_problem import Problem
 from ..model.model_release import Release
+from ..model.model_reporting import DashboardCounter
 from ..model.model_user import Team
 from ..common.common_utils import get_model
+from ..common.dashboard_cache import cached_counts
 from ..model.common_methods import get_priority_counts, get_status_counts, get_ticket_type_count
 
 @api_bp.post('/get-open-tickets-priority-count/')
@@ -21,8 +22,6 @@ def get_open_tickets_priority_count():
     return: dict of ticket_types with a count
     """
     data = request.get_json(silent=True) or {}
-    if data is None:
-        return jsonify({'error': 'Invalid JSON data or incorrect Content-Type header'}), 400
 
     scope = data.get('scope')
     ticket_type = data.get('ticket_type')
@@ -32,15 +31,13 @@ def get_open_tickets_priority_count():
     else:
         model = get_model(data.get('model'))
 
+    if not model:
+        return jsonify({'error': 'Invalid model'}), 400
+
     if model == Change:
-        counts_dict = Change.change_risk_count(ticket_type, scope)
-    elif model == Problem:
-        known_error_dict = get_priority_counts(model, 'Known Error', scope)
-        workaround_dict = get_priority_counts(model, 'Workaround', scope)
-        problems_dict = get_priority_counts(model, 'Problem', scope)
-        counts_dict = dict(Counter(known_error_dict) + Counter(workaround_dict) + Counter(problems_dict))
+        counts_dict = cached_counts(model, scope, ticket_type, lambda: Change.change_risk_count(ticket_type, scope))
     else:
-        counts_dict = get_priority_counts(model, ticket_type, scope)
+        counts_dict = cached_counts(model, scope, ticket_type, lambda: get_priority_counts(model, ticket_type, scope))
 
     return counts_dict
 
@@ -53,8 +50,10 @@ def get_open_tickets_category_count():
         return jsonify({'error': 'Invalid JSON data or incorrect Content-Type header'}), 400
 
     model = get_model(data.get('model'))
+    if not model:
+        return jsonify({'error': 'Invalid model'}), 400
 
-    counts_dict = model.tickets_category_count()
+    counts_dict = cached_counts(model, None, None, model.tickets_category_count)
     return counts_dict
 
 
@@ -64,23 +63,23 @@ def get_open_by_type_count():
     data = request.get_json(silent=True)
     if data is None:
         return jsonify({'error': 'Invalid JSON data or incorrect Content-Type header'}), 400
-    print(data)
     model = get_model(data.get('model'))
     scope = data.get('scope')
-    counts_dict = {}
-
-    if model in [Ticket, Problem]:
-        counts_dict = get_ticket_type_count(model, scope)
-
-    elif model == Change:
-        counts_dict = Change.change_type_count(scope)
-
-    elif model == KnowledgeBase:
-        counts_dict = KnowledgeBase.article_type_count(scope)
-
-    elif model == Release:
-        counts_dict = Release.release_type_count(scope)
-
+    if not model:
+        return jsonify({'error': 'Invalid model'}), 400
+
+    def count():
+        if model in [Ticket, Problem]:
+            return get_ticket_type_count(model, scope)
+        elif model == Change:
+            return Change.change_type_count(scope)
+        elif model == KnowledgeBase:
+            return KnowledgeBase.article_type_count(scope)
+        elif model == Release:
+            return Release.release_type_count(scope)
+        return {}
+
+    counts_dict = cached_counts(model, scope, None, count)
     return counts_dict
 
 
@@ -93,8 +92,10 @@ def get_open_ticket_status_count():
 
     scope = data.get('scope')
     model = get_model(data.get('model'))
+    if not model:
+        return jsonify({'error': 'Invalid model'}), 400
 
-    counts_dict = get_status_counts(model, scope)
+    counts_dict = cached_counts(model, scope, None, lambda: get_status_counts(model, scope))
 
     return counts_dict
 
@@ -106,63 +107,54 @@ def get_team_load():
     if not data:
         return jsonify({'error': 'Invalid JSON data or incorrect Content-Type header'}), 400
 
-    load = {}
-
-    # Get all teams
-    all_teams = db.session.scalars(
-        sa.select(Team.name)
-    ).all()
+    # One row per team, then rows of open work per team, all from one UNION ALL. The work is read from the dashboard
+    # counters, or else from each source table once with its kinds of work as conditional counts
+    zero = sa.literal(0)
+    no_name = sa.cast(sa.null(), sa.String)
+    if current_app.config.get('DASHBOARD_COUNTERS', True):
+        counter = DashboardCounter
+
+        def counted(*conditions):
+            return sa.func.coalesce(sa.func.sum(counter.count).filter(*conditions), 0)
+
+        work = [
+            sa.select(counter.support_team_id, no_name,
+                      counted(counter.model == Ticket.__tablename__, counter.ticket_type == 'Incident',
+                              counter.status != 'closed'),
+                      counted(counter.model == Ticket.__tablename__, counter.ticket_type == 'Request',
+                              counter.status != 'closed'),
+                      counted(counter.model == Change.__tablename__, counter.status.in_(['cab', 'implement'])),
+                      counted(counter.model == Problem.__tablename__, counter.status != 'closed'))
+            .group_by(counter.support_team_id)
+        ]
+    else:
+        work = [
+            sa.select(Ticket.support_team_id, no_name,
+                      sa.func.count().filter(Ticket.ticket_type == 'Incident'),
+                      sa.func.count().filter(Ticket.ticket_type == 'Request'),
+                      zero, zero)
+            .where(Ticket.status != 'closed')
+            .group_by(Ticket.support_team_id),
+            sa.select(Change.support_team_id, no_name, zero, zero, sa.func.count(), zero)
+            .where(sa.or_(Change.status == 'cab', Change.status == 'implement'))
+            .group_by(Change.support_team_id),
+            sa.select(Problem.support_team_id, no_name, zero, zero, zero, sa.func.count())
+            .where(Problem.status != 'closed')
+            .group_by(Problem.support_team_id),
+        ]
+    rows = db.session.execute(sa.union_all(sa.select(Team.id, Team.name, zero, zero, zero, zero), *work)).all()
+
+    team_names = {team_id: name for team_id, name, *_ in rows if name is not None}
 
     # Initialize the load dictionary with empty counts
-    for team_name in all_teams:
-        load[team_name] = {
-            'incidents': 0,
-            'requests': 0,
-            'changes': 0,
-            'problems': 0
-        }
-
-    # Get incidents count per team
-    incidents = db.session.execute(
-        sa.select(Team.name, sa.func.count(Ticket.id))
-        .join(Ticket, Team.id == Ticket.support_team_id)
-        .where(sa.and_(Ticket.status != 'closed', Ticket.ticket_type == 'Incident'))
-        .group_by(Team.name)
-    ).all()
-
-    for team_name, count in incidents:
-        load[team_name]['incidents'] = count
-
-    # Get requests count per team
-    requests = db.session.execute(
-        sa.select(Team.name, sa.func.count(Ticket.id))
-        .join(Ticket, Team.id == Ticket.support_team_id)
-        .where(sa.and_(Ticket.status != 'closed', Ticket.ticket_type == 'Request'))
-        .group_by(Team.name)
-    ).all()
-
-    for team_name, count in requests:
-        load[team_name]['requests'] = count
-
-    # Get changes count per team
-    changes = db.session.execute(
-        sa.select(Team.name, sa.func.count(Change.id))
-        .join(Change, Team.id == Change.support_team_id)
-        .where(sa.or_(Change.status == 'cab', Change.status == 'implement'))
-        .group_by(Team.name)
-    ).all()
-
-    for team_name, count in changes:
-        load[team_name]['changes'] = count
-
-    # Get problems count per team
-    problems = db.session.execute(
-        sa.select(Team.name, sa.func.count(Problem.id))
-        .join(Problem, Team.id == Problem.support_team_id)
-        .group_by(Team.name)
-    ).all()
-
-    for team_name, count in problems:
-        load[team_name]['problems'] = count
-
-    return jsonify(load), 200
\ No newline at end of file
+    load = {name: {'incidents': 0, 'requests': 0, 'changes': 0, 'problems': 0} for name in team_names.values()}
+
+    for team_id, name, incidents, requests, changes, problems in rows:
+        if name is None and team_id in team_names:
+            team_load = load[team_names[team_id]]
+            team_load['incidents'] += incidents
+            team_load['requests'] += requests
+            team_load['changes'] += changes
+            team_load['problems'] += problems
+
+    return jsonify(load), 200
@@ -1,6 +1,7 @@
 import os
 from collections import Counter
 from datetime import datetime, timedelta, timezone
+import itertools
 import json
 from unittest.mock import DEFAULT
 
@@ -10,8 +11,10 @@ from flask import (
     request,
     jsonify,
     current_app,
+    Response,
     session,
     render_template,
+    stream_with_context,
     url_for
 )
 from flask_mailing import Mail, Message
@@ -19,9 +22,11 @@ from flask_security import current_user, login_required
 from jinja2.filters import Markup
 import sqlalchemy as sa
 from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.utils import secure_filename
 
 from . import api_bp
-from .api_common import apply_filters, create_ticket_response, get_paginated_results
+from .api_common import (apply_filters, build_table_statement, create_child_response, get_child_rows,
+                         get_paginated_results, iter_table_rows)
 from .api_cmdb_functions import handle_cmdb_params
 from .api_idea_functions import handle_idea_params
 from .api_incident_problem_functions import handle_interaction_params
@@ -38,15 +43,16 @@ from ..model.model_interaction import Ticket
 from ..model.model_notes import Notes
 from ..model.model_portal import PortalAnnouncements
 from ..model.model_problem import Problem
-from ..model.model_release import Release
 from ..model.model_user import Department, User
 from ..model.lookup_tables import (
-    OfficeHours,
     PriorityLookup,
     VendorLookup, ResolutionLookup,
 )
 
-from ..common.sla import calculate_sla_times
+from ..common.table_export import EXPORT_FORMATS, csv_stream, xlsx_stream
+from ..common.sla import calculate_sla_times, get_sla_policy
+from ..common.sla_compliance import settle_status_change
+from ..common.sla_scheduler import breach_scheduler
 from ..common.common_utils import (
     get_highest_ticket_number,
     my_teams,
@@ -208,88 +214,25 @@ def get_children():
 
     parent_model = get_model(parent_type)  # in common_utils
 
-    ticket_data = []
-    problem_data = []
-    release_data = []
-    total_tickets = 0
-    total_problems = 0
-    total_releases = 0
-
-    parent_ticket = db.session.execute(
-        sa.select(parent_model)
+    parent_id = db.session.execute(
+        sa.select(parent_model.id)
         .where(parent_model.ticket_number == parent_ticket_number)
     ).scalar_one_or_none()
 
-    if parent_ticket is None:
+    if parent_id is None:
         return jsonify({'error': f'{parent_type} {parent_ticket_number} not found'}), 404
 
     # Handle tickets based on parent type
     if parent_type in ['Incident', 'Request', 'Ticket']:
-        stmt = (
-            sa.select(Ticket)
-            .where(Ticket.parent_id == parent_ticket.id)
-            .order_by(Ticket.ticket_number)
-        )
-
-        paginated_tickets = db.paginate(stmt, page=page, per_page=per_page, error_out=False)
-        tickets = paginated_tickets.items
-        ticket_data = [create_ticket_response(ticket, Ticket, user_timezone) for ticket in tickets]
-        total_tickets = paginated_tickets.total
-
+        children = get_child_rows('Ticket', parent_id, page, per_page)
     elif parent_type in ['Problem', 'Known Error', 'Workaround']:
-        stmt = (
-            sa.select(Ticket)
-            .where(Ticket.problem_id == parent_ticket.id)
-            .order_by(Ticket.ticket_number)
-        )
-
-        paginated_tickets = db.paginate(stmt, page=page, per_page=per_page, error_out=False)
-        tickets = paginated_tickets.items
-        ticket_data = [create_ticket_response(ticket, Ticket, user_timezone) for ticket in tickets]
-        total_tickets = paginated_tickets.total
-
+        children = get_child_rows('Problem', parent_id, page, per_page)
     elif parent_type in ['Change']:
-        # Get ticket children for Change
-        ticket_stmt = (
-            sa.select(Ticket)
-            .where(Ticket.change_id == parent_ticket.id)
-            .order_by(Ticket.ticket_number)
-        )
-
-        paginated_tickets = db.paginate(ticket_stmt, page=page, per_page=per_page, error_out=False)
-        tickets = paginated_tickets.items
-        ticket_data = [create_ticket_response(ticket, Ticket, user_timezone) for ticket in tickets]
-        total_tickets = paginated_tickets.total
-
-        # Get problem children for Change
-        problem_stmt = (
-            sa.select(Problem)
-            .where(Problem.change_id == parent_ticket.id)
-            .order_by(Problem.ticket_number)
-        )
-
-        paginated_problems = db.paginate(problem_stmt, page=page, per_page=per_page, error_out=False)
-        problems = paginated_problems.items
-        problem_data = [create_ticket_response(problem, Problem, user_timezone) for problem in problems]
-        total_problems = paginated_problems.total
-
-        # Get release children for Change
-        release_stmt = (
-            sa.select(Release)
-            .where(Release.change_id == parent_ticket.id)
-            .order_by(Release.ticket_number)
-        )
-
-        paginated_releases = db.paginate(release_stmt, page=page, per_page=per_page, error_out=False)
-        releases = paginated_releases.items
-        release_data = [create_ticket_response(release, Release, user_timezone) for release in releases]
-        total_releases = paginated_releases.total
-
-    # Calculate the total count of all children
-    total = total_tickets + total_problems + total_releases
-
-    # Combine all child data
-    all_data = ticket_data + problem_data + release_data
+        children = get_child_rows('Change', parent_id, page, per_page)
+    else:
+        children = {'items': [], 'total': 0}
+
+    total = children['total']
 
     # Determine the last page based on total results and per_page
     last_page = (total + per_page - 1) // per_page if per_page > 0 else 1
@@ -297,7 +240,7 @@ def get_children():
     response = {
         'total': total,
         'last_page': last_page,
-        'data': all_data
+        'data': [create_child_response(row, user_timezone) for row in children['items']]
     }
     return jsonify(response), 200
 
@@ -422,30 +365,85 @@ def get_paginated():
     model_txt = data.get('model')
     model = get_model(model_txt)
 
-    # Determine the Ticket-specific params handler
-    handle_params_func = None
-    match model_txt.lower():
+    handle_params_func = get_params_handler(model_txt)
+    if handle_params_func is None:
+        return {'error': 'Invalid model type provided'}, 400
+
+    # Pass the Ticket model, corresponding data, and the Ticket-specific params handler
+    return get_paginated_results(model, data, handle_params_func)
+
+
+def get_params_handler(model_txt):
+    """The model specific 'params' handler for a table's model name, None if the name is not a table model."""
+    match (model_txt or '').lower():
         case 'change':
-            handle_params_func = handle_change_params
+            return handle_change_params
         case 'cmdb':
-            handle_params_func = handle_cmdb_params
+            return handle_cmdb_params
         case 'idea':
-            handle_params_func = handle_idea_params
+            return handle_idea_params
         case 'interaction' | 'problem':
-            handle_params_func = handle_interaction_params
+            return handle_interaction_params
         case 'knowledge':
-            handle_params_func = handle_knowledge_params
+            return handle_knowledge_params
         case 'release':
-            handle_params_func = handle_release_params
+            return handle_release_params
         case 'users':
-            handle_params_func = handle_user_params
+            return handle_user_params
+    return None
 
-            # Check if a handler was found for the model
+
+@api_bp.post('/export-table/')
+@login_required
+def export_table():
+    """
+    Streams every row of a table view as a CSV or XLSX file. Takes the same body as /get_paginated/, with
+    'format', an optional 'filename' and 'columns', the table's visible columns as a list of {field, title} in
+    display order, and lists the same rows, read from the database EXPORT_BATCH_ROWS at a time and written out as
+    they arrive so the worker's memory does not grow with the size of the table. Without 'columns' every field of
+    the rows is written under its own name.
+    """
+    data = request.get_json(silent=True) or {}
+    model_txt = data.get('model')
+    handle_params_func = get_params_handler(model_txt)
     if handle_params_func is None:
-        return {'error': 'Invalid model type provided'}, 400
+        return jsonify({'error': 'Invalid model type provided'}), 400
 
-    # Pass the Ticket model, corresponding data, and the Ticket-specific params handler
-    return get_paginated_results(model, data, handle_params_func)
+    export_format = data.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'error': f'Export format must be one of {", ".join(EXPORT_FORMATS)}'}), 400
+
+    columns = data.get('columns')
+    if columns is not None and not (
+            isinstance(columns, list)
+            and all(isinstance(column, dict) and isinstance(column.get('field'), str) for column in columns)):
+        return jsonify({'error': 'Columns must be a list of {field, title}'}), 400
+
+    model = get_model(model_txt)
+    try:
+        stmt, _ = build_table_statement(model, data, handle_params_func)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    user_timezone = pytz.timezone(data.get('timezone', 'UTC'))
+    responses = iter_table_rows(model, stmt, user_timezone, current_app.config['EXPORT_BATCH_ROWS'])
+    first = next(responses, None)  # runs the query here, so a failure is an error response rather than a cut off file
+    if columns is None:
+        fields = list(first) if first else []
+        header = fields
+    else:
+        fields = [column['field'] for column in columns]
+        header = [column.get('title') or column['field'] for column in columns]
+    rows = ([response.get(field) for field in fields]
+            for response in itertools.chain((first,) if first else (), responses))
+    stream = csv_stream(header, rows) if export_format == 'csv' else xlsx_stream(header, rows, model_txt.title())
+
+    filename = secure_filename(data.get('filename') or model_txt) or 'export'
+    return Response(
+        stream_with_context(stream),
+        mimetype=EXPORT_FORMATS[export_format],
+        headers={'Content-Disposition': f'attachment; filename="{filename}.{export_format}"'}
+    )
 
 
 @api_bp.post('/get-worknotes/')
@@ -608,12 +606,17 @@ def update_status():
 
                 for child in children:
                     child.status = ticket.status
+                    settle_status_change(child)
+
+            settle_status_change(ticket)
 
         if ticket.status in ['cab']:
             ticket.cab_ready = True  # setting here because it is possible to check it and move status to cab without saving
 
         try:
             db.session.commit()
+            if isinstance(ticket, Ticket):
+                breach_scheduler.track(ticket)
             return jsonify({'success': 'Ticket status updated'}), 200
         except SQLAlchemyError as e:
             log_exception(f'Database error: {e}')
@@ -684,13 +687,20 @@ def save_resolution():
         'Idea': 'adopting'
     }.get(ticket_type, 'resolved')
 
+    if isinstance(ticket, Ticket):
+        settle_status_change(ticket, ticket.resolved_at)
+
     children = get_child_tickets(model, ticket_number)  # fuction in this file
     if children:
         for child in children:
             child.status = ticket.status
+            if isinstance(child, Ticket):
+                settle_status_change(child, ticket.resolved_at)
 
     try:
         db.session.commit()
+        if isinstance(ticket, Ticket):
+            breach_scheduler.track(ticket)
         return jsonify({'success': 'Resolution saved successfully', 'resolution': ticket.resolution_journal}), 200
     except SQLAlchemyError as e:
         db.session.rollback()
@@ -729,19 +739,8 @@ def get_active_announcements():
 @login_required
 def get_business_hours():
     try:
-        location_id = current_user.location.id
-        # Allow for multiple locations. Defaults to 1 if not set. Regionalisation not fully implemented though
-        if not location_id:
-            location_id = 1
-
-        # Fetch business hours
-        business_hours = db.session.execute(
-            sa.select(OfficeHours)
-            .where(OfficeHours.id == location_id)
-        ).scalars().one_or_none()
-
-        if not business_hours:
-            return jsonify({'error': 'Business hours not found'}), 404
+        # cached office hours of the user's location, or of the default location if not set
+        business_hours = get_sla_policy(current_user.location_id)
 
         # Format response
         response = {
@@ -888,7 +887,11 @@ def update_table_row():
 
     try:
         ticket.last_updated_at = datetime.now(timezone.utc)
+        if isinstance(ticket, Ticket):
+            settle_status_change(ticket)
         db.session.commit()
+        if isinstance(ticket, Ticket):
+            breach_scheduler.track(ticket)
         return jsonify(), 200
     except SQLAlchemyError as e:
         log_exception(f'Database error: {e}')
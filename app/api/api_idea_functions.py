@@ -6,11 +6,10 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload
 
 from ..common.exception_handler import log_exception
+from ..common.filter_vocabulary import resolve_filter_name
 from ..model import db
-from ..model.model_category import Category
 from ..model.model_idea import Idea
 from ..model.model_user import User
-from ..model.lookup_tables import LikelihoodLookup, StatusLookup
 from . import api_bp
 
 
@@ -21,29 +20,15 @@ def handle_idea_params(stmt, params):
     p_name = params['name']
     p_name = p_name.replace('\n', ' ')
 
-    categories = [category.name for category in db.session.execute(sa.select(Category)).scalars()]
+    kind, ids = resolve_filter_name(p_name, 'category', 'likelihood', 'status')
 
-    likelihoods = [
-        likelihood.likelihood for likelihood in
-        db.session.execute(
-            sa.select(LikelihoodLookup)
-        ).scalars()
-    ]
+    if kind == 'category':
+        return stmt.where(Idea.category_id.in_(ids)), f"By category {p_name}"
 
-    statuses = [
-        status.status for status in
-        db.session.execute(
-            sa.select(StatusLookup)
-        ).scalars()
-    ]
-
-    if p_name in categories:
-        return stmt.where(Idea.category.has(Category.name == p_name)), f"By category {p_name}"
-
-    elif p_name in likelihoods:
+    elif kind == 'likelihood':
         return stmt.where(Idea.likelihood == p_name) , f"By likelihood '{p_name}'"
 
-    elif p_name in statuses:
+    elif kind == 'status':
         return stmt.where(Idea.status == p_name), f"By status {p_name}"
 
     else:
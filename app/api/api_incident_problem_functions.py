@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 
 from flask import request, jsonify, g
-from flask_login import login_required
+from flask_login import current_user, login_required
 
 import sqlalchemy as sa
 from sqlalchemy.exc import SQLAlchemyError
@@ -11,44 +11,33 @@ from . import api_bp
 from ..common.BusinessHours import BusinessHoursCalculator
 from ..common.common_utils import my_teams_dashboard
 from ..common.exception_handler import log_exception
+from ..common.filter_vocabulary import resolve_filter_name
+from ..common.sla import get_sla_policy
 
 from ..model import db
 from ..model.model_cmdb import CmdbConfigurationItem
 from ..model.model_interaction import Ticket, TicketTemplate
 from ..model.model_problem import Problem
-from ..model.lookup_tables import PriorityLookup, StatusLookup, OfficeHours
+from ..model.lookup_tables import PriorityLookup
 
 
 def handle_interaction_params(stmt, params):
     """
     Handles filtering for the Ticket model based on 'params'.
     """
-    # Fetch priorities, statuses, and teams as sets
     p_name = params['name']
     p_name = p_name.replace('\n', ' ')
 
     p_ticket_type = params['ticket_type']
-    
-    priorities = {
-        priority.priority
-        for priority in db.session.execute(
-            sa.select(PriorityLookup)
-        ).scalars()
-    }
 
-    statuses = [
-        status.status for status in
-        db.session.execute(
-            sa.select(StatusLookup)
-        ).scalars()
-    ]
+    kind, _ = resolve_filter_name(p_name, 'priority', 'status')
 
     # Apply filtering based on params
     interactions = {'Incident', 'Request'}
     problems = {'Problem', 'Known Error', 'Workaround'}
     
     if p_ticket_type in ['Interaction']:
-        if p_name in statuses:
+        if kind == 'status':
             return (stmt.where(Ticket.status == p_name), 
                     f'By status {p_name}')
         elif p_name in interactions:
@@ -59,21 +48,21 @@ def handle_interaction_params(stmt, params):
                     f'By type {p_name}')
 
     elif p_ticket_type in interactions:
-        if p_name in priorities:
+        if kind == 'priority':
             return (stmt.where(sa.and_(Ticket.priority == p_name, Ticket.ticket_type == p_ticket_type)), 
                     f'By priority {p_name}')
         elif p_name in ['All']:
             return (stmt.where(sa.and_(Ticket.ticket_type == p_ticket_type)), 
                     f'By type {p_name}')
-        elif p_name in statuses:
+        elif kind == 'status':
             return (stmt.where(Ticket.status == p_name), 
                     f'By status {p_name}')
 
     elif p_ticket_type in problems:
-        if p_name in priorities:
+        if kind == 'priority':
             return (stmt.where(Problem.priority == p_name), 
                     f'By priority {p_name}')
-        elif p_name in statuses:
+        elif kind == 'status':
             return (stmt.where(Problem.status == p_name), 
                     f'By status {p_name}')
         elif p_name in ['All']:
@@ -245,13 +234,7 @@ def outage_calc():
             log_exception(f'Invalid priority value')
             return jsonify({'error': 'Invalid priority value'}), 400
 
-        office_hours = db.session.execute(
-            sa.select(OfficeHours)
-        ).scalars().one_or_none()
-
-        if not office_hours:
-            log_exception(f'Office hours configuration not found')
-            return jsonify({'error': 'Office hours configuration not found'}), 500
+        office_hours = get_sla_policy(current_user.location_id)  # cached office hours of the user's location
 
         if priority.twentyfour_seven:
             open_time = '00:00'
@@ -265,9 +248,11 @@ def outage_calc():
         country_code = office_hours.country_code
         time_zone = office_hours.timezone
         state = office_hours.state
+        province = office_hours.province
 
         # Calculate SLA outage time
-        outage_time = BusinessHoursCalculator(outage_start, outage_end, business_hours, country_code, time_zone, state)
+        outage_time = BusinessHoursCalculator(outage_start, outage_end, business_hours, country_code, time_zone, state,
+                                              province)
         sla_minutes = outage_time.get_minutes()
         sla_time = f'{round(sla_minutes) // 60:02d}:{round(sla_minutes) % 60:02d}'
 
@@ -8,12 +8,14 @@ from sqlalchemy.exc import SQLAlchemyError
 from . import api_bp
 from ..common.common_utils import get_highest_ticket_number
 from ..common.exception_handler import log_exception
+from ..common.filter_vocabulary import resolve_filter_name
 from ..common.sla import calculate_sla_times
+from ..common.sla_ledger import settle_sla_ledger
+from ..common.sla_scheduler import breach_scheduler
 from ..model import db
 from ..model.model_category import Subcategory, Category
 from ..model.model_interaction import Ticket, Source
 from ..model.model_knowledge import KnowledgeBase
-from ..model.lookup_tables import KBATypesLookup, StatusLookup
 from ..model.model_user import Team
 
 
@@ -59,48 +61,27 @@ def handle_knowledge_params(stmt, params):
     # p_status = params['status']
     p_filter = params['filter']
 
-    knowledge_types = [
-        kba_type.article_type for kba_type in
-        db.session.execute(
-            sa.select(KBATypesLookup)
-        ).scalars().all()
-    ]
-
     knowledge_usefulness = ['useful', 'useless']
 
-    statuses = [
-        status.status for status in
-        db.session.execute(
-            sa.select(StatusLookup)
-        ).scalars()
-    ]
-
-    ticket_numbers = [
-        str(ticket.ticket_number) for ticket in
-        db.session.execute(
-            sa.select(KnowledgeBase)
-            .where(sa.and_(KnowledgeBase.status != 'archived', KnowledgeBase.times_viewed > 0))
-        ).scalars()
-    ]
-
-    # if p_status in statuses:
-    #     stmt = stmt.where(KnowledgeBase.status == p_status)
+    filter_kind, filter_ids = resolve_filter_name(p_filter, 'kb_type')
+    if filter_kind:
+        stmt = stmt.where(KnowledgeBase.article_type_id.in_(filter_ids))
 
-    if p_filter in knowledge_types:
-        stmt = stmt.where(KnowledgeBase.article_type.has(KBATypesLookup.article_type == p_filter))
+    kind, ids = resolve_filter_name(p_name, 'kb_type', 'status')
 
-    if p_name in knowledge_types:
-        return stmt.where(
-            KnowledgeBase.article_type.has(KBATypesLookup.article_type == p_name)), f"KBA of type '{p_name}'"
+    if kind == 'kb_type':
+        return stmt.where(KnowledgeBase.article_type_id.in_(ids)), f"KBA of type '{p_name}'"
 
     elif p_name in knowledge_usefulness:
         return stmt.where(KnowledgeBase.times_useful > 0), f"KBA with useful feedback"
 
-    elif p_name in statuses:
+    elif kind == 'status':
         return stmt.where(KnowledgeBase.status == p_name), f"KBA with status '{p_name}'"
 
-    elif p_name in ticket_numbers:
-        return stmt.where(KnowledgeBase.ticket_number == int(p_name)), f"KBA with ticket number '{p_name}'"
+    elif p_name.isdigit():  # a bar of the most viewed chart
+        return stmt.where(sa.and_(KnowledgeBase.ticket_number == int(p_name),
+                                  KnowledgeBase.status != 'archived',
+                                  KnowledgeBase.times_viewed > 0)), f"KBA with ticket number '{p_name}'"
 
     else:
         return stmt, 'No filtering applied'
@@ -266,13 +247,15 @@ def post_kba_improvement():
         ticket.status = "new"
 
         # Calculate SLA times
-        ticket.sla_resolve_by, ticket.sla_respond_by = calculate_sla_times(
+        ticket.sla_respond_by, ticket.sla_resolve_by = calculate_sla_times(
             ticket.created_at, ticket.priority
         )
 
         # Save to the database
         db.session.add(ticket)
+        settle_sla_ledger(ticket, ticket.created_at)  # starts the SLA clock
         db.session.commit()
+        breach_scheduler.track(ticket)
         return jsonify({"message": "Ticket created successfully", "ticket_id": ticket.id}), 200
 
     except ValueError as e:
@@ -9,10 +9,13 @@ from sqlalchemy.orm import joinedload
 
 from . import api_bp
 from ..model import db
-from ..model.lookup_tables import AppDefaults, ModelLookup, StatusLookup
+from ..model.lookup_tables import AppDefaults, ModelLookup, OfficeHours, PriorityLookup, StatusLookup
 from ..model.model_category import Category
 from ..common.common_utils import get_model
 from ..common.exception_handler import log_exception
+from ..common.filter_vocabulary import invalidate_filter_vocabulary
+from ..common.response_versions import not_modified, read_versions, response_etag, table_version, tag_response
+from ..common.sla import invalidate_sla_policies
 from ..model.relationship_tables import category_model, status_model
 
 
@@ -65,6 +68,14 @@ def get_lookup_records():
                 return jsonify({'error': f"Field '{field_filter}' not found in '{model_name}'"}), 400
             stmt = stmt.where(column == filter_value)
 
+    tables = [model.__table__]
+    if model == Category and filter_by:
+        tables += [category_model, ModelLookup.__table__]
+    etag = response_etag(read_versions(*[table_version(table) for table in tables]), data)
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
+
     results = db.session.execute(stmt).scalars().all()
 
     # need this to convert time objects to strings as time objects are not JSON serialisable
@@ -78,7 +89,7 @@ def get_lookup_records():
         for record in results
     ]
 
-    return jsonify({'data': result_list})
+    return tag_response(jsonify({'data': result_list}), etag)
 
 
 @api_bp.post('/lookup/get_status_lookup/')
@@ -88,6 +99,12 @@ def get_status_lookup():
     if data is None:
         return jsonify({'error': 'Invalid JSON data or incorrect Content-Type header'}), 400
 
+    etag = response_etag(read_versions(*[table_version(table) for table in (StatusLookup.__table__, status_model,
+                                                                             ModelLookup.__table__)]))
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
+
     statuses_with_models = db.session.execute(
         sa.select(StatusLookup)
         .options(joinedload(StatusLookup.models))
@@ -114,7 +131,7 @@ def get_status_lookup():
                     "comment": status.comment
                 })
 
-    return jsonify(data=tabulator_data)
+    return tag_response(jsonify(data=tabulator_data), etag)
 
 
 @api_bp.post('/lookup/set-table-row/')
@@ -152,6 +169,9 @@ def set_table_row():
         # Add the record to the session only if it's new
         db.session.merge(record)
         db.session.commit()
+        if model in (OfficeHours, PriorityLookup):
+            invalidate_sla_policies()  # cached per location policies hold the old office hours and targets
+        invalidate_filter_vocabulary()  # the record may be one of the names dashboard charts filter by
         return jsonify({'success': 'Record updated successfully'}), 200
     except SQLAlchemyError as e:
         db.session.rollback()
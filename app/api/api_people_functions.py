@@ -8,6 +8,7 @@ import sqlalchemy as sa
 from io import StringIO
 from . import api_bp
 from ..common.exception_handler import log_exception
+from ..common.filter_vocabulary import resolve_filter_name
 from ..model import db
 
 from ..common.fs_uniquifier import backfill_fs_uniquifier
@@ -22,43 +23,19 @@ def handle_user_params(stmt, params):
     p_name = params['name']
     p_name = p_name.replace('\n', ' ')
 
-    teams = {
-        team.name for team in
-        db.session.execute(
-            sa.select(Team)
-        ).scalars()
-    }
-
-    departments = {
-        department.name for department in
-        db.session.execute(
-            sa.select(Department)
-        ).scalars()
-    }
-    account_status = {'active', 'inactive'}
+    kind, ids = resolve_filter_name(p_name, 'team', 'department')
 
-    if p_name in teams:
-        team = db.session.execute(
-            sa.select(Team)
-            .where(sa.and_(Team.name == p_name))
-        ).scalar_one_or_none()
-
-        if team:
-            # Add additional filter to the query
-            return stmt.where(User.team_id == team.id), f"Users in team '{p_name}'"
-    elif p_name in departments:
-        stmt = stmt.join(User.department).where(Department.department_name == p_name)
-        return stmt, f"Users in department '{p_name}'"
-    elif p_name in account_status:
-        if p_name == 'Active':
-            return stmt.where(User.active.is_(True)), 'Active users'
-        elif p_name == 'Inactive':
-            return stmt.where(User.active.is_(False)), 'Inactive users'
+    if kind == 'team':
+        return stmt.where(User.team_id.in_(ids)), f"Users in team '{p_name}'"
+    elif kind == 'department':
+        return stmt.where(User.department_id.in_(ids)), f"Users in department '{p_name}'"
+    elif p_name.lower() == 'active':
+        return stmt.where(User.active.is_(True)), 'Active users'
+    elif p_name.lower() == 'inactive':
+        return stmt.where(User.active.is_(False)), 'Inactive users'
     else:
         return stmt, 'All users'
 
-    return stmt
-
 
 @api_bp.get('/people/get_requester_details/')
 @api_bp.get('/people/get-current-user/')
@@ -4,11 +4,10 @@ from flask_security import login_required
 import sqlalchemy as sa
 
 from . import api_bp
+from ..common.filter_vocabulary import resolve_filter_name
 from ..model import db
-from ..model.model_category import Category
-from ..model.model_release import Release, ReleaseTypesLookup
-from ..model.lookup_tables import KBATypesLookup, StatusLookup
-from ..model.model_user import Team
+from ..model.model_release import Release
+from ..model.lookup_tables import KBATypesLookup
 
 
 @api_bp.get('/get_release_details/')
@@ -42,47 +41,24 @@ def handle_release_params(stmt, params):
     """
     Handles filtering for Ticket model based on 'params'.
     """
-    # Fetch statuses, and teams as sets
     p_name = params['name']
     p_name = p_name.replace('\n', ' ')
 
-    categories = [category.name for category in db.session.execute(sa.select(Category)).scalars()]
-
-    statuses = [
-        status.status for status in
-        db.session.execute(
-            sa.select(StatusLookup)
-        ).scalars()
-    ]
-
-    release_types = [
-        release_type.release_type for release_type in
-        db.session.execute(
-            sa.select(ReleaseTypesLookup)
-        ).scalars()
-    ]
-
-    teams = [
-        team.name for team in db.session.execute(
-            sa.select(Team)
-        ).scalars()
-    ]
+    kind, ids = resolve_filter_name(p_name, 'status', 'team', 'category', 'release_type')
 
     # Apply filtering based on params
-    if p_name in statuses:
+    if kind == 'status':
         return stmt.where(Release.status == p_name), f"By status {p_name}"
 
-    elif p_name in teams:
-        return stmt.where(Release.support_team.has(name=p_name)), f"By team {p_name}"
+    elif kind == 'team':
+        return stmt.where(Release.support_team_id.in_(ids)), f"By team {p_name}"
 
-    elif p_name in categories:
-        return stmt.where(Release.category.has(Category.name == p_name)), f"By category {p_name}"
+    elif kind == 'category':
+        return stmt.where(Release.category_id.in_(ids)), f"By category {p_name}"
 
-    elif p_name in release_types:
-        return stmt.where(Release.release_type.has(ReleaseTypesLookup.release_type == p_name)), f"By type {p_name}"
+    elif kind == 'release_type':
+        return stmt.where(Release.release_type_id.in_(ids)), f"By type {p_name}"
 
-    elif p_name not in ['All']:
-        return stmt.where(Release.release_type == p_name), f"By type {p_name}"
     else:
         return stmt, 'No filtering applied'
 
@@ -1,16 +1,23 @@
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone
 from flask import g, jsonify, request
 from flask_login import current_user
 from flask_security import login_required
 
+import pendulum
 import sqlalchemy as sa
 from sqlalchemy.exc import SQLAlchemyError
 
 from . import api_bp
-from app.common.sla import calculate_sla_times, calculate_resolve_time
+from app.common.sla import (
+    calculate_sla_times, calculate_resolve_time, get_sla_policy, invalidate_sla_policies, recalculate_open_slas,
+    ticket_location_id
+)
 from ..common.exception_handler import log_exception
+from ..common.sla_compliance import REPORT_PERIODS, get_sla_compliance, rebuild_sla_compliance
+from ..common.sla_ledger import extend_sla_deadlines, get_sla_ledger, settle_sla_ledger
+from ..common.sla_scheduler import breach_scheduler
 from ..model import db
-from ..model.lookup_tables import Importance, PriorityLookup, PauseReasons, OfficeHours, AppDefaults
+from ..model.lookup_tables import Importance, PriorityLookup, PauseReasons, AppDefaults
 from ..model.model_interaction import Ticket, TicketPauseHistory
 from ..model.model_user import User
 
@@ -124,7 +131,8 @@ def get_sla_priority():
 @login_required
 def set_sla_app_default_priority():
     """
-    Endpoint for setting app-defaults SLA priority's from sla-config.js
+    Endpoint for setting app-defaults SLA priority's from sla-config.js. Open tickets keep their targets until
+    /sla/recalculate-open-slas/ is run.
     :return: json of sla records
     """
     data = request.get_json(silent=True)
@@ -149,11 +157,31 @@ def set_sla_app_default_priority():
         except SQLAlchemyError as e:
             log_exception(f'Database error: {e}')
             return jsonify({'error': 'Database error: ' + str(e)}), 500
+        invalidate_sla_policies()  # cached policies hold the old respond/resolve targets
         return jsonify(), 200
     else:
         return jsonify({'error': 'Invalid JSON data: '}), 500
 
 
+@api_bp.post('/sla/recalculate-open-slas/')
+@login_required
+def recalculate_slas():
+    """
+    Recalculates respond by and resolve by on all open tickets against the current priority targets and office
+    hours. Run after either is changed so existing tickets pick up the new SLAs.
+    :return: json with the number of tickets updated
+    """
+    try:
+        updated = recalculate_open_slas()
+        db.session.commit()
+        breach_scheduler.load()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        log_exception(f'Database error: {e}')
+        return jsonify({'error': 'Database error: ' + str(e)}), 500
+    return jsonify({'updated': updated}), 200
+
+
 @api_bp.post('/sla/set-sla-details/')
 @login_required
 def set_sla_details():
@@ -206,7 +234,7 @@ def set_sla_details():
     ticket.priority_impact = impact
 
     # Calculate and set SLA times
-    respond, resolve = calculate_sla_times(ticket.created_at, priority=priority)
+    respond, resolve = calculate_sla_times(ticket.created_at, priority=priority, location_id=ticket_location_id(ticket))
     ticket.sla_respond_by = respond
     ticket.sla_resolve_by = resolve
 
@@ -227,6 +255,7 @@ def set_sla_details():
 
     try:
         db.session.commit()
+        breach_scheduler.track(ticket)
         return jsonify(response), 200
     except SQLAlchemyError as e:
         log_exception(f'Database error: {e}')
@@ -313,6 +342,7 @@ def pause_sla():
 
         # Append to ticket.pause_history
         ticket.pause_history.append(new_pause_record)
+        settle_sla_ledger(ticket, current_time)
 
         try:
             db.session.add(new_pause_record)
@@ -320,6 +350,7 @@ def pause_sla():
         except SQLAlchemyError as e:
             log_exception(f'Database error: {e}')
             return jsonify({'error': 'Database error: ' + str(e)}), 500
+        breach_scheduler.track(ticket)  # paused tickets cannot breach
         return jsonify({'success': 'SLA paused'}), 200
     else:
         return jsonify({"error": "Invalid JSON data: "}), 500
@@ -359,14 +390,16 @@ def resume_sla():
 
         ticket.sla_paused = False
         ticket.sla_resumed_at = current_time
-        ticket.sla_respond_by = ticket.sla_respond_by + timedelta(seconds=duration_seconds)
-        ticket.sla_resolve_by = ticket.sla_resolve_by + timedelta(seconds=duration_seconds)
+        settle_sla_ledger(ticket, current_time)
+        extend_sla_deadlines(ticket, results.paused_at, current_time)
 
     try:
         db.session.commit()
     except SQLAlchemyError as e:
         log_exception(f'Database error: {e}')
         return jsonify({'error': 'Database error: ' + str(e)}), 500
+    if ticket:
+        breach_scheduler.track(ticket)  # deadlines have moved out by the pause duration
     return jsonify({"success": "SLA resumed"}), 200
 
 
@@ -385,7 +418,7 @@ def get_sla_resolve_time():
     ).scalars().first()
     wait_hours = priority.resolve_by - priority.respond_by
 
-    resolve_by = calculate_resolve_time(respond_by, wait_hours)
+    resolve_by = calculate_resolve_time(respond_by, wait_hours, twentyfour_seven=priority.twentyfour_seven)
 
     return jsonify({"wait_time": wait_hours, "resolve_by": resolve_by})
 
@@ -394,7 +427,8 @@ def get_sla_resolve_time():
 @login_required
 def check_response_time():
     """
-    Returns true if the response time is in business hours
+    Returns true if the response time falls in business hours of the current user's location, taking weekends and
+    public holidays into account
     :return: True or False
     """
     data = request.get_json(silent=True)
@@ -409,13 +443,10 @@ def check_response_time():
     if priority.twentyfour_seven:
         return jsonify({"in_hours": True}), 200  # 24/7 coverage so any response time is acceptable
 
-    business_hours = db.session.execute(
-        sa.select(OfficeHours)
-    ).scalars().first()
+    policy = get_sla_policy(current_user.location_id)
+    respond_by = pendulum.instance(datetime.strptime(data["respond_by"], "%Y-%m-%dT%H:%M"), tz=policy.timezone)
 
-    respond_by = datetime.strptime(data["respond_by"], "%Y-%m-%dT%H:%M").time()
-
-    if not (business_hours.open_hour <= respond_by <= business_hours.close_hour):
+    if not policy.calculator.is_business_hours(respond_by, False):
         return jsonify({"in_hours": False}), 200
     else:
         return jsonify({"in_hours": True}), 200
@@ -464,3 +495,76 @@ def get_pause_history():
     pause_history = sorted(pause_history, key=lambda x: x['paused_at'], reverse=True)
 
     return jsonify({'pause_history': pause_history}), 200
+
+
+@api_bp.post('/sla/get-sla-ledger/')
+@login_required
+def get_ticket_sla_ledger():
+    """
+    SLA time used, paused and remaining for a ticket, read from its ledger rather than replaying pause history
+    :return: json of seconds consumed, paused and remaining to respond and resolve
+    """
+    data = request.get_json(silent=True)
+    if not data or 'ticket_number' not in data:
+        return jsonify({'error': 'Invalid Ticket Number'}), 400
+
+    ticket = db.session.execute(
+        sa.select(Ticket)
+        .where(Ticket.ticket_number == data['ticket_number'])
+    ).scalars().first()
+
+    if not ticket:
+        return jsonify({'error': 'Ticket not found'}), 404
+
+    ledger = get_sla_ledger(ticket)
+    if ledger is None:
+        return jsonify({'info': 'No SLA ledger for this ticket'}), 200
+
+    return jsonify(ledger), 200
+
+
+@api_bp.post('/sla/get-sla-compliance/')
+@login_required
+def get_sla_compliance_report():
+    """
+    SLA compliance by team, priority and period from the rollup tables kept by common/sla_compliance.py. Json
+    may have period (day, week, month, quarter or year), start and end as ISO dates, team_id and priority.
+    :return: json list of met, breached and paused counts with mean and p90 respond and resolve seconds
+    """
+    data = request.get_json(silent=True)
+    if data is None:
+        return jsonify({'error': 'Invalid JSON data or incorrect Content-Type header'}), 400
+
+    period = data.get('period', 'week')
+    if period not in REPORT_PERIODS:
+        return jsonify({'error': f'Invalid period: {period}'}), 400
+
+    try:
+        start = date.fromisoformat(data['start']) if data.get('start') else None
+        end = date.fromisoformat(data['end']) if data.get('end') else None
+    except ValueError:
+        return jsonify({'error': 'start and end must be ISO dates'}), 400
+
+    try:
+        report = get_sla_compliance(period, start, end, data.get('team_id'), data.get('priority'))
+    except SQLAlchemyError as e:
+        log_exception(f'Database error: {e}')
+        return jsonify({'error': 'Database error: ' + str(e)}), 500
+
+    return jsonify({'compliance': report}), 200
+
+
+@api_bp.post('/sla/rebuild-sla-compliance/')
+@login_required
+def rebuild_sla_compliance_report():
+    """
+    Rebuilds the compliance rollup from every resolved ticket. Only needed to back fill history.
+    :return: json with the number of tickets recorded
+    """
+    try:
+        recorded = rebuild_sla_compliance()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        log_exception(f'Database error: {e}')
+        return jsonify({'error': 'Database error: ' + str(e)}), 500
+    return jsonify({'recorded': recorded}), 200
@@ -1,7 +1,10 @@
 import pendulum
 import holidays
-from datetime import datetime, time
-from typing import List
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Tuple
+
+MINUTE = timedelta(minutes=1)
+OFFSET_PROBE = timedelta(days=7)  # no timezone changes its UTC offset twice within a week
 
 
 class BusinessHoursCalculator:
@@ -9,6 +12,11 @@ class BusinessHoursCalculator:
     A class for calculating business hours within a given outage period. Accommodates for weekends and holidays based on
     country and region.
 
+    The outage is counted in whole minutes starting at outage_start, a minute counting when it starts inside business
+    hours on a business day and ends on or before outage_end. Rather than stepping through every minute the range is
+    split at any UTC offset changes, whole days in between are counted with weekday and holiday arithmetic and only
+    the two partial edge days are measured directly.
+
     Args:
         outage_start (datetime): The start date and time of the outage.
         outage_end (datetime): The end date and time of the outage.
@@ -35,15 +43,114 @@ class BusinessHoursCalculator:
         self.country_code = country_code
         self.timezone = timezone
         self.holidays = holidays.country_holidays(country_code, subdiv=state if state else province)
+        self.windows = self._merge_windows(self.business_hours)
+
+    @staticmethod
+    def _merge_windows(business_hours: List[time]) -> List[Tuple[time, time]]:
+        """Pair up open/close times and merge any that overlap so no minute is counted twice."""
+        windows = []
+        for start, end in zip(business_hours[::2], business_hours[1::2]):
+            if windows and start <= windows[-1][1]:
+                windows[-1] = (windows[-1][0], max(windows[-1][1], end))
+            else:
+                windows.append((start, end))
+        return windows
+
+    def _is_business_day(self, day: date) -> bool:
+        return day not in self.holidays and day.weekday() < 5  # Monday-Friday
+
+    def _count_business_days(self, first: date, last: date) -> int:
+        """Number of business days from first to last inclusive without visiting each day."""
+        if last < first:
+            return 0
+
+        full_weeks, extra_days = divmod((last - first).days + 1, 7)
+        weekdays = full_weeks * 5 + sum(1 for i in range(extra_days) if (first.weekday() + i) % 7 < 5)
+
+        for year in range(first.year, last.year + 1):
+            date(year, 1, 1) in self.holidays  # holidays are populated lazily, one year at a time
+
+        weekday_holidays = sum(1 for holiday in self.holidays if first <= holiday <= last and holiday.weekday() < 5)
+
+        return weekdays - weekday_holidays
+
+    @staticmethod
+    def _count_minutes(first: datetime, last: datetime, origin: datetime) -> int:
+        """Number of minute marks, spaced a minute apart from origin, falling between first and last inclusive."""
+        if last < first:
+            return 0
+        return (last - origin) // MINUTE + (origin - first) // MINUTE + 1
 
-    def _is_business_day(self, dt: pendulum.DateTime) -> bool:
-        return dt not in self.holidays and dt.weekday() < 5  # Monday-Friday
+    def _count_day(self, day: date, first: datetime, last: datetime) -> int:
+        """Minute marks on a single day that fall inside business hours and between first and last."""
+        if not self._is_business_day(day):
+            return 0
 
-    def _is_within_business_hours(self, dt: pendulum.DateTime) -> bool:
-        return (self._is_business_day(dt)
-                and any(start <= dt.time() <= end
-                        for start, end in
-                        zip(self.business_hours[::2], self.business_hours[1::2])))
+        return sum(
+            self._count_minutes(max(first, datetime.combine(day, open_at)),
+                                min(last, datetime.combine(day, close_at)),
+                                first)
+            for open_at, close_at in self.windows
+        )
+
+    def _count_wall_clock(self, first: datetime, last: datetime) -> int:
+        """
+        Business minutes between two naive local times which share a single UTC offset.
+        first is the first minute mark and last the final one, both inclusive.
+        """
+        first_day = first.date()
+        last_day = last.date()
+
+        if first_day == last_day:
+            return self._count_day(first_day, first, last)
+
+        total = self._count_day(first_day, first, last) + self._count_day(last_day, first, last)
+
+        inner_first = first_day + timedelta(days=1)
+        inner_last = last_day - timedelta(days=1)
+        business_days = self._count_business_days(inner_first, inner_last)
+
+        if business_days:
+            # a day is a whole number of minutes so every full day has the same minute marks
+            per_day = sum(
+                self._count_minutes(datetime.combine(inner_first, open_at),
+                                    datetime.combine(inner_first, close_at),
+                                    first)
+                for open_at, close_at in self.windows
+            )
+            total += business_days * per_day
+
+        return total
+
+    @staticmethod
+    def _to_utc(moment: pendulum.DateTime) -> datetime:
+        """Plain UTC datetime for a pendulum DateTime, keeping the UTC offset pendulum resolved for it."""
+        wall_clock = datetime(moment.year, moment.month, moment.day,
+                              moment.hour, moment.minute, moment.second, moment.microsecond)
+        return (wall_clock - moment.utcoffset()).replace(tzinfo=timezone.utc)
+
+    @staticmethod
+    def _offset_changes(start_utc: datetime, minute_count: int, tz) -> List[int]:
+        """Indexes of the minutes at which the timezone's UTC offset differs from the minute before."""
+        def offset(minute: int) -> timedelta:
+            return (start_utc + minute * MINUTE).astimezone(tz).utcoffset()
+
+        changes = []
+        probe = 0
+        while probe < minute_count - 1:
+            next_probe = min(probe + OFFSET_PROBE // MINUTE, minute_count - 1)
+            if offset(probe) != offset(next_probe):
+                before, after = probe, next_probe
+                while after - before > 1:
+                    middle = (before + after) // 2
+                    if offset(middle) == offset(before):
+                        before = middle
+                    else:
+                        after = middle
+                changes.append(after)
+                next_probe = after
+            probe = next_probe
+        return changes
 
     def calculate_outage_in_business_hours(self, unit: str = "hours") -> float:
         tz = pendulum.timezone(self.timezone)
@@ -51,13 +158,17 @@ class BusinessHoursCalculator:
         end = pendulum.instance(self.outage_end, tz)
         total_business_minutes = 0
 
-        current = start
-        while current < end:
-            if self._is_within_business_hours(current):
-                next_minute = current.add(minutes=1)
-                if next_minute <= end:
-                    total_business_minutes += 1
-            current = current.add(minutes=1)
+        start_utc = self._to_utc(start)
+        end_utc = self._to_utc(end)
+        minute_count = max(0, (end_utc - start_utc) // MINUTE)  # only whole minutes of the outage count
+
+        # within each stretch of constant UTC offset the minutes map straight onto local wall-clock time
+        bounds = [0] + self._offset_changes(start_utc, minute_count, start.tzinfo) + [minute_count]
+        for first_minute, end_minute in zip(bounds, bounds[1:]):
+            if first_minute >= end_minute:
+                continue
+            first = (start_utc + first_minute * MINUTE).astimezone(start.tzinfo).replace(tzinfo=None)
+            total_business_minutes += self._count_wall_clock(first, first + (end_minute - first_minute - 1) * MINUTE)
 
         if unit == "days":
             return total_business_minutes / (60 * 8)  # Assuming an 8-hour business day
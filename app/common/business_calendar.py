@@ -0,0 +1,210 @@
+import numpy as np
+import pendulum
+import holidays
+import threading
+from bisect import bisect_left
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, FrozenSet, List, NamedTuple, Tuple
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+SECONDS_PER_DAY = 24 * 60 * 60
+WINDOW_YEARS = 3  # years ahead of the current one covered when a calendar is first built
+
+_calendars: Dict[Tuple, 'BusinessCalendar'] = {}
+
+
+def to_instant(dt: datetime) -> int:
+    """Microseconds since the epoch for dt, naive values being taken as UTC the same way pendulum does."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    utc = dt.astimezone(timezone.utc)
+    seconds = (utc.toordinal() - EPOCH.toordinal()) * SECONDS_PER_DAY + utc.hour * 3600 + utc.minute * 60 + utc.second
+    return seconds * 1_000_000 + utc.microsecond
+
+
+class _Window(NamedTuple):
+    """One build of a calendar's business days. It is replaced whole, never changed, when the calendar widens."""
+    first_year: int
+    last_year: int
+    holidays: FrozenSet[date]
+    opens: List[int]
+    closes: List[int]
+    cumulative: List[int]
+
+    def consumed(self, instant: int) -> int:
+        """Business microseconds in the window before instant."""
+        day = bisect_left(self.closes, instant)
+        if day == len(self.closes):
+            return self.cumulative[-1]
+        return self.cumulative[day] + max(0, instant - self.opens[day])
+
+    def holds(self, instant: int, extra: int) -> bool:
+        """True when the window holds instant and at least extra business microseconds after it."""
+        return ((instant >= self.opens[0] or self.first_year <= 1)
+                and instant < self.closes[-1]
+                and self.consumed(instant) + extra <= self.cumulative[-1])
+
+
+class BusinessCalendar:
+    """
+    Business days of one set of office hours over a window of years, held as sorted arrays of opening and closing
+    instants with the business time accumulated before each day. Adding business hours to a time is then a binary
+    search plus one offset rather than a walk through the days.
+
+    All instants are stored as integer microseconds since the epoch so results are exact. The window is widened
+    automatically if a time falls outside it. Calendars are shared between threads, so a wider window is built under
+    a lock and swapped in as a whole, and each method works on the one window it got from _cover.
+
+    Args:
+        open_hour (time): Local opening time of each business day.
+        close_hour (time): Local closing time of each business day.
+        timezone (str): The timezone of the office.
+        country_code (str): The two-letter country code used for public holidays.
+        subdiv (str): The state or province used for public holidays.
+    """
+    def __init__(self, open_hour: time, close_hour: time, timezone: str, country_code: str, subdiv: str = None):
+        self.open_hour = open_hour
+        self.close_hour = close_hour
+        self.timezone = timezone
+        self.country_code = country_code
+        self.subdiv = subdiv
+        self.tz = pendulum.timezone(timezone)
+        self._lock = threading.Lock()
+        self._arrays = None  # (window, numpy copies of its lists) for add_business_hours_batch
+
+        this_year = pendulum.now(timezone).year
+        self._window = self._build(this_year - 1, this_year + WINDOW_YEARS)
+
+    @property
+    def holidays(self) -> FrozenSet[date]:
+        return self._window.holidays
+
+    def _build(self, first_year: int, last_year: int) -> _Window:
+        years = range(first_year, last_year + 1)
+        holiday_dates = frozenset(holidays.country_holidays(self.country_code, subdiv=self.subdiv, years=years))
+
+        opens: List[int] = []
+        closes: List[int] = []
+        cumulative: List[int] = [0]
+        day = date(first_year, 1, 1)
+        while day.year <= last_year:
+            if day.weekday() < 5 and day not in holiday_dates:  # Monday-Friday
+                open_at = self._local_instant(day, self.open_hour)
+                close_at = self._local_instant(day, self.close_hour)
+                if close_at > open_at:
+                    opens.append(open_at)
+                    closes.append(close_at)
+                    cumulative.append(cumulative[-1] + close_at - open_at)
+            day += timedelta(days=1)
+
+        if not opens:
+            raise ValueError(f'Office hours {self.open_hour}-{self.close_hour} leave no business time')
+
+        return _Window(first_year, last_year, holiday_dates, opens, closes, cumulative)
+
+    def _local_instant(self, day: date, at: time) -> int:
+        return to_instant(pendulum.datetime(day.year, day.month, day.day, at.hour, at.minute, at.second, tz=self.tz))
+
+    def _to_datetime(self, instant: int) -> pendulum.DateTime:
+        return pendulum.instance(EPOCH + instant * MICROSECOND).in_timezone(self.timezone)
+
+    def _cover(self, instant: int, extra: int = 0) -> _Window:
+        """
+        The calendar's window, first widened if need be until it holds instant and at least extra business
+        microseconds after it.
+        """
+        window = self._window
+        if window.holds(instant, extra):
+            return window
+
+        with self._lock:
+            window = self._window  # another thread may have widened it while this one waited
+            while not window.holds(instant, extra):
+                if instant < window.opens[0] and window.first_year > 1:
+                    window = self._build(max(1, window.first_year - WINDOW_YEARS), window.last_year)
+                else:
+                    window = self._build(window.first_year, window.last_year + WINDOW_YEARS)
+            self._window = window
+        return window
+
+    def is_business_time(self, dt: datetime) -> bool:
+        """True when dt falls between opening and closing, inclusive, on a business day."""
+        instant = to_instant(dt)
+        window = self._cover(instant)
+        day = bisect_left(window.closes, instant)
+        return window.opens[day] <= instant
+
+    def next_business_day(self, dt: datetime) -> pendulum.DateTime:
+        """Start of the first business day after the local day of dt."""
+        local = pendulum.instance(dt).in_timezone(self.timezone)
+        instant = self._local_instant(local.date() + timedelta(days=1), time())
+        window = self._cover(instant)
+        day = bisect_left(window.opens, instant)
+        return self._to_datetime(window.opens[day]).start_of('day')
+
+    def next_business_start(self, dt: datetime) -> pendulum.DateTime:
+        """dt itself when inside business hours, otherwise the next opening time."""
+        instant = to_instant(dt)
+        window = self._cover(instant)
+        day = bisect_left(window.closes, instant)
+        return self._to_datetime(max(instant, window.opens[day]))
+
+    def add_business_hours(self, start_time: datetime, hours: float) -> pendulum.DateTime:
+        """The time at which the given number of business hours after start_time have elapsed."""
+        instant = to_instant(start_time)
+        duration = max(0, round(hours * 3600 * 1_000_000))
+        window = self._cover(instant, duration)
+
+        first_day = bisect_left(window.closes, instant)
+        target = window.consumed(instant) + duration
+        day = max(bisect_left(window.cumulative, target) - 1, first_day)
+        return self._to_datetime(window.opens[day] + target - window.cumulative[day])
+
+    def business_seconds(self, start: datetime, end: datetime) -> float:
+        """Business time between start and end in seconds, 0 if end is not after start."""
+        start_instant = to_instant(start)
+        end_instant = to_instant(end)
+        if end_instant <= start_instant:
+            return 0.0
+        self._cover(start_instant)
+        window = self._cover(end_instant)  # never narrower than the one covering start
+        return (window.consumed(end_instant) - window.consumed(start_instant)) / 1_000_000
+
+    def add_business_hours_batch(self, start_instants: np.ndarray, durations: np.ndarray) -> np.ndarray:
+        """
+        Vectorised add_business_hours. Both arguments are int64 arrays of microseconds, the first since the epoch,
+        and the result is the matching array of deadlines. Gives the same answers as calling add_business_hours
+        once per element.
+        """
+        if not len(start_instants):
+            return np.asarray(start_instants, dtype=np.int64)
+
+        self._cover(int(start_instants.min()))
+        window = self._cover(int(start_instants.max()), int(durations.max()))
+        cached = self._arrays
+        if cached is None or cached[0] is not window:
+            cached = (window, tuple(np.asarray(values, dtype=np.int64)
+                                    for values in (window.opens, window.closes, window.cumulative)))
+            self._arrays = cached
+        opens, closes, cumulative = cached[1]
+
+        first_day = np.searchsorted(closes, start_instants, side='left')
+        target = cumulative[first_day] + np.maximum(0, start_instants - opens[first_day]) + durations
+        day = np.maximum(np.searchsorted(cumulative, target, side='left') - 1, first_day)
+        return opens[day] + target - cumulative[day]
+
+
+def get_business_calendar(office_hours) -> BusinessCalendar:
+    """
+    The compiled calendar for an OfficeHours record. Calendars are shared across requests and only rebuilt when the
+    opening hours, timezone or holiday country/subdivision change.
+    """
+    subdiv = office_hours.state or office_hours.province
+    key = (office_hours.open_hour, office_hours.close_hour, office_hours.timezone, office_hours.country_code, subdiv)
+
+    calendar = _calendars.get(key)
+    if calendar is None:
+        calendar = BusinessCalendar(*key)
+        _calendars[key] = calendar
+    return calendar
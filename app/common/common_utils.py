@@ -1,5 +1,4 @@
 import os
-from datetime import datetime, timezone
 import threading
 import asyncio
 
@@ -63,30 +62,6 @@ def get_email_addresses(users):
     return ', '.join(addresses)
 
 
-def check_sla_breach():
-    '''
-    Checks for SLA Respond and Resolve breach and updates ticket Boolean for dashboard display
-    :return: Nothing but ticket should be updated if SLA breached else does nothing
-    '''
-    all_open = db.session.execute(
-        sa.select(Ticket)
-        .where(Ticket.status != 'closed')
-    ).scalars().all()
-
-    for ticket in all_open:
-        if ticket.sla_respond_by < datetime.now(timezone.utc):
-            ticket.sla_response_breach = True
-        else:
-            ticket.sla_response_breach = False
-
-        if ticket.sla_resolve_by < datetime.now(timezone.utc):
-            ticket.sla_resolve_breach = True
-        else:
-            ticket.sla_resolve_breach = False
-
-        db.session.commit()
-
-
 def run_async_in_thread(coro):
     '''
     Run an async coroutine in a separate thread with Flask request context.
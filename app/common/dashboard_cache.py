@@ -0,0 +1,53 @@
+import json
+import time
+
+from flask import current_app, request
+from flask_security import current_user
+
+from .model_versions import model_name, model_version
+
+DASHBOARD_CACHE_MAX_ENTRIES = 1000
+SCOPES_BY_USER = ('me', 'portal', 'team')  # scopes whose records depend on who is asking
+
+# (endpoint, model, scope, user, team, args) -> (expires at, version of the model, counts)
+_responses = {}
+
+
+def _remember(key, version, counts):
+    if len(_responses) >= DASHBOARD_CACHE_MAX_ENTRIES:
+        now = time.monotonic()
+        for stale in [cached_key for cached_key, (expires_at, _, _) in _responses.items() if expires_at <= now]:
+            del _responses[stale]
+        if len(_responses) >= DASHBOARD_CACHE_MAX_ENTRIES:
+            del _responses[next(iter(_responses))]  # oldest entry
+    _responses[key] = (time.monotonic() + current_app.config['DASHBOARD_CACHE_SECONDS'], version, counts)
+
+
+def cached_counts(model, scope, args, count):
+    """
+    Counts for a dashboard chart, shared by everyone asking the same endpoint for the same model and scope for
+    DASHBOARD_CACHE_SECONDS or until a write to the records of model is committed and gives it a new version, see
+    common/model_versions.py. Scopes limited to the current user's records or their team's are cached per user.
+
+    Args:
+        model: The model counted, whose version the counts are kept against.
+        scope: The scope of the chart.
+        args: Anything else in the request the counts depend on, JSON serialisable.
+        count: Function that reads the counts when they are not cached.
+
+    Returns:
+        dict: the counts.
+    """
+    by_user = scope in SCOPES_BY_USER and current_user.is_authenticated
+    key = (request.endpoint, model_name(model), scope,
+           current_user.id if by_user else None, current_user.team_id if by_user else None,
+           json.dumps(args, sort_keys=True, default=str))
+    version = model_version(model)
+
+    cached = _responses.get(key)
+    if cached and cached[0] > time.monotonic() and cached[1] == version:
+        return cached[2]
+
+    counts = count()
+    _remember(key, version, counts)
+    return counts
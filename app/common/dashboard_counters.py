@@ -0,0 +1,191 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.event import listen
+
+from .exception_handler import log_exception
+from ..model import db
+from ..model.model_change import Change
+from ..model.model_cmdb import CmdbConfigurationItem
+from ..model.model_idea import Idea
+from ..model.model_interaction import Ticket
+from ..model.model_knowledge import KnowledgeBase
+from ..model.model_problem import Problem
+from ..model.model_release import Release
+from ..model.model_reporting import COUNTED_TABLES, DashboardCounter
+
+COUNTED_MODELS = tuple(model for model in (Ticket, Problem, Change, Release, KnowledgeBase, Idea, CmdbConfigurationItem)
+                       if model.__tablename__ in COUNTED_TABLES)
+# attributes of a record that pick its counter row, named as the DashboardCounter columns. Models without one of
+# them are counted under None
+COUNTER_KEYS = ('ticket_type', 'status', 'priority', 'support_team_id', 'supporter_id')
+RECONCILE_LOCK_ID = 7204  # pg advisory lock held by the worker reconciling the counters
+
+_hooks_registered = False
+
+
+def _key(record, committed=False):
+    """
+    The counter row a record is counted in, as it is now or, with committed, as it was last written to the database.
+    """
+    state = sa.inspect(record)
+    key = {'model': state.mapper.base_mapper.class_.__tablename__}  # CMDB subclasses count as configuration items
+    for attribute in COUNTER_KEYS:
+        if attribute not in state.mapper.attrs:
+            key[attribute] = None
+            continue
+        history = state.attrs[attribute].history
+        if committed and history.has_changes():
+            key[attribute] = history.deleted[0] if history.deleted else None
+        else:
+            key[attribute] = getattr(record, attribute)
+    return key
+
+
+def _add(connection, key, delta):
+    """Adds delta to a counter row, creating it if it is not there yet, in the transaction writing the record."""
+    counter = insert(DashboardCounter).values(**key, count=delta)
+    connection.execute(
+        counter.on_conflict_do_update(
+            index_elements=list(key),
+            set_={'count': DashboardCounter.count + counter.excluded.count}
+        )
+    )
+
+
+def _record_inserted(mapper, connection, record):
+    _add(connection, _key(record), 1)
+
+
+def _record_updated(mapper, connection, record):
+    before, after = _key(record, committed=True), _key(record)
+    if before != after:
+        _add(connection, before, -1)
+        _add(connection, after, 1)
+
+
+def _record_deleted(mapper, connection, record):
+    _add(connection, _key(record, committed=True), -1)
+
+
+def _keep_old_value(record, value, old_value, initiator):
+    """Listening with active_history loads the old value of a key attribute before it is set, so it can be uncounted."""
+
+
+def register_counter_hooks(app):
+    """
+    Keep dashboard_counters up to date as COUNTED_MODELS records are written, unless the counters are switched off
+    with DASHBOARD_COUNTERS = False, in which case records are written without touching the table. Called by
+    create_app; the hooks are process wide so they are only registered once.
+    """
+    global _hooks_registered
+    if not app.config.get('DASHBOARD_COUNTERS', True) or _hooks_registered:
+        return
+    for model in COUNTED_MODELS:
+        listen(model, 'after_insert', _record_inserted, propagate=True)
+        listen(model, 'after_update', _record_updated, propagate=True)
+        listen(model, 'after_delete', _record_deleted, propagate=True)
+        for attribute in COUNTER_KEYS:
+            if attribute in sa.inspect(model).attrs:
+                listen(getattr(model, attribute), 'set', _keep_old_value, active_history=True, propagate=True)
+    _hooks_registered = True
+
+
+def _count_tables():
+    """
+    Counts every record of COUNTED_MODELS by the counter keys, straight from the tables.
+    :return: dict of counter key tuple, in DashboardCounter column order, to count
+    """
+    counts = {}
+    for model in COUNTED_MODELS:
+        attributes = [attribute for attribute in COUNTER_KEYS if attribute in sa.inspect(model).attrs]
+        columns = [getattr(model, attribute) for attribute in attributes]
+        for *values, count in db.session.execute(sa.select(*columns, sa.func.count()).group_by(*columns)):
+            key = dict(zip(attributes, values))
+            counts[(model.__tablename__, *(key.get(attribute) for attribute in COUNTER_KEYS))] = count
+    return counts
+
+
+def reconcile_counters():
+    """
+    Recounts the counted tables and rewrites dashboard_counters where it has drifted from them, as it can through bulk
+    UPDATEs, which skip the mapper events, or through writes made outside the app. The counters are locked against
+    writes while the tables are counted, so a record written meanwhile is counted once, either here or by its own
+    delta once the lock is released. If another worker is already reconciling nothing is done. Caller commits.
+    :return: number of counter rows that were wrong, or None if another worker is reconciling
+    """
+    if not db.session.execute(sa.select(sa.func.pg_try_advisory_xact_lock(RECONCILE_LOCK_ID))).scalar():
+        return None
+    db.session.execute(sa.text('LOCK TABLE dashboard_counters IN EXCLUSIVE MODE'))
+
+    counted = {key: count for key, count in _count_tables().items() if count}
+    stored = {
+        tuple(row[:-1]): row[-1]
+        for row in db.session.execute(
+            sa.select(DashboardCounter.model, *[getattr(DashboardCounter, key) for key in COUNTER_KEYS],
+                      DashboardCounter.count)
+            .where(DashboardCounter.count != 0)
+        )
+    }
+    drifted = sum(1 for key in counted.keys() | stored.keys() if counted.get(key) != stored.get(key))
+
+    if drifted:
+        db.session.execute(sa.delete(DashboardCounter))
+        db.session.execute(sa.insert(DashboardCounter), [
+            {'model': key[0], **dict(zip(COUNTER_KEYS, key[1:])), 'count': count}
+            for key, count in counted.items()
+        ])
+    return drifted
+
+
+class CounterReconciler:
+    """
+    Runs reconcile_counters once a night at DASHBOARD_COUNTERS_RECONCILE_HOUR (UTC), and when a worker starts with
+    the counters still empty, as they are the first time the app runs with them.
+    """
+    def __init__(self):
+        self._thread = None
+
+    @staticmethod
+    def _seconds_to_next_run(hour):
+        now = datetime.now(timezone.utc)
+        next_run = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+        if next_run <= now:
+            next_run += timedelta(days=1)
+        return (next_run - now).total_seconds()
+
+    @staticmethod
+    def _reconcile(app, only_if_empty=False):
+        with app.app_context():
+            try:
+                if not only_if_empty or db.session.execute(sa.select(DashboardCounter.id).limit(1)).first() is None:
+                    drifted = reconcile_counters()
+                    db.session.commit()
+                    if drifted:
+                        app.logger.info(f'Dashboard counters reconciled, {drifted} counter rows were wrong')
+            except Exception as e:
+                db.session.rollback()
+                log_exception(f'Dashboard counter reconcile failed: {e}')
+            finally:
+                db.session.remove()
+
+    def run(self, app):
+        hour = app.config.get('DASHBOARD_COUNTERS_RECONCILE_HOUR', 2)
+        self._reconcile(app, only_if_empty=True)
+        while True:
+            time.sleep(self._seconds_to_next_run(hour))
+            self._reconcile(app)
+
+    def start(self, app):
+        """Start the reconcile thread unless the counters are switched off with DASHBOARD_COUNTERS = False."""
+        if not app.config.get('DASHBOARD_COUNTERS', True) or self._thread:
+            return None
+        self._thread = threading.Thread(target=self.run, args=(app,), name='dashboard-counter-reconciler', daemon=True)
+        self._thread.start()
+        return self._thread
+
+
+counter_reconciler = CounterReconciler()
@@ -0,0 +1,92 @@
+import time
+
+import sqlalchemy as sa
+from flask import current_app
+
+from ..model import db
+from ..model.lookup_tables import (ChangeTypeLookup, Importance, KBATypesLookup, LikelihoodLookup, PriorityLookup,
+                                   RiskLookup, StatusLookup)
+from ..model.model_category import Category
+from ..model.model_cmdb import CmdbConfigurationItem
+from ..model.model_release import ReleaseTypesLookup
+from ..model.model_user import Department, Team
+
+# Where the names a dashboard chart sends as params['name'] come from: kind -> select of (name, id). The id is that
+# of the record the name stands for, or NULL where rows are filtered on the name itself.
+VOCABULARY_QUERIES = {
+    'status': lambda: sa.select(StatusLookup.status, sa.null()),
+    'priority': lambda: sa.select(PriorityLookup.priority, sa.null()),
+    'likelihood': lambda: sa.select(LikelihoodLookup.likelihood, sa.null()),
+    'change_type': lambda: sa.select(ChangeTypeLookup.change_type, sa.null()),
+    'risk': lambda: sa.select(RiskLookup.risk, sa.null()),
+    'team': lambda: sa.select(Team.name, Team.id),
+    'department': lambda: sa.select(Department.name, Department.id),
+    'category': lambda: sa.select(Category.name, Category.id),
+    'importance': lambda: sa.select(Importance.importance, Importance.id),
+    'kb_type': lambda: sa.select(KBATypesLookup.article_type, KBATypesLookup.id),
+    'release_type': lambda: sa.select(ReleaseTypesLookup.release_type, ReleaseTypesLookup.id),
+    # the CMDB dashboard charts only what is in use, so only names in use filter
+    'ci_category': lambda: (
+        sa.select(Category.name, Category.id).distinct()
+        .join(CmdbConfigurationItem, CmdbConfigurationItem.category_id == Category.id)
+        .where(CmdbConfigurationItem.status != 'disposed')
+    ),
+    'ci_status': lambda: (
+        sa.select(CmdbConfigurationItem.status, sa.null()).distinct()
+        .where(CmdbConfigurationItem.status != 'disposed')
+    ),
+    'ci_type': lambda: (
+        sa.select(CmdbConfigurationItem.ticket_type, sa.null()).distinct()
+        .where(CmdbConfigurationItem.status != 'disposed')
+    ),
+}
+
+_vocabularies = {}  # kind -> {name: ids}
+_resolvers = {}  # kinds -> {name: (kind, ids)}
+_loaded_at = 0.0
+
+
+def _vocabulary(kind):
+    vocabulary = _vocabularies.get(kind)
+    if vocabulary is None:
+        vocabulary = {}
+        for name, record_id in db.session.execute(VOCABULARY_QUERIES[kind]()):
+            if name is not None:
+                ids = vocabulary.setdefault(name, ())
+                vocabulary[name] = ids + (record_id,) if record_id is not None else ids
+        _vocabularies[kind] = vocabulary
+    return vocabulary
+
+
+def resolve_filter_name(name, *kinds):
+    """
+    Which of kinds a name from a dashboard chart belongs to, checked in the order given, so the caller can turn it
+    into a WHERE clause without reading the lookup tables. The vocabularies are read once and kept until
+    invalidate_filter_vocabulary is called or they are FILTER_VOCABULARY_SECONDS old, which is how changes made by
+    other workers are picked up.
+
+    Args:
+        name: The name clicked on.
+        kinds: Keys of VOCABULARY_QUERIES, in order of precedence.
+
+    Returns:
+        tuple: (kind, ids of the records the name stands for), or (None, ()) if no vocabulary has the name.
+    """
+    global _loaded_at
+    if time.monotonic() - _loaded_at > current_app.config['FILTER_VOCABULARY_SECONDS']:
+        invalidate_filter_vocabulary()
+        _loaded_at = time.monotonic()
+
+    resolver = _resolvers.get(kinds)
+    if resolver is None:
+        resolver = {}
+        for kind in reversed(kinds):  # earlier kinds win
+            resolver.update({vocabulary_name: (kind, ids) for vocabulary_name, ids in _vocabulary(kind).items()})
+        _resolvers[kinds] = resolver
+    return resolver.get(name, (None, ()))
+
+
+def invalidate_filter_vocabulary():
+    """Drop cached vocabularies. Call after a lookup table, team, department or category changes."""
+    _vocabularies.clear()
+    _resolvers.clear()
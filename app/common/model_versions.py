@@ -0,0 +1,85 @@
+import itertools
+import os
+import tempfile
+import time
+
+import sqlalchemy as sa
+from flask import current_app, has_app_context
+from sqlalchemy.event import listens_for
+from sqlalchemy.orm import Session
+
+from .exception_handler import log_exception
+
+
+def model_name(model):
+    return sa.inspect(model).base_mapper.class_.__tablename__  # CMDB subclasses share the configuration item version
+
+
+def _version_path(model):
+    return os.path.join(current_app.instance_path, 'model_versions', model_name(model))
+
+
+def model_version(model):
+    """
+    A token that changes whenever a write to the records of model is committed, for cached responses built from
+    them to be checked against. It is kept in a file in the instance folder rather than in memory so a write made
+    through any worker is seen by every worker, and reading it costs a file read rather than a query.
+    """
+    try:
+        with open(_version_path(model)) as version_file:
+            return version_file.read()
+    except FileNotFoundError:
+        return ''
+
+
+def bump_model_version(model):
+    """
+    Gives model a new version. Done for every model a committed session wrote to, so only writes made outside the
+    session need to call this. The write has happened by then, so a version that cannot be written is logged rather
+    than raised and responses cached against the old version are served until they expire.
+    """
+    path = _version_path(model)
+    temp_path = None
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(descriptor, 'w') as version_file:
+            version_file.write(f'{time.time_ns()}-{os.getpid()}')
+        os.replace(temp_path, path)  # readers see the old version or the new one, never part of a file
+    except OSError as e:
+        log_exception(f'Could not write the version of {model_name(model)}: {e}')
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _written_models(session):
+    return session.info.setdefault('written_models', set())
+
+
+@listens_for(Session, 'after_flush')
+def _note_flushed_models(session, flush_context):
+    _written_models(session).update(
+        sa.inspect(record).mapper.base_mapper.class_
+        for record in itertools.chain(session.new, session.dirty, session.deleted)
+    )
+
+
+@listens_for(Session, 'do_orm_execute')
+def _note_bulk_writes(orm_execute_state):
+    """Bulk INSERT, UPDATE and DELETE statements run through the session skip the flush."""
+    if (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete) \
+            and orm_execute_state.bind_mapper is not None:
+        _written_models(orm_execute_state.session).add(orm_execute_state.bind_mapper.base_mapper.class_)
+
+
+@listens_for(Session, 'after_commit')
+def _bump_written_models(session):
+    written = session.info.pop('written_models', set())
+    if has_app_context():
+        for model in written:
+            bump_model_version(model)
+
+
+@listens_for(Session, 'after_rollback')
+def _forget_written_models(session):
+    session.info.pop('written_models', None)
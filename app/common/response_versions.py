@@ -0,0 +1,57 @@
+import hashlib
+import json
+
+import sqlalchemy as sa
+from flask import Response, g, request
+from flask_security import current_user
+
+from ..model import db
+
+
+def _xmin(table):
+    """
+    The id of the transaction that wrote each row of table. Any insert, update or delete changes the count or the
+    sum of these over a set of rows, which makes (count, sum of xmin) a version of the rows that costs one aggregate
+    to read and needs nothing kept up to date on writes.
+    """
+    name = db.engine.dialect.identifier_preparer.format_table(table)
+    return sa.cast(sa.cast(sa.literal_column(f'{name}.xmin'), sa.Text), sa.BigInteger)
+
+
+def _version(column):
+    return sa.func.concat(sa.func.count(), ':', sa.func.coalesce(sa.func.sum(column), 0))
+
+
+def table_version(table):
+    """Version of every row of table, as a scalar subquery for read_versions."""
+    return sa.select(_version(_xmin(table))).select_from(table).scalar_subquery()
+
+
+def read_versions(*versions):
+    """Reads table_version subqueries in one query."""
+    return tuple(db.session.execute(sa.select(*versions)).one())
+
+
+def response_etag(versions, data=None):
+    """
+    ETag of a JSON response built from data in the request body out of rows at the given versions, for the current
+    user and their team, which decide the rows a scoped request reads, in the date formats of the day.
+    """
+    user_id = current_user.id if current_user.is_authenticated else None
+    team_id = current_user.team_id if current_user.is_authenticated else None
+    key = [versions, data, user_id, team_id, g.get('date_format'), g.get('datetime_format')]
+    return hashlib.sha1(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def not_modified(etag):
+    """An empty 304 if the client already holds the response tagged etag, otherwise None."""
+    if etag in request.if_none_match:
+        return tag_response(Response(status=304), etag)
+    return None
+
+
+def tag_response(response, etag):
+    """Sets the ETag of a response and asks clients to revalidate it before reusing it."""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
@@ -1,98 +1,277 @@
-from datetime import datetime, timedelta
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Dict, Optional
 
+import numpy as np
+import pendulum
 from flask_login import current_user
 
+from ..common.business_calendar import get_business_calendar, to_instant
+from ..common.model_versions import bump_model_version, model_version
 from ..common.sla_calculator import SLACalculator  # library no longer maintained so copied here
 from ..model import db
-from ..model.model_user import User
-from sqlalchemy import select
+from sqlalchemy import case, func, select, update, values, column, DateTime, Integer
 from ..model.lookup_tables import OfficeHours, PriorityLookup
+from ..model.model_interaction import Ticket, TicketPauseHistory, TicketSLALedger
+from ..model.model_user import User
+
+RECALCULATE_BATCH_SIZE = 5000  # rows per UPDATE, keeps each statement well under the Postgres parameter limit
+MICROSECONDS_PER_HOUR = 3600 * 1_000_000
+
+SLA_POLICY_CHECK_SECONDS = 1  # how often the registry checks whether another worker has changed the policies
 
+_policies: Dict[Optional[int], 'SLAPolicy'] = {}
+_policies_version = None  # versions of OfficeHours and PriorityLookup the registry was filled from
+_policies_checked_at = 0.0
 
-def calculate_sla_times(create_time, priority='P3'):
+
+class SLAPolicy:
     """
-    Calculates response and resolve times using the sla_calculator library originally from here
-    https://github.com/swimlane/sla_calculator
-    but with the suggested merge on that site manually submitted as it seems to be unmaintained.
-    Queries OfficeHours which only has 1 entry as SmikTix is intended for small business
-    so unlikely to have IT staff in multiple locations across geography.
-    A future update may change this???
+    Immutable snapshot of everything needed to work out SLA times for one location: the office hours, the priority
+    matrix with its 24/7 flags and the holiday set. Exposes the same attributes as OfficeHours so it can be handed
+    straight to SLACalculator, and stands in for the location's OfficeHours record in requests.
+
+    Args:
+        office_hours (OfficeHours): The location the policy is for.
+        priorities (list[PriorityLookup]): All rows of the priority matrix.
     """
-    user = db.session.get(User, current_user.id)
+    __slots__ = ('location_id', 'location', 'open_hour', 'close_hour', 'timezone', 'country_code', 'state', 'province',
+                 'date_format', 'datetime_format', 'priorities', 'holidays', 'calculator')
+
+    def __init__(self, office_hours: OfficeHours, priorities: list[PriorityLookup]):
+        set_attr = super().__setattr__
+        set_attr('location_id', office_hours.id)
+        set_attr('location', office_hours.location)
+        set_attr('open_hour', office_hours.open_hour)
+        set_attr('close_hour', office_hours.close_hour)
+        set_attr('timezone', office_hours.timezone)
+        set_attr('country_code', office_hours.country_code)
+        set_attr('state', office_hours.state)
+        set_attr('province', office_hours.province)
+        set_attr('date_format', office_hours.date_format)
+        set_attr('datetime_format', office_hours.datetime_format)
+        # priority -> (respond_by hours, resolve_by hours, 24/7)
+        set_attr('priorities', MappingProxyType({
+            row.priority: (row.respond_by, row.resolve_by, row.twentyfour_seven) for row in priorities
+        }))
+        set_attr('holidays', get_business_calendar(self).holidays)
+        set_attr('calculator', SLACalculator(self))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('SLAPolicy is immutable')
+
+    def sla_times(self, create_time, priority='P3'):
+        """Respond by and resolve by times for a ticket created at create_time with the given priority."""
+        respond_by, resolve_by, twentyfour_seven = self.priorities[priority]
+        return self.calculator.calculate_sla_times(
+            start_time=str(create_time),
+            response_hours=respond_by,
+            resolve_hours=resolve_by,
+            is_24hrs=twentyfour_seven
+        )
+
 
-    if user and user.location:
-        office_hours = user.location
-    else:  # if User has not been assigned a location, use default. Assumes first record is default
+def get_sla_policy(location_id: Optional[int] = None) -> SLAPolicy:
+    """
+    The SLA policy for a location, or for the default location (the first OfficeHours record) when location_id is
+    None or unknown. Policies are held in a process-wide registry with one policy, and so one compiled calendar, per
+    OfficeHours record; only the first call per location touches the database. The registry is emptied once
+    OfficeHours or PriorityLookup have a new version, see common/model_versions.py, so a change committed through
+    any worker reaches every worker within SLA_POLICY_CHECK_SECONDS.
+    """
+    _check_policies_version()
+    policy = _policies.get(location_id)
+    if policy is not None:
+        return policy
+
+    office_hours = None
+    if location_id is not None:
+        office_hours = db.session.get(OfficeHours, location_id)
+    if office_hours is None:  # if User has not been assigned a location, use default. Assumes first record is default
         office_hours = db.session.execute(
             select(OfficeHours)
             .order_by(OfficeHours.id)
         ).scalars().first()
 
-    sla_hours = db.session.execute(
-        select(PriorityLookup)
-        .where(PriorityLookup.priority == priority)
-    ).scalars().first()
+    policy = _policies.get(office_hours.id)
+    if policy is None:
+        priorities = db.session.execute(select(PriorityLookup)).scalars().all()
+        policy = SLAPolicy(office_hours, priorities)
+        _policies[office_hours.id] = policy
+
+    _policies[location_id] = policy
+    return policy
+
+
+def ticket_location_id(ticket) -> Optional[int]:
+    """Location whose office hours a ticket's SLA runs on: the requester's, or None for the default location."""
+    if ticket.requester_id is None:
+        return None
+    requester = db.session.get(User, ticket.requester_id)  # usually already in the session's identity map
+    return requester.location_id if requester else None
+
+
+def get_ticket_sla_policy(ticket) -> SLAPolicy:
+    """The SLA policy of the ticket's location."""
+    return get_sla_policy(ticket_location_id(ticket))
+
+
+def _current_location_id() -> Optional[int]:
+    return current_user.location_id if current_user.is_authenticated else None
+
+
+def _check_policies_version():
+    """Empty the registry if OfficeHours or PriorityLookup have changed since it was filled."""
+    global _policies_version, _policies_checked_at
+    now = time.monotonic()
+    if now - _policies_checked_at < SLA_POLICY_CHECK_SECONDS:
+        return
+    _policies_checked_at = now
+    version = (model_version(OfficeHours), model_version(PriorityLookup))
+    if version != _policies_version:
+        _policies.clear()
+        _policies_version = version
+
 
-    sla_calc = SLACalculator(office_hours)
+def invalidate_sla_policies():
+    """
+    Drop cached SLA policies, here and, through new versions of OfficeHours and PriorityLookup, in every other
+    worker. Commits through the session give them new versions already; call after PriorityLookup or OfficeHours
+    records change so this worker drops them straight away, and after changes made outside the session.
+    """
+    global _policies_checked_at
+    _policies.clear()
+    bump_model_version(OfficeHours)
+    bump_model_version(PriorityLookup)
+    _policies_checked_at = 0.0
+
+
+def calculate_sla_times(create_time, priority='P3', location_id: Optional[int] = None):
+    """
+    Calculates response and resolve times using the sla_calculator library originally from here
+    https://github.com/swimlane/sla_calculator
+    but with the suggested merge on that site manually submitted as it seems to be unmaintained.
+    Uses the cached SLA policy for location_id, or for the current user's location when not given, so no queries are
+    made once the policy is built.
+    """
+    if location_id is None:
+        location_id = _current_location_id()
+    return get_sla_policy(location_id).sla_times(create_time, priority)
+
+
+def _recalculated_deadlines(policy: SLAPolicy, rows):
+    """Respond by and resolve by for rows of (id, created_at, priority, ledger paused, legacy paused) in one pass."""
+    ids, created, priorities, ledger_paused, legacy_paused = zip(*rows)
+    created = np.array([to_instant(created_at) for created_at in created], dtype=np.int64)
+    ledger_paused = np.round(np.array(ledger_paused, dtype=np.float64) * 1_000_000).astype(np.int64)
+    legacy_paused = np.round(np.array(legacy_paused, dtype=np.float64) * 1_000_000).astype(np.int64)
+    targets = np.array([policy.priorities[priority] for priority in priorities], dtype=np.float64)
+
+    respond_for = np.round(targets[:, 0] * MICROSECONDS_PER_HOUR).astype(np.int64) + ledger_paused
+    resolve_for = np.round(targets[:, 1] * MICROSECONDS_PER_HOUR).astype(np.int64) + ledger_paused
+    twentyfour_seven = targets[:, 2].astype(bool)
+
+    calendar = policy.calculator.calendar
+    respond_by = np.where(twentyfour_seven, created + respond_for,
+                          calendar.add_business_hours_batch(created, respond_for)) + legacy_paused
+    resolve_by = np.where(twentyfour_seven, created + resolve_for,
+                          calendar.add_business_hours_batch(created, resolve_for)) + legacy_paused
+
+    return list(ids), respond_by.astype('datetime64[us]').tolist(), resolve_by.astype('datetime64[us]').tolist()
 
-    respond_calc, resolve_calc = sla_calc.calculate_sla_times(
-        start_time=str(create_time),
-        response_hours=sla_hours.respond_by,
-        resolve_hours=sla_hours.resolve_by,
-        is_24hrs=sla_hours.twentyfour_seven
+
+def recalculate_open_slas(location_id: Optional[int] = None) -> int:
+    """
+    Recalculates respond by and resolve by for every ticket that is not yet resolved or closed, so changes to the
+    priority targets or office hours apply to open tickets as well as new ones. Each ticket is worked out against the
+    calendar of its requester's location, one vectorised pass per location, and written back with
+    UPDATE ... FROM (VALUES ...) in batches.
+    Completed SLA pauses are added on in business time from the ticket's SLA ledger, the same as resume_sla does.
+    Tickets from before the ledger existed fall back to the wall-clock length of their pauses.
+
+    Args:
+        location_id (int): Only recalculate tickets of this location. Defaults to every location.
+
+    Returns:
+        int: The number of tickets updated. Caller commits.
+    """
+    default_policy = get_sla_policy()
+
+    paused = (
+        select(TicketPauseHistory.ticket_id, func.sum(TicketPauseHistory.duration).label('paused_seconds'))
+        .where(TicketPauseHistory.resumed_at.is_not(None))
+        .group_by(TicketPauseHistory.ticket_id)
+        .subquery()
     )
+    rows = db.session.execute(
+        select(User.location_id, Ticket.id, Ticket.created_at, Ticket.priority,
+               func.coalesce(TicketSLALedger.business_seconds_paused, 0),
+               case((TicketSLALedger.ticket_id.is_(None), func.coalesce(paused.c.paused_seconds, 0)), else_=0))
+        .outerjoin(User, User.id == Ticket.requester_id)
+        .outerjoin(TicketSLALedger, TicketSLALedger.ticket_id == Ticket.id)
+        .outerjoin(paused, paused.c.ticket_id == Ticket.id)
+        .where(Ticket.status.notin_(('resolved', 'closed')))
+        .where(Ticket.created_at.is_not(None))
+        .where(Ticket.priority.in_(list(default_policy.priorities)))
+    ).all()
+
+    by_policy = defaultdict(list)
+    for ticket_location_id, *row in rows:
+        by_policy[get_sla_policy(ticket_location_id)].append(row)
+
+    if location_id is not None:
+        only = get_sla_policy(location_id)
+        by_policy = {only: by_policy[only]} if by_policy.get(only) else {}
 
-    return respond_calc, resolve_calc
+    ids, respond_by, resolve_by = [], [], []
+    for policy, policy_rows in by_policy.items():
+        policy_ids, policy_respond_by, policy_resolve_by = _recalculated_deadlines(policy, policy_rows)
+        ids += policy_ids
+        respond_by += policy_respond_by
+        resolve_by += policy_resolve_by
 
+    for start in range(0, len(ids), RECALCULATE_BATCH_SIZE):
+        batch = values(
+            column('id', Integer),
+            column('respond_by', DateTime(timezone=True)),
+            column('resolve_by', DateTime(timezone=True)),
+            name='sla_targets'
+        ).data([
+            (ticket_id, respond.replace(tzinfo=timezone.utc), resolve.replace(tzinfo=timezone.utc))
+            for ticket_id, respond, resolve in zip(ids[start:start + RECALCULATE_BATCH_SIZE],
+                                                   respond_by[start:start + RECALCULATE_BATCH_SIZE],
+                                                   resolve_by[start:start + RECALCULATE_BATCH_SIZE])
+        ])
+        db.session.execute(
+            update(Ticket)
+            .where(Ticket.id == batch.c.id)
+            .values(sla_respond_by=batch.c.respond_by, sla_resolve_by=batch.c.resolve_by)
+            .execution_options(synchronize_session=False)
+        )
 
-def calculate_resolve_time(response_time, wait_hours):
+    return len(ids)
+
+
+def calculate_resolve_time(response_time, wait_hours, location_id: Optional[int] = None, twentyfour_seven=False):
     """
-    Calculate the resolve time based on a response time, wait hours, office hours, and weekends.
+    Calculate the resolve time based on a response time, wait hours and the office hours, weekends and holidays of
+    a location.
 
     Args:
-        response_time (datetime): The time when the response was made.
+        response_time (str): The time when the response was made, local to the location, as %Y-%m-%dT%H:%M.
         wait_hours (int): The working hours required for resolution.
+        location_id (int): Location whose office hours apply. Defaults to the current user's.
+        twentyfour_seven (bool): Count every hour rather than business hours.
 
     Returns:
-        datetime: The calculated resolve time.
+        str: The calculated resolve time, local to the location, in ISO format.
     """
-    office_hours = db.session.execute(select(OfficeHours)).scalars().first()
-    work_start = office_hours.open_hour
-    work_end = office_hours.close_hour
-    weekends = [6, 7]  # Saturday and Sunday
-
-    response_time = datetime.strptime(response_time, '%Y-%m-%dT%H:%M')
-    response_hour = response_time.time()
-
-    # Adjust response time if it's outside working hours
-    if response_hour < work_start or response_hour >= work_end:
-        if response_hour >= work_end:
-            # Move to the next workday
-            response_time += timedelta(days=1)
-
-        response_time = response_time.replace(hour=work_start.hour, minute=0, second=0, microsecond=0)
-
-    remaining_hours = wait_hours
-    result_response_time = response_time
-
-    while remaining_hours > 0:
-        # Skip weekends
-        if result_response_time.isoweekday() in weekends:
-            result_response_time += timedelta(days=1)
-            result_response_time = result_response_time.replace(hour=work_start.hour, minute=0, second=0, microsecond=0)
-            continue
-
-        # Calculate hours available in the current workday
-        end_of_day = result_response_time.replace(hour=work_end.hour, minute=work_end.minute, second=0, microsecond=0)
-        hours_till_end_of_day = (end_of_day - result_response_time).total_seconds() / 3600
-
-        if remaining_hours <= hours_till_end_of_day:
-            # Resolve within the current workday
-            result_response_time += timedelta(hours=remaining_hours)
-            remaining_hours = 0
-        else:
-            # Move to the next workday
-            remaining_hours -= hours_till_end_of_day
-            result_response_time = end_of_day + timedelta(days=1)
-            result_response_time = result_response_time.replace(hour=work_start.hour, minute=0, second=0, microsecond=0)
-    return result_response_time.isoformat()
+    if location_id is None:
+        location_id = _current_location_id()
+    policy = get_sla_policy(location_id)
+
+    response_time = pendulum.instance(datetime.strptime(response_time, '%Y-%m-%dT%H:%M'), tz=policy.timezone)
+    resolve_time = policy.calculator.add_business_hours(response_time, wait_hours, twentyfour_seven)
+    return resolve_time.in_timezone(policy.timezone).naive().isoformat()
@@ -0,0 +1,227 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
+
+from ..common.sla_ledger import settle_sla_ledger, sla_seconds_running
+from ..model import db
+from ..model.model_interaction import Ticket, TicketSLALedger
+from ..model.model_reporting import DURATION_BUCKETS, SLAComplianceRollup, SLADurationHistogram
+from ..model.model_user import Team
+
+REPORT_PERIODS = ('day', 'week', 'month', 'quarter', 'year')
+ROLLUP_COUNTERS = ('tickets', 'respond_met', 'respond_breached', 'resolve_met', 'resolve_breached', 'paused',
+                   'respond_seconds', 'respond_count', 'resolve_seconds', 'resolve_count')
+
+
+def _bucket(seconds):
+    """Index of the DURATION_BUCKETS bucket a duration falls in."""
+    for index, upper in enumerate(DURATION_BUCKETS):
+        if upper is None or seconds <= upper:
+            return index
+
+
+def _percentile(histogram, fraction):
+    """
+    Estimate a percentile from bucket counts by interpolating within the bucket it falls in.
+    :param histogram: dict of bucket index to count
+    :param fraction: e.g. 0.9 for p90
+    :return: seconds, or None if there are no counts
+    """
+    total = sum(histogram.values())
+    if not total:
+        return None
+
+    wanted = fraction * total
+    running = 0
+    for index, upper in enumerate(DURATION_BUCKETS):
+        count = histogram.get(index, 0)
+        if count and running + count >= wanted:
+            lower = DURATION_BUCKETS[index - 1] if index else 0
+            if upper is None:
+                return lower
+            return lower + (upper - lower) * (wanted - running) / count
+        running += count
+
+
+def record_sla_outcome(ticket, at=None):
+    """
+    Adds a resolved ticket to the compliance rollup and duration histogram with upserts, so the rows are counted
+    correctly whichever worker gets there first. Each ticket is counted once, on its first resolution. Caller commits.
+    :param ticket: the resolved Ticket
+    :param at: time of resolution if ticket.resolved_at is not set
+    :return: True if the ticket was recorded
+    """
+    at = at or datetime.now(timezone.utc)
+    ledger = ticket.sla_ledger or settle_sla_ledger(ticket, at)
+    if ledger.compliance_recorded_at:
+        return False
+
+    resolved_at = ticket.resolved_at or at
+    responded_at = ticket.sla_responded_at or resolved_at  # resolving without responding first counts as the response
+    respond_seconds = sla_seconds_running(ticket, ticket.created_at or resolved_at, responded_at)
+    resolve_seconds = ledger.business_seconds_consumed
+
+    respond_breached = bool(ticket.sla_response_breach
+                            or (ticket.sla_respond_by and responded_at > ticket.sla_respond_by))
+    resolve_breached = bool(ticket.sla_resolve_breach
+                            or (ticket.sla_resolve_by and resolved_at > ticket.sla_resolve_by))
+
+    key = {
+        'day': resolved_at.astimezone(timezone.utc).date(),
+        'team_id': ticket.support_team_id,
+        'priority': ticket.priority,
+    }
+    counters = {
+        'tickets': 1,
+        'respond_met': int(not respond_breached),
+        'respond_breached': int(respond_breached),
+        'resolve_met': int(not resolve_breached),
+        'resolve_breached': int(resolve_breached),
+        'paused': int(ledger.business_seconds_paused > 0 or bool(ticket.pause_history)),
+        'respond_seconds': respond_seconds,
+        'respond_count': 1,
+        'resolve_seconds': resolve_seconds,
+        'resolve_count': 1,
+    }
+
+    rollup = insert(SLAComplianceRollup).values(**key, **counters)
+    db.session.execute(
+        rollup.on_conflict_do_update(
+            index_elements=list(key),
+            set_={name: getattr(SLAComplianceRollup, name) + getattr(rollup.excluded, name) for name in counters}
+        )
+    )
+
+    for measure, seconds in (('respond', respond_seconds), ('resolve', resolve_seconds)):
+        histogram = insert(SLADurationHistogram).values(**key, measure=measure, bucket=_bucket(seconds), count=1)
+        db.session.execute(
+            histogram.on_conflict_do_update(
+                index_elements=[*key, 'measure', 'bucket'],
+                set_={'count': SLADurationHistogram.count + 1}
+            )
+        )
+
+    ledger.compliance_recorded_at = at
+    return True
+
+
+def settle_status_change(ticket, at=None):
+    """
+    Settles the SLA ledger of a ticket after its status may have changed, and records its outcome if it is now
+    resolved. Every path that changes a ticket's status calls this before committing. Caller commits.
+    """
+    settle_sla_ledger(ticket, at)  # status changes can stop or restart the SLA clock
+    if ticket.status == 'resolved':
+        record_sla_outcome(ticket, at)
+
+
+def get_sla_compliance(period='week', start=None, end=None, team_id=None, priority=None):
+    """
+    SLA compliance by team, priority and period read from the rollup tables.
+    :param period: one of REPORT_PERIODS
+    :param start: first day to include, date
+    :param end: last day to include, date
+    :param team_id: only this team if given
+    :param priority: only this priority if given
+    :return: list of dicts, one per team, priority and period
+    """
+    def filters(model):
+        criteria = []
+        if start:
+            criteria.append(model.day >= start)
+        if end:
+            criteria.append(model.day <= end)
+        if team_id:
+            criteria.append(model.team_id == team_id)
+        if priority:
+            criteria.append(model.priority == priority)
+        return criteria
+
+    period_start = sa.func.date_trunc(period, SLAComplianceRollup.day).label('period')
+    rows = db.session.execute(
+        sa.select(
+            period_start,
+            SLAComplianceRollup.team_id,
+            Team.name,
+            SLAComplianceRollup.priority,
+            *[sa.func.sum(getattr(SLAComplianceRollup, name)).label(name) for name in ROLLUP_COUNTERS]
+        )
+        .outerjoin(Team, Team.id == SLAComplianceRollup.team_id)
+        .where(*filters(SLAComplianceRollup))
+        .group_by(period_start, SLAComplianceRollup.team_id, Team.name, SLAComplianceRollup.priority)
+        .order_by(period_start, Team.name, SLAComplianceRollup.priority)
+    ).all()
+
+    histogram_period = sa.func.date_trunc(period, SLADurationHistogram.day).label('period')
+    histogram_rows = db.session.execute(
+        sa.select(
+            histogram_period,
+            SLADurationHistogram.team_id,
+            SLADurationHistogram.priority,
+            SLADurationHistogram.measure,
+            SLADurationHistogram.bucket,
+            sa.func.sum(SLADurationHistogram.count)
+        )
+        .where(*filters(SLADurationHistogram))
+        .group_by(histogram_period, SLADurationHistogram.team_id, SLADurationHistogram.priority,
+                  SLADurationHistogram.measure, SLADurationHistogram.bucket)
+    ).all()
+
+    histograms = defaultdict(dict)
+    for period_value, row_team_id, row_priority, measure, bucket, count in histogram_rows:
+        histograms[(period_value, row_team_id, row_priority, measure)][bucket] = count
+
+    report = []
+    for row in rows:
+        group = (row.period, row.team_id, row.priority)
+        report.append({
+            'period': row.period.date().isoformat(),
+            'team_id': row.team_id,
+            'team': row.name or 'No Team',
+            'priority': row.priority,
+            'tickets': row.tickets,
+            'respond_met': row.respond_met,
+            'respond_breached': row.respond_breached,
+            'resolve_met': row.resolve_met,
+            'resolve_breached': row.resolve_breached,
+            'paused': row.paused,
+            'respond_mean_seconds': row.respond_seconds / row.respond_count if row.respond_count else None,
+            'respond_p90_seconds': _percentile(histograms[(*group, 'respond')], 0.9),
+            'resolve_mean_seconds': row.resolve_seconds / row.resolve_count if row.resolve_count else None,
+            'resolve_p90_seconds': _percentile(histograms[(*group, 'resolve')], 0.9),
+        })
+    return report
+
+
+def rebuild_sla_compliance(batch_size=500):
+    """
+    Empties the rollup tables and records every resolved ticket again. For back filling history or after the
+    rollup has been edited by hand; day to day the tables are maintained by record_sla_outcome. It is all one
+    transaction, so reports read the old rollup until the new one is committed in its place, and nothing if it fails.
+    Tickets are read and flushed batch_size at a time to bound memory.
+    :return: number of tickets recorded
+    """
+    db.session.execute(sa.delete(SLADurationHistogram))
+    db.session.execute(sa.delete(SLAComplianceRollup))
+    db.session.execute(sa.update(TicketSLALedger).values(compliance_recorded_at=None))
+
+    resolved_ids = db.session.execute(
+        sa.select(Ticket.id)
+        .where(Ticket.resolved_at.is_not(None))
+        .order_by(Ticket.id)
+    ).scalars().all()
+
+    recorded = 0
+    for start in range(0, len(resolved_ids), batch_size):
+        tickets = db.session.execute(
+            sa.select(Ticket)
+            .where(Ticket.id.in_(resolved_ids[start:start + batch_size]))
+        ).scalars().all()
+        for ticket in tickets:
+            recorded += record_sla_outcome(ticket, ticket.resolved_at)
+        db.session.flush()
+        db.session.expunge_all()  # the batch is written, let it go rather than hold every ticket until the commit
+    db.session.commit()
+    return recorded
@@ -0,0 +1,155 @@
+from datetime import datetime, timedelta, timezone
+
+from ..common.sla import get_ticket_sla_policy
+from ..model import db
+from ..model.model_interaction import TicketSLALedger
+
+STOPPED_STATUSES = ('resolved', 'closed')
+
+
+def _clock_state(ticket):
+    """Whether the SLA clock of a ticket is currently running, paused or stopped."""
+    if ticket.sla_resolved or ticket.status in STOPPED_STATUSES:
+        return 'stopped'
+    if ticket.sla_paused:
+        return 'paused'
+    return 'running'
+
+
+def _elapsed(ticket, policy, start, end):
+    """Seconds of SLA time between start and end: business time, or wall-clock time for 24/7 priorities."""
+    twentyfour_seven = policy.priorities.get(ticket.priority, (None, None, False))[2]
+    if twentyfour_seven:
+        return max(0.0, (end - start).total_seconds())
+    return policy.calculator.calendar.business_seconds(start, end)
+
+
+def _new_ledger(ticket, policy, at):
+    """
+    Ledger for a ticket that does not have one yet. Tickets created before the ledger existed are brought up to
+    date from their pause history once, after which the ledger is only ever moved forward.
+    """
+    created_at = ticket.created_at or at
+    paused = 0.0
+    for pause in ticket.pause_history:
+        if pause.resumed_at:
+            paused += _elapsed(ticket, policy, pause.paused_at, pause.resumed_at)
+
+    open_pause = next((pause.paused_at for pause in ticket.pause_history if not pause.resumed_at), None)
+    counted_to = open_pause if ticket.sla_paused and open_pause else at
+
+    return TicketSLALedger(
+        ticket=ticket,
+        business_seconds_consumed=max(0.0, _elapsed(ticket, policy, created_at, counted_to) - paused),
+        business_seconds_paused=paused,
+        counted_to=counted_to,
+        clock_state='paused' if counted_to != at else 'running',
+    )
+
+
+def settle_sla_ledger(ticket, at=None):
+    """
+    Moves the ledger of a ticket forward to at (default now), crediting the time since it was last settled to
+    consumed or paused according to the clock state at that time, then records the ticket's current clock state.
+    Call after the ticket has been paused, resumed or changed status. A pause is only credited once it ends, so
+    business_seconds_paused always covers completed pauses only. Caller commits.
+    :param ticket: the Ticket
+    :param at: time of the change, timezone aware
+    :return: the ledger
+    """
+    at = at or datetime.now(timezone.utc)
+    policy = get_ticket_sla_policy(ticket)
+    ledger = ticket.sla_ledger
+
+    if ledger is None:
+        ledger = _new_ledger(ticket, policy, at)
+        db.session.add(ledger)
+
+    clock_state = _clock_state(ticket)
+    if ledger.clock_state == 'paused' and clock_state == 'paused':
+        return ledger
+
+    elapsed = _elapsed(ticket, policy, ledger.counted_to, at)
+    if ledger.clock_state == 'running':
+        ledger.business_seconds_consumed += elapsed
+    elif ledger.clock_state == 'paused':
+        ledger.business_seconds_paused += elapsed
+
+    ledger.counted_to = max(ledger.counted_to, at)
+    ledger.clock_state = clock_state
+    return ledger
+
+
+def get_sla_ledger(ticket, at=None):
+    """
+    SLA time used, time paused and time remaining for a ticket as at the given time (default now). Read only; the
+    time since the ledger was last settled is added on without writing it back.
+    :param ticket: the Ticket
+    :param at: timezone aware time to report at
+    :return: dict of seconds, or None if the ticket has no ledger yet
+    """
+    ledger = ticket.sla_ledger
+    if ledger is None:
+        return None
+
+    at = at or datetime.now(timezone.utc)
+    policy = get_ticket_sla_policy(ticket)
+    consumed = ledger.business_seconds_consumed
+    paused = ledger.business_seconds_paused
+
+    if ledger.clock_state == 'running':
+        consumed += _elapsed(ticket, policy, ledger.counted_to, at)
+    elif ledger.clock_state == 'paused':
+        paused += _elapsed(ticket, policy, ledger.counted_to, at)
+
+    respond_hours, resolve_hours, _ = policy.priorities.get(ticket.priority, (None, None, False))
+
+    return {
+        'consumed_seconds': consumed,
+        'paused_seconds': paused,
+        'respond_remaining_seconds': respond_hours * 3600 - consumed if respond_hours is not None else None,
+        'resolve_remaining_seconds': resolve_hours * 3600 - consumed if resolve_hours is not None else None,
+        'clock_state': ledger.clock_state,
+    }
+
+
+def sla_seconds(ticket, start, end):
+    """SLA seconds between start and end for a ticket under its location's policy."""
+    return _elapsed(ticket, get_ticket_sla_policy(ticket), start, end)
+
+
+def sla_seconds_running(ticket, start, end):
+    """
+    SLA seconds between start and end for a ticket less the time it was paused in between, so measured the way the
+    ledger measures business_seconds_consumed. A pause still open at end counts up to end.
+    """
+    policy = get_ticket_sla_policy(ticket)
+    paused = 0.0
+    for pause in ticket.pause_history:
+        paused_from = max(pause.paused_at, start)
+        paused_to = min(pause.resumed_at or end, end)
+        if paused_from < paused_to:
+            paused += _elapsed(ticket, policy, paused_from, paused_to)
+    return max(0.0, _elapsed(ticket, policy, start, end) - paused)
+
+
+def extend_sla_deadlines(ticket, paused_at, resumed_at):
+    """
+    Moves the respond and resolve deadlines of a ticket out by the SLA time lost to a pause, measured in business
+    time so a pause over a weekend does not hand back two extra days. Caller commits.
+    :return: the pause length in SLA seconds
+    """
+    policy = get_ticket_sla_policy(ticket)
+    paused_for = _elapsed(ticket, policy, paused_at, resumed_at)
+    twentyfour_seven = policy.priorities.get(ticket.priority, (None, None, False))[2]
+
+    for field in ('sla_respond_by', 'sla_resolve_by'):
+        deadline = getattr(ticket, field)
+        if deadline is None:
+            continue
+        if twentyfour_seven:
+            setattr(ticket, field, deadline + timedelta(seconds=paused_for))
+        else:
+            setattr(ticket, field, policy.calculator.calendar.add_business_hours(deadline, paused_for / 3600))
+
+    return paused_for
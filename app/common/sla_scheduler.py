@@ -0,0 +1,184 @@
+import heapq
+import threading
+import time
+from datetime import datetime, timezone
+
+import sqlalchemy as sa
+
+from .exception_handler import log_exception
+from ..model import db
+from ..model.model_interaction import Ticket
+from ..model.model_notes import Notes
+
+BREACH_BATCH_SIZE = 100  # tickets flagged per UPDATE and commit
+
+# deadline kind -> (deadline column, breach flag column, done flag column, journal message)
+DEADLINES = {
+    'respond': (Ticket.sla_respond_by, Ticket.sla_response_breach, Ticket.sla_responded,
+                'SLA response time breached'),
+    'resolve': (Ticket.sla_resolve_by, Ticket.sla_resolve_breach, Ticket.sla_resolved,
+                'SLA resolution time breached'),
+}
+
+
+class SLABreachScheduler:
+    """
+    Keeps a min-heap of the upcoming respond and resolve deadlines of open, unpaused tickets and sleeps until the next
+    one falls due, so finding breaches costs in proportion to the number of breaches rather than the number of open
+    tickets.
+
+    Tickets are added, moved or dropped through track() whenever they are created, paused, resumed or resolved. Entries
+    are never removed from the heap directly; the live deadline for each (ticket id, kind) is held in a dict and heap
+    entries that no longer match it are skipped when popped.
+
+    The flag UPDATE re-checks the ticket in the database, so with several workers each keeping its own heap a stale
+    entry can never flag a ticket that was paused or resolved elsewhere, and a ticket is only ever flagged (and
+    journalled) once. The heap is also reloaded from the database every SLA_BREACH_RESYNC_SECONDS to pick up changes
+    made by other workers.
+    """
+    def __init__(self):
+        self._heap = []
+        self._deadlines = {}
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def track(self, ticket):
+        """Schedule, reschedule or drop the deadlines of a ticket to match its current state."""
+        with self._condition:
+            for kind, (deadline_column, breach_column, done_column, _) in DEADLINES.items():
+                deadline = getattr(ticket, deadline_column.key)
+                live = (deadline is not None
+                        and ticket.status != 'closed'
+                        and not ticket.sla_paused
+                        and not getattr(ticket, breach_column.key)
+                        and not getattr(ticket, done_column.key))
+                self._set(ticket.id, kind, deadline if live else None)
+            self._condition.notify()
+
+    def _set(self, ticket_id, kind, deadline):
+        if deadline is None:
+            self._deadlines.pop((ticket_id, kind), None)
+            return
+        if deadline.tzinfo is None:
+            deadline = deadline.replace(tzinfo=timezone.utc)
+        if self._deadlines.get((ticket_id, kind)) != deadline:
+            self._deadlines[(ticket_id, kind)] = deadline
+            heapq.heappush(self._heap, (deadline, ticket_id, kind))
+
+    def load(self):
+        """Rebuild the heap from every open, unpaused ticket with a deadline still to be met. Needs an app context."""
+        rows = db.session.execute(
+            sa.select(Ticket.id, Ticket.sla_respond_by, Ticket.sla_resolve_by,
+                      Ticket.sla_response_breach | Ticket.sla_responded,
+                      Ticket.sla_resolve_breach | Ticket.sla_resolved)
+            .where(Ticket.status != 'closed', Ticket.sla_paused.is_(False))
+            .where(sa.or_(
+                sa.and_(Ticket.sla_response_breach.is_(False), Ticket.sla_responded.is_(False)),
+                sa.and_(Ticket.sla_resolve_breach.is_(False), Ticket.sla_resolved.is_(False))
+            ))
+        ).all()
+
+        with self._condition:
+            self._heap = []
+            self._deadlines = {}
+            for ticket_id, respond_by, resolve_by, respond_done, resolve_done in rows:
+                self._set(ticket_id, 'respond', None if respond_done else respond_by)
+                self._set(ticket_id, 'resolve', None if resolve_done else resolve_by)
+            self._condition.notify()
+
+    def _due(self, now):
+        """Pop every live deadline at or before now, grouped by kind."""
+        due = {kind: [] for kind in DEADLINES}
+        while self._heap and self._heap[0][0] <= now:
+            deadline, ticket_id, kind = heapq.heappop(self._heap)
+            if self._deadlines.get((ticket_id, kind)) == deadline:
+                del self._deadlines[(ticket_id, kind)]
+                due[kind].append(ticket_id)
+        return due
+
+    def _seconds_to_next(self, now, limit):
+        while self._heap and self._deadlines.get((self._heap[0][1], self._heap[0][2])) != self._heap[0][0]:
+            heapq.heappop(self._heap)  # discard stale entries so they do not cause early wake-ups
+        if not self._heap:
+            return limit
+        return min(limit, max(0.0, (self._heap[0][0] - now).total_seconds()))
+
+    @staticmethod
+    def flag_breaches(kind, ticket_ids, now):
+        """
+        Set the breach flag for the given tickets in batches and write a system journal note on each one actually
+        flagged. Tickets paused, completed, moved out past now or already flagged since they were scheduled are skipped
+        by the UPDATE. Needs an app context.
+        """
+        deadline_column, breach_column, done_column, message = DEADLINES[kind]
+
+        for start in range(0, len(ticket_ids), BREACH_BATCH_SIZE):
+            batch = ticket_ids[start:start + BREACH_BATCH_SIZE]
+            flagged = db.session.execute(
+                sa.update(Ticket)
+                .where(Ticket.id.in_(batch))
+                .where(Ticket.status != 'closed', Ticket.sla_paused.is_(False))
+                .where(breach_column.is_(False), done_column.is_(False))
+                .where(deadline_column <= now)
+                .values({breach_column.key: True})
+                .returning(Ticket.id, Ticket.ticket_number, Ticket.ticket_type)
+                .execution_options(synchronize_session=False)
+            ).all()
+
+            db.session.add_all([
+                Notes(
+                    note=message,
+                    noted_by='System',
+                    note_date=now,
+                    ticket_type=ticket_type,
+                    ticket_number=ticket_number,
+                    ticket_id=ticket_id,
+                    is_system=True,
+                )
+                for ticket_id, ticket_number, ticket_type in flagged
+            ])
+            db.session.commit()
+
+    def run(self, app):
+        resync_seconds = app.config.get('SLA_BREACH_RESYNC_SECONDS') or 3600
+        next_resync = 0.0
+
+        while True:
+            try:
+                with app.app_context():
+                    if time.monotonic() >= next_resync:
+                        self.load()
+                        db.session.remove()  # end the read, not to sit idle in transaction for the wait
+                        next_resync = time.monotonic() + resync_seconds
+
+                    with self._condition:
+                        limit = max(0.0, next_resync - time.monotonic())
+                        wait = self._seconds_to_next(datetime.now(timezone.utc), limit)
+                        if wait > 0:
+                            self._condition.wait(wait)
+                        now = datetime.now(timezone.utc)
+                        due = self._due(now)
+
+                    for kind, ticket_ids in due.items():
+                        if ticket_ids:
+                            self.flag_breaches(kind, ticket_ids, now)
+            except Exception as e:
+                with app.app_context():
+                    db.session.rollback()
+                    log_exception(f'SLA breach scheduler failed: {e}')
+                next_resync = 0.0  # anything popped before the failure is picked up again by the reload
+                time.sleep(1)
+            finally:
+                with app.app_context():
+                    db.session.remove()
+
+    def start(self, app):
+        """Start the scheduler thread unless it is switched off with SLA_BREACH_SCHEDULER = False."""
+        if not app.config.get('SLA_BREACH_SCHEDULER', True) or self._thread:
+            return None
+        self._thread = threading.Thread(target=self.run, args=(app,), name='sla-breach-scheduler', daemon=True)
+        self._thread.start()
+        return self._thread
+
+
+breach_scheduler = SLABreachScheduler()
@@ -0,0 +1,80 @@
+import json
+import time
+
+import sqlalchemy as sa
+from flask import current_app
+
+from ..model import db
+
+COUNT_CACHE_MAX_ENTRIES = 1000
+
+# (compiled count statement, parameters) -> (expires at, total, exact)
+_counts = {}
+
+
+def _count_statement(stmt):
+    return sa.select(sa.func.count()).select_from(stmt.order_by(None).subquery())
+
+
+def _cache_key(compiled):
+    return compiled.string, json.dumps(compiled.params, sort_keys=True, default=str)
+
+
+def _remember(key, total, exact):
+    if len(_counts) >= COUNT_CACHE_MAX_ENTRIES:
+        now = time.monotonic()
+        for stale in [cached_key for cached_key, (expires_at, _, _) in _counts.items() if expires_at <= now]:
+            del _counts[stale]
+        if len(_counts) >= COUNT_CACHE_MAX_ENTRIES:
+            del _counts[next(iter(_counts))]  # oldest entry
+    _counts[key] = (time.monotonic() + current_app.config['COUNT_CACHE_SECONDS'], total, exact)
+
+
+def _estimated_count(model, stmt):
+    """
+    The planner's row estimate for stmt: pg_class.reltuples when nothing is filtered out, otherwise the row count of
+    the top node of its EXPLAIN plan. None if the table has not been analysed yet.
+    """
+    if stmt.whereclause is None:
+        reltuples = db.session.scalar(
+            sa.text('SELECT reltuples FROM pg_class WHERE oid = CAST(:table_name AS regclass)'),
+            {'table_name': model.__table__.name}
+        )
+        return int(reltuples) if reltuples is not None and reltuples >= 0 else None
+
+    compiled = stmt.order_by(None).compile(dialect=db.engine.dialect, compile_kwargs={'render_postcompile': True})
+    plan = db.session.connection().exec_driver_sql(f'EXPLAIN (FORMAT JSON) {compiled.string}', compiled.params)
+    return int(plan.scalar()[0]['Plan']['Plan Rows'])
+
+
+def count_rows(model, stmt, estimate=False):
+    """
+    Total rows stmt returns, remembered for COUNT_CACHE_SECONDS so paging through a table counts it once rather than
+    on every page. With estimate, tables of at least ESTIMATED_COUNT_MIN_ROWS rows are not counted at all and the
+    planner's estimate is used instead. Only ask for an estimate for an unfiltered view, where being a few rows out
+    does not matter.
+
+    Args:
+        model: The model stmt selects from.
+        stmt: The select to count.
+        estimate: Allow an estimated total.
+
+    Returns:
+        tuple: (total, exact), exact False when the total is an estimate.
+    """
+    count_stmt = _count_statement(stmt)
+    key = _cache_key(count_stmt.compile(dialect=db.engine.dialect, compile_kwargs={'render_postcompile': True}))
+
+    cached = _counts.get(key)
+    if cached and cached[0] > time.monotonic() and (cached[2] or estimate):
+        return cached[1], cached[2]
+
+    if estimate:
+        estimated = _estimated_count(model, stmt)
+        if estimated is not None and estimated >= current_app.config['ESTIMATED_COUNT_MIN_ROWS']:
+            _remember(key, estimated, False)
+            return estimated, False
+
+    total = db.session.scalar(count_stmt)
+    _remember(key, total, True)
+    return total, True
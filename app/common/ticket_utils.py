@@ -19,6 +19,9 @@ from wtforms import (
 from ..common.common_utils import get_highest_ticket_number, my_teams, send_notification
 from ..common.exception_handler import log_exception
 from ..common.forms import MultipleCheckboxField
+from ..common.sla_compliance import settle_status_change
+from ..common.sla_ledger import settle_sla_ledger
+from ..common.sla_scheduler import breach_scheduler
 from ..model import db
 from ..model.lookup_tables import BenefitsLookup, Compliance, ImpactLookup, ResolutionLookup, VendorLookup
 from ..model.model_change import Change
@@ -456,8 +459,12 @@ def save_ticket(ticket, exists):
 
             # No need to set ticket_number manually; Identity() handles it
             db.session.add(ticket)
+            if isinstance(ticket, Ticket):
+                settle_sla_ledger(ticket, ticket.created_at)  # starts the SLA clock
         else:
             message = f'{ticket.ticket_type} Ticket has been updated!'
+            if isinstance(ticket, Ticket):
+                settle_status_change(ticket)
         db.session.commit()
 
     except sa.exc.IntegrityError as e:
@@ -472,6 +479,9 @@ def save_ticket(ticket, exists):
         flash(f'Error saving the ticket {e}', 'danger')
         return False
 
+    if isinstance(ticket, Ticket):
+        breach_scheduler.track(ticket)  # picks up new or changed SLA deadlines
+
     # Add journal notes and flash message
     add_journal_notes(ticket, message, is_system=True)
     flash(f'{message} - Ticket number is {ticket.ticket_number}', 'success')
@@ -9,6 +9,7 @@ from . import model_notes
 from . import model_portal
 from . import model_problem
 from . import model_release
+from . import model_reporting
 from . import model_user
 from . import relationship_tables
 
@@ -2,11 +2,11 @@ import sqlalchemy as sa
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, UTC
 from . import db
+from flask import current_app
 from flask_security import current_user
-from .lookup_tables import PriorityLookup
 from .model_category import Subcategory
+from .model_reporting import COUNTED_COLUMNS, COUNTED_TABLES, DashboardCounter
 from ..model.model_change import Change
-from .model_problem import Problem
 
 class CommonFieldsMixin:
     ticket_number: Mapped[int] = mapped_column(
@@ -24,133 +24,114 @@ class CommonFieldsMixin:
     status: Mapped[str] = mapped_column(db.String(50))
 
 
-def get_priority_counts(model, ticket_type, scope):
-    # Ensure ticket_type matches the database format
-    team_id = current_user.team_id
-    # Base filters
-    status_filter = model.status != 'closed'
-    scope_filter = []
-
-    # Apply scope-specific filters
+def scope_filters(model, scope):
+    """
+    Conditions limiting the records of model, or its DashboardCounter rows, to a dashboard scope. 'me' is what the
+    current user supports, 'portal' what they requested, 'team' what their team supports less their own, including
+    what nobody has picked up, and 'cab' what is at the change advisory board's 'cab' status. Any other scope is every
+    record.
+    """
     if scope == 'me':
-        scope_filter.append(model.supporter_id == current_user.id)
-    elif scope == 'portal':
-        scope_filter.append(model.requester_id == current_user.id)
-    elif scope == 'team':
-        scope_filter.append(
-            sa.and_(
-                sa.or_(model.supporter_id.is_(None), model.supporter_id != current_user.id),
-                model.support_team_id == team_id
-            )
-        )
-    elif scope == 'cab':
-        scope_filter.append(model.cab_ready)
-
-    # Construct the query
-    stmt = (
-        sa.select(model.priority, sa.func.count())
-        .where(sa.and_(model.ticket_type == ticket_type, status_filter, *scope_filter))
-        .group_by(model.priority)
-    )
-
-    # Execute and fetch results
-    priority_counts = db.session.execute(stmt).all()
-
-    # Fetch priority labels in one query
-    priority_labels = {
-        p: p for p in db.session.execute(
-            sa.select(PriorityLookup.priority)
-            .where(PriorityLookup.priority.in_([p for p, _ in priority_counts]))
-        ).scalars()
-    }
-
-    # Populate counts_dict
-    counts_dict = {priority_labels.get(priority, priority): count for priority, count in priority_counts}
-
-    # Query total count with the same filters
-    total_count_stmt = (sa.select(sa.func.count())
-                        .where(sa.and_(model.ticket_type == ticket_type, status_filter, *scope_filter))
-                        )
-    total_count = db.session.execute(total_count_stmt).scalar_one()
+        return [model.supporter_id == current_user.id]
+    if scope == 'portal':
+        return [model.requester_id == current_user.id]
+    if scope == 'team':
+        return [
+            sa.or_(model.supporter_id.is_(None), model.supporter_id != current_user.id),
+            model.support_team_id == current_user.team_id
+        ]
+    if scope == 'cab':
+        # Only changes have a cab scope, and their cab charts have always counted by this status. get_priority_counts
+        # once filtered the cab scope on Change.cab_ready, but changes are counted by risk and never reached it.
+        return [model.status == 'cab']
+    return []
+
+
+def _counted(model, dimension, scope, where, join):
+    """Whether a count can be read from DashboardCounter rather than the records of model."""
+    return (current_app.config.get('DASHBOARD_COUNTERS', True)
+            and model.__tablename__ in COUNTED_TABLES
+            and getattr(dimension, 'class_', None) is model
+            and dimension.key in COUNTED_COLUMNS
+            and not where and join is None  # the counters count every record, closed or not
+            and scope != 'portal')  # requesters are not a counter key
+
+
+def count_records(model, dimension, scope=None, ticket_types=None, where=None, join=None, total=True,
+                  closed='closed'):
+    """
+    Counts the records of model by the values of dimension, and all of them together under 'All', in one
+    GROUP BY ROLLUP query. Every dashboard count is read through this. Counts by ticket type, status or priority are
+    read from the dashboard_counters rows of model where the scope allows rather than from its records.
+
+    Args:
+        model: The model whose records are counted.
+        dimension: Column the records are counted by, of model or of the table in join.
+        scope: 'me', 'portal', 'team' or 'cab', see scope_filters.
+        ticket_types: A ticket type, or a list of them, to count rather than every type.
+        where: Conditions to count by instead of the default of records whose status is not closed, [] for every
+            record.
+        join: (table, on clause) of a lookup table dimension is read from. Records with no row in it count
+            towards 'All' only.
+        total: False to leave out 'All'.
+        closed: Status of the records no longer counted, for models that do not close their records.
+    :return: dict of dimension value to count
+    """
+    if _counted(model, dimension, scope, where, join):
+        source = DashboardCounter
+        dimension = getattr(DashboardCounter, dimension.key)
+        count_column = sa.func.sum(DashboardCounter.count)
+        conditions = [DashboardCounter.model == model.__tablename__]
+    else:
+        source = model
+        count_column = sa.func.count()
+        conditions = []
+
+    conditions += [source.status != closed] if where is None else list(where)
+    conditions += scope_filters(source, scope)
+    if ticket_types is not None:
+        if isinstance(ticket_types, str):
+            ticket_types = [ticket_types]
+        conditions.append(source.ticket_type.in_(ticket_types))
+
+    stmt = sa.select(dimension, sa.func.grouping(dimension), count_column).select_from(source)
+    if join is not None:
+        stmt = stmt.outerjoin(*join)
+    stmt = stmt.where(*conditions).group_by(sa.func.rollup(dimension))
+    if source is DashboardCounter:
+        stmt = stmt.having(count_column > 0)  # counter rows stay behind at 0 once their records move on
+
+    counts_dict = {}
+    total_count = 0
+    for value, rolled_up, count in db.session.execute(stmt):
+        if rolled_up:
+            total_count = count  # the ROLLUP row, over every value
+        elif value is not None or join is None:
+            counts_dict[value] = count
+
+    if total:
+        counts_dict['All'] = total_count
+    return counts_dict
 
-    # Add total count to the dictionary under 'All'
-    counts_dict['All'] = total_count
 
-    return counts_dict
+def get_priority_counts(model, ticket_type, scope):
+    return count_records(model, model.priority, scope, ticket_types=ticket_type)
 
 
 def get_status_counts(model, scope=None):
     if not current_user.is_authenticated and scope == 'team':
         return {}  # Return empty if user is not authenticated and 'team' scope is selected
 
-    # Initialize filters
-    scope_filter = []
-
-    # Apply scope-specific filters
-    if scope == 'me':
-        scope_filter.append(model.supporter_id == current_user.id)
-    elif scope == 'portal':
-        scope_filter.append(model.requester_id == current_user.id)
-    elif scope == 'team':
-        scope_filter.append(
-            sa.and_(
-                sa.or_(model.supporter_id != current_user.id, model.supporter_id.is_(None)),
-                model.support_team_id == current_user.team_id
-            )
-        )
-    elif scope == 'cab':
-        scope_filter.append(sa.and_(model.status == 'cab'))
-    else:  # Default case (e.g., 'all')
-        scope_filter.append(model.status != 'closed')
-
-    # Construct the query
-    stmt = (
-        sa.select(model.status, sa.func.count())
-        .where(*scope_filter)
-        .group_by(model.status)
-    )
-
-    # Execute the query and return results as a dictionary
-    return {status: count for status, count in db.session.execute(stmt).all()}
+    # the scoped counts take in closed records, the rest only those still open
+    where = [] if scope in ('me', 'portal', 'team', 'cab') else None
+    return count_records(model, model.status, scope, where=where, total=False)
 
 
 def get_ticket_type_count(model, scope):
-    # Common filters
-    status_filter = model.status != 'closed'
-    scope_filters = []
-
-    # Apply scope-specific filters
-    if scope == 'me':
-        scope_filters.append(model.supporter_id == current_user.id)
-    elif scope == 'team':
-        scope_filters.append(
-            sa.and_(
-                sa.or_(model.supporter_id.is_(None), model.supporter_id != current_user.id),
-                model.support_team_id == current_user.team_id
-            )
-        )
-    elif scope == 'portal':
-        scope_filters.append(model.requester_id == current_user.id)
-
-
-    # Construct the base filter
-    base_filter = sa.and_(*scope_filters, status_filter)
-
-    # Fetch ticket type counts
-    ticket_type_counts = db.session.execute(
-        sa.select(model.ticket_type, sa.func.count()).where(base_filter).group_by(model.ticket_type)
-    ).fetchall()
-
-    # Initialize counts_dict only if model isn't Change
-    counts_dict = {ticket_type: count for ticket_type, count in ticket_type_counts} if model not in [Change] else {}
-
-    # Fetch total count and add to dictionary
-    counts_dict['All'] = db.session.execute(
-        sa.select(sa.func.count()).where(base_filter)
-    ).scalar_one()
-
-    return counts_dict
+    counts_dict = count_records(model, model.ticket_type, scope)
 
+    # Change types are counted by Change.change_type_count, only the total is wanted here
+    return {'All': counts_dict['All']} if model is Change else counts_dict
 
 
 def get_subcats(category_id):
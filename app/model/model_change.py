@@ -227,73 +227,18 @@ class Change(db.Model):
 
     @classmethod
     def cab_status_count(cls):
-        cab_status_counts = db.session.execute(
-            sa.select(cls.cab_approval_status, sa.func.count().label('count'))
-            .where(cls.status == 'cab')
-            .group_by(cls.cab_approval_status)
-        ).fetchall()
-
-        total_count = sum(count for _, count in cab_status_counts)  # total for center of pie chart
-
-        # Prepare the final dictionary
-        counts_dict = {change_type: count for change_type, count in cab_status_counts}
-        # counts_dict['All'] = total_count
-
-        return counts_dict
+        from .common_methods import count_records
+        return count_records(cls, cls.cab_approval_status, 'cab', total=False)
 
     @classmethod
     def change_type_count(cls, scope):
-        # Determine the scope filter based on the passed argument
-        if scope == 'cab':
-            scope_filter = cls.status == 'cab'
-        else:
-            scope_filter = cls.status != 'closed'
-
-        # Define the main query to fetch both change_type counts and the total count
-        change_type_counts = db.session.execute(
-            sa.select(
-                cls.change_type,
-                sa.func.count().label('count')  # Labeling count correctly
-            )
-            .where(scope_filter)  # Correct placement
-            .group_by(cls.change_type)
-        ).fetchall()
-
-        # Calculate total count (for 'All')
-        total_count = sum(count for _, count in change_type_counts)
-
-        # Prepare the final dictionary
-        counts_dict = {change_type: count for change_type, count in change_type_counts}
-        counts_dict['All'] = total_count
-
-        return counts_dict
+        from .common_methods import count_records
+        return count_records(cls, cls.change_type, scope)
 
     @classmethod
     def change_risk_count(cls, change_type, scope):
-        counts_dict = {}
-
-        if scope == 'cab':
-            risk_counts = db.session.execute(
-                sa.select(cls.risk_set, sa.func.count())
-                .where(cls.status == 'cab')
-                .group_by(cls.risk_set)
-            ).all()
-
-
-        else:
-            risk_counts = db.session.execute(
-                sa.select(cls.risk_set, sa.func.count())
-                .where(cls.status != 'closed')
-                .group_by(cls.risk_set)
-            ).all()
-
-        total_count = sum(count for _, count in risk_counts)
-
-        for risk, count in risk_counts:
-            counts_dict[risk] = count
-
-        counts_dict['All'] = total_count
-        return counts_dict
+        from .common_methods import count_records
+        return count_records(cls, cls.risk_set, scope)
 
     @classmethod
     def scheduled_changes(cls):
@@ -383,7 +328,6 @@ class CabDetails(db.Model):
     cab_datetime: Mapped[Optional[datetime]] = mapped_column(db.DateTime, nullable=True)
     cab_notes: Mapped[Optional[str]] = mapped_column(db.Text, nullable=True)
 
-
     # Relationships
     attendees: Mapped[list['User']] = relationship(
         'User',
@@ -395,4 +339,12 @@ class CabDetails(db.Model):
     chaired_by: Mapped['User'] = relationship(
         'User',
         back_populates='cabs_chaired'
-    )
\ No newline at end of file
+    )
+
+
+# Open queue and dashboard paths, partial on status <> 'closed' like the ticket indexes
+sa.Index('ix_change_open_supporter', Change.supporter_id, Change.ticket_number,
+         postgresql_where=Change.status != 'closed')
+sa.Index('ix_change_open_team', Change.support_team_id, Change.ticket_number,
+         postgresql_where=Change.status != 'closed')
+sa.Index('ix_change_requester_id', Change.requester_id)
@@ -13,7 +13,7 @@ if TYPE_CHECKING:  # only used for type hinting so no circular import issues
     from model_user import Team, User
 
 from datetime import datetime, timezone, date
-from sqlalchemy import func, select, Identity
+from sqlalchemy import func, select, Identity, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import expression
 
@@ -233,79 +233,21 @@ class CmdbConfigurationItem(db.Model):
 
     @classmethod
     def category_counts(cls):
+        from .common_methods import count_records
         from .model_category import Category
-        counts_dict = {}
-
-        # Query to get category counts
-        category_counts = (
-            db.session.execute(
-                select(Category.name, func.count(CmdbConfigurationItem.id).label('count'))
-                .join(CmdbConfigurationItem, CmdbConfigurationItem.category_id == Category.id)
-                .where(CmdbConfigurationItem.status != 'disposed')
-                .group_by(Category.name)
-            )
-        ).all()
-
-        # Populate the dictionary with results
-        for category_name, count in category_counts:
-            counts_dict[category_name] = count
-
-        # Add the 'All' count
-        counts_dict['All'] = db.session.execute(
-            select(func.count()).where(CmdbConfigurationItem.status != 'disposed')
-        ).scalar()
-
-        return counts_dict
+        return count_records(cls, Category.name, join=(Category, cls.category_id == Category.id), closed='disposed')
 
     @classmethod
     def importance_counts(cls):
+        from .common_methods import count_records
         from .lookup_tables import Importance
-        counts_dict = {}
-
-        # Query to get importance counts
-        importance_counts = (
-            db.session.execute(
-                select(Importance.importance, func.count(CmdbConfigurationItem.id).label('count'))
-                .join(CmdbConfigurationItem, CmdbConfigurationItem.importance_id == Importance.id)
-                .where(CmdbConfigurationItem.status != 'disposed')
-                .group_by(Importance.importance)
-            )
-        ).all()
-
-        # Populate the dictionary with results
-        for importance_name, count in importance_counts:
-            counts_dict[importance_name] = count
-
-        # Add the 'All' count
-        counts_dict['All'] = db.session.execute(
-            select(func.count()).where(CmdbConfigurationItem.status != 'disposed')
-        ).scalar()
-
-        return counts_dict
+        return count_records(cls, Importance.importance, join=(Importance, cls.importance_id == Importance.id),
+                             closed='disposed')
 
     @classmethod
     def ticket_type_counts(cls):
-        counts_dict = {}
-
-        # Query to get ticket type counts
-        ticket_type_counts = (
-            db.session.execute(
-                select(cls.ticket_type, func.count(cls.id).label('count'))
-                .where(CmdbConfigurationItem.status != 'disposed')
-                .group_by(cls.ticket_type)
-            )
-        ).all()
-
-        # Populate the dictionary with results
-        for ticket_type, count in ticket_type_counts:
-            counts_dict[ticket_type] = count
-
-        # Add the 'All' count
-        counts_dict['All'] = db.session.execute(
-            select(func.count()).where(CmdbConfigurationItem.status != 'disposed')
-        ).scalar()
-
-        return counts_dict
+        from .common_methods import count_records
+        return count_records(cls, cls.ticket_type, closed='disposed')
 
     def __eq__(self, other):
         if not isinstance(other, CmdbConfigurationItem):
@@ -319,6 +261,11 @@ class CmdbConfigurationItem(db.Model):
         return f'<CmdbConfigurationItem id={self.id} name={self.name} ticket_type={self.ticket_type}>'
 
 
+# Case-insensitive prefix search on CI name from the CMDB tables, see apply_filters
+Index('ix_cmdb_configuration_item_name_lower', func.lower(CmdbConfigurationItem.name).label('name_lower'),
+      postgresql_ops={'name_lower': 'text_pattern_ops'})
+
+
 class CmdbHardware(CmdbConfigurationItem):
     __tablename__ = 'cmdb_hardware'
     id: Mapped[int] = mapped_column(db.Integer, db.ForeignKey('cmdb_configuration_item.id'), primary_key=True)
@@ -113,55 +113,15 @@ class Idea(db.Model):
         Calling it priority_count to be consistent with all other models.
         It actually returns counts by likelihood
         """
-        counts_dict = {}
-
-        # Base query for counting by likelihood
-        stmt = (
-            sa.select(cls.likelihood, sa.func.count())
-            .where(sa.and_(cls.status != 'closed'))
-            .group_by(cls.likelihood)
-        )
-
-        # Execute the query
-        likelihood_counts = db.session.execute(stmt).all()
-
-        # Populate the counts dictionary
-        for likelihood, count in likelihood_counts:
-            counts_dict[likelihood] = count
-
-        # Total count for all tickets of the given type and not closed
-        total_count = db.session.execute(
-            sa.select(sa.func.count())
-            .where(sa.and_(cls.status != 'closed'))
-        ).scalar()
-
-        counts_dict['All'] = total_count
-        return counts_dict
+        from .common_methods import count_records
+        return count_records(cls, cls.likelihood)
 
     @classmethod
     def tickets_category_count(cls):
+        from .common_methods import count_records
         from .model_category import Category
-        # Define the query to get category counts, excluding 'closed' status
-        stmt = (
-            sa.select(Category.name, sa.func.count().label('count'))
-            .select_from(cls)  # Explicitly sa.select from the main table
-            .join(Category, sa.and_(cls.category_id == Category.id))  # Explicit join condition
-            .where(sa.and_(cls.status != 'closed'))
-            .group_by(Category.name)
-        )
-
-        # Execute the query and populate the dictionary
-        category_counts = db.session.execute(stmt).all()
-        counts_dict = {category_name: count for category_name, count in category_counts}
-
-        # Calculate the total count for non-closed tickets
-        total_count = db.session.execute(sa.select(sa.func.count(cls.id)).where(sa.and_(cls.status != 'closed'))).scalar()
-        counts_dict['All'] = total_count
-
-        return counts_dict
-
-
-
-
+        return count_records(cls, Category.name, join=(Category, cls.category_id == Category.id))
 
 
+sa.Index('ix_idea_requester_id', Idea.requester_id)
+sa.Index('ix_idea_support_team_id', Idea.support_team_id)
@@ -105,6 +105,14 @@ class Ticket(db.Model):
         passive_deletes=True
     )
 
+    sla_ledger: Mapped[Optional["TicketSLALedger"]] = relationship(
+        "TicketSLALedger",
+        back_populates="ticket",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+
     parent_id: Mapped[Optional[int]] = mapped_column(
         db.Integer, db.ForeignKey('ticket.id', ondelete='SET NULL'), nullable=True
     )
@@ -316,3 +324,46 @@ class TicketPauseHistory(db.Model):
     def __repr__(self):
         return (f"<TicketPauseHistory(id={self.id}, ticket_id={self.ticket_id}, "
                 f"paused_at={self.paused_at}, reason_id={self.reason_id})>")
+
+
+class TicketSLALedger(db.Model):
+    """
+    Running totals of SLA time for a ticket so remaining SLA and time paused are single row reads. Business seconds
+    are settled up to counted_to whenever the ticket is paused, resumed or changes status; time since then is added
+    on read according to clock_state. Maintained by common/sla_ledger.py
+    """
+    __tablename__ = 'ticket_sla_ledger'
+
+    ticket_id: Mapped[int] = mapped_column(
+        db.Integer, db.ForeignKey('ticket.id', ondelete='CASCADE'), primary_key=True)
+    business_seconds_consumed: Mapped[float] = mapped_column(db.Float, nullable=False, default=0.0)
+    business_seconds_paused: Mapped[float] = mapped_column(db.Float, nullable=False, default=0.0)
+    counted_to: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=False)
+    # running, paused or stopped
+    clock_state: Mapped[str] = mapped_column(db.String(10), nullable=False, default='running')
+    compliance_recorded_at: Mapped[Optional[datetime]] = mapped_column(db.DateTime(timezone=True), nullable=True)
+
+    ticket: Mapped["Ticket"] = relationship(
+        "Ticket",
+        back_populates="sla_ledger"
+    )
+
+    def __repr__(self):
+        return (f"<TicketSLALedger(ticket_id={self.ticket_id}, consumed={self.business_seconds_consumed}, "
+                f"paused={self.business_seconds_paused}, clock_state={self.clock_state})>")
+
+
+# Open queue, dashboard and child-ticket paths. Nearly every read is of open tickets, so those indexes are partial on
+# status <> 'closed' and stay the size of the open queue rather than of the whole history.
+sa.Index('ix_ticket_open_number', Ticket.ticket_number, postgresql_where=Ticket.status != 'closed')
+sa.Index('ix_ticket_open_status', Ticket.status, postgresql_where=Ticket.status != 'closed')
+sa.Index('ix_ticket_open_type_priority', Ticket.ticket_type, Ticket.priority,
+         postgresql_where=Ticket.status != 'closed')
+sa.Index('ix_ticket_open_supporter', Ticket.supporter_id, Ticket.ticket_number,
+         postgresql_where=Ticket.status != 'closed')
+sa.Index('ix_ticket_open_team', Ticket.support_team_id, Ticket.ticket_number,
+         postgresql_where=Ticket.status != 'closed')
+sa.Index('ix_ticket_requester_id', Ticket.requester_id, Ticket.ticket_number)
+sa.Index('ix_ticket_parent_id', Ticket.parent_id, Ticket.ticket_number)
+sa.Index('ix_ticket_problem_id', Ticket.problem_id, Ticket.ticket_number)
+sa.Index('ix_ticket_change_id', Ticket.change_id, Ticket.ticket_number)
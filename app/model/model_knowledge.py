@@ -15,7 +15,7 @@ from sqlalchemy.sql import func, expression
 from sqlalchemy_utils.types import TSVectorType
 from sqlalchemy.event import listens_for
 from . import db
-from .common_methods import get_status_counts
+from .common_methods import count_records, get_status_counts
 from .lookup_tables import KBATypesLookup
 
 
@@ -135,15 +135,6 @@ class KnowledgeBase(db.Model):
         # Determine base filter condition
         if scope == 'portal' or scope == 'published':
             base_filter = cls.status == 'published'
-            count_stmt = sa.select(func.count()).select_from(cls).where(base_filter)
-
-            stmt_counts = (
-                sa.select(KBATypesLookup.id, func.count())
-                .select_from(cls)
-                .join(KBATypesLookup)
-                .where(base_filter)
-                .group_by(KBATypesLookup.id)
-            )
 
         elif scope == 'top':
             # Get top N most-viewed published articles
@@ -153,46 +144,15 @@ class KnowledgeBase(db.Model):
                 .where(cls.times_viewed > 0)
                 .order_by(cls.times_viewed.desc())
                 .limit(10)  # hardcoded to 10 as this is typical. Todo make variable in config?
-                .subquery()
-            )
-
-            count_stmt = sa.select(func.count()).select_from(top_articles_subq)
-
-            article_alias = sa.orm.aliased(cls)
-            stmt_counts = (
-                sa.select(KBATypesLookup.id, func.count())
-                .select_from(article_alias)
-                .join(KBATypesLookup)
-                .where(article_alias.id.in_(sa.select(top_articles_subq.c.id)))
-                .group_by(KBATypesLookup.id)
             )
+            base_filter = cls.id.in_(top_articles_subq)
 
         else:
             # scope == 'all'
             base_filter = cls.status != 'archived'
-            count_stmt = sa.select(func.count()).select_from(cls).where(base_filter)
 
-            stmt_counts = (
-                sa.select(KBATypesLookup.id, func.count())
-                .select_from(cls)
-                .join(KBATypesLookup)
-                .where(base_filter)
-                .group_by(KBATypesLookup.id)
-            )
-
-        # Execute total count
-        counts_dict = {'All': db.session.execute(count_stmt).scalar()}
-
-        # Execute grouped counts
-        article_type_counts = db.session.execute(stmt_counts).all()
-        for article_type_id, count in article_type_counts:
-            kba_type = db.session.execute(
-                sa.select(KBATypesLookup.article_type)
-                .where(KBATypesLookup.id == article_type_id)
-            ).scalar_one_or_none()
-            counts_dict[kba_type] = count
-
-        return counts_dict
+        return count_records(cls, KBATypesLookup.article_type, where=[base_filter],
+                             join=(KBATypesLookup, cls.article_type_id == KBATypesLookup.id))
 
     @classmethod
     def get_published_articles(cls):
@@ -100,3 +100,13 @@ class Notes(db.Model):
         db.Boolean, nullable=False, server_default=expression.false(), default=False)
 
 
+# Journals and notes are always read for one parent record at a time
+sa.Index('ix_comms_journal_ticket_id', CommsJournal.ticket_id)
+sa.Index('ix_comms_journal_problem_id', CommsJournal.problem_id)
+sa.Index('ix_notes_ticket_id', Notes.ticket_id)
+sa.Index('ix_notes_problem_id', Notes.problem_id)
+sa.Index('ix_notes_change_id', Notes.change_id)
+sa.Index('ix_notes_release_id', Notes.release_id)
+sa.Index('ix_notes_idea_id', Notes.idea_id)
+sa.Index('ix_notes_cmdb_id', Notes.cmdb_id)
+sa.Index('ix_notes_knowledgebase_id', Notes.knowledgebase_id)
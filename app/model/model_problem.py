@@ -10,7 +10,7 @@ if TYPE_CHECKING:  # only used for type hinting so no circular import issues
     from model_user import Team, User
 
 from datetime import datetime, timezone
-from sqlalchemy import Identity
+from sqlalchemy import Identity, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from . import db
 
@@ -211,3 +211,12 @@ class FiveWhysAnalysis(db.Model):
     preventive_actions: Mapped[Optional[str]] = mapped_column(db.Text, nullable=True, default=None)
 
 
+# Open queue, dashboard and child-problem paths, partial on status <> 'closed' like the ticket indexes
+Index('ix_problem_open_type_priority', Problem.ticket_type, Problem.priority,
+      postgresql_where=Problem.status != 'closed')
+Index('ix_problem_open_supporter', Problem.supporter_id, Problem.ticket_number,
+      postgresql_where=Problem.status != 'closed')
+Index('ix_problem_open_team', Problem.support_team_id, Problem.ticket_number,
+      postgresql_where=Problem.status != 'closed')
+Index('ix_problem_requester_id', Problem.requester_id)
+Index('ix_problem_change_id', Problem.change_id, Problem.ticket_number)
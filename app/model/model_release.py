@@ -8,7 +8,6 @@ if TYPE_CHECKING:  # only used for type hinting so no circular import issues
     from model_notes import Notes
 
 from datetime import datetime, timezone
-from flask_security import current_user
 import sqlalchemy as sa
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..model.relationship_tables import release_cis
@@ -172,55 +171,21 @@ class Release(db.Model):
 
     @classmethod
     def category_counts(cls, scope):
+        from .common_methods import count_records
         from .model_category import Category
-        counts_dict = {}
-
-        stmt = (sa.select(Category.name, sa.func.count(cls.id).label('count'))
-                .join(cls, cls.category_id == Category.id)
-                .group_by(Category.name)
-                .where(cls.status != 'closed'))
-
-        if scope == 'me':
-            stmt = stmt.where(Release.supporter_id == current_user.id)
-
-        if scope == 'team':
-            team_id = current_user.team_id
-            stmt = stmt.where(sa.and_(Release.supporter_id != current_user.id, Release.support_team_id == team_id))
-
-        # Query to get category counts
-        category_counts = (db.session.execute(stmt)
-                           .all())
-
-        # Populate the dictionary with results
-        for category_name, count in category_counts:
-            counts_dict[category_name] = count
-
-        return counts_dict
+        return count_records(cls, Category.name, scope, join=(Category, cls.category_id == Category.id), total=False)
 
     @classmethod
     def release_type_count(cls, scope):
-        stmt = (sa.select(ReleaseTypesLookup.release_type, sa.func.count(cls.id).label('count'))  # Labeling count
-                .join(cls, cls.release_type_id == ReleaseTypesLookup.id)
-                .group_by(ReleaseTypesLookup.release_type))
-
-        if scope == 'me':
-            stmt = stmt.where(cls.supporter_id == current_user.id)
-
-        if scope == 'team':
-            stmt = stmt.where(sa.and_(
-                cls.supporter_id != current_user.id),
-                cls.support_team_id == current_user.team_id)
-
-        # Define the main query to fetch both change_type counts and the total count
-        release_type_counts = db.session.execute(stmt).all()
-
-        # Calculate total count (for 'All')
-        total_count = sum(count for _, count in release_type_counts)
-        # Prepare the final dictionary
-        counts_dict = {release_type: count for release_type, count in release_type_counts}
-        counts_dict['All'] = total_count
-        return counts_dict
-
-
-
-
+        from .common_methods import count_records
+        return count_records(cls, ReleaseTypesLookup.release_type, scope, where=[],  # closed releases included
+                             join=(ReleaseTypesLookup, cls.release_type_id == ReleaseTypesLookup.id))
+
+
+# Open queue and child-release paths, partial on status <> 'closed' like the ticket indexes
+sa.Index('ix_release_open_supporter', Release.supporter_id, Release.ticket_number,
+         postgresql_where=Release.status != 'closed')
+sa.Index('ix_release_open_team', Release.support_team_id, Release.ticket_number,
+         postgresql_where=Release.status != 'closed')
+sa.Index('ix_release_requester_id', Release.requester_id)
+sa.Index('ix_release_change_id', Release.change_id, Release.ticket_number)
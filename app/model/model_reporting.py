@@ -0,0 +1,87 @@
+from datetime import date
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+from typing import Optional
+from . import db
+
+# Upper bounds in seconds of the buckets SLA durations are counted into for percentiles. The last bucket is open ended
+DURATION_BUCKETS = (
+    15 * 60, 30 * 60, 60 * 60, 2 * 3600, 4 * 3600, 8 * 3600, 16 * 3600, 24 * 3600,
+    2 * 86400, 3 * 86400, 5 * 86400, 7 * 86400, 14 * 86400, 30 * 86400, None
+)
+
+# Tables whose records are counted in DashboardCounter, and the columns of theirs it can count by
+COUNTED_TABLES = ('ticket', 'problem', 'change', 'release', 'knowledgebase', 'idea', 'cmdb_configuration_item')
+COUNTED_COLUMNS = ('ticket_type', 'status', 'priority')
+
+
+class SLAComplianceRollup(db.Model):
+    """
+    Daily SLA outcome counters per team and priority, added to as each ticket is resolved so compliance reports
+    read a few hundred rollup rows instead of scanning tickets. Maintained by common/sla_compliance.py
+    """
+    __tablename__ = 'sla_compliance_rollup'
+    __table_args__ = (
+        sa.UniqueConstraint('day', 'team_id', 'priority', postgresql_nulls_not_distinct=True),
+    )
+
+    id: Mapped[int] = mapped_column(sa.Identity(), primary_key=True)
+    day: Mapped[date] = mapped_column(db.Date, nullable=False)
+    team_id: Mapped[Optional[int]] = mapped_column(db.Integer, nullable=True)  # no FK so rollups outlive the team
+    priority: Mapped[Optional[str]] = mapped_column(db.String(2), nullable=True)
+
+    tickets: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0)
+    respond_met: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0)
+    respond_breached: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0)
+    resolve_met: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0)
+    resolve_breached: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0)
+    paused: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0)  # tickets with any SLA pause
+
+    # totals for means, and counts behind them as not every ticket records a response
+    respond_seconds: Mapped[float] = mapped_column(db.Float, nullable=False, default=0.0)
+    respond_count: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0)
+    resolve_seconds: Mapped[float] = mapped_column(db.Float, nullable=False, default=0.0)
+    resolve_count: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0)
+
+
+class SLADurationHistogram(db.Model):
+    """
+    Counts of time to respond and time to resolve per DURATION_BUCKETS bucket, alongside SLAComplianceRollup, so
+    percentiles can be estimated for any period without keeping each ticket's duration
+    """
+    __tablename__ = 'sla_duration_histogram'
+    __table_args__ = (
+        sa.UniqueConstraint('day', 'team_id', 'priority', 'measure', 'bucket', postgresql_nulls_not_distinct=True),
+    )
+
+    id: Mapped[int] = mapped_column(sa.Identity(), primary_key=True)
+    day: Mapped[date] = mapped_column(db.Date, nullable=False)
+    team_id: Mapped[Optional[int]] = mapped_column(db.Integer, nullable=True)  # no FK so rollups outlive the team
+    priority: Mapped[Optional[str]] = mapped_column(db.String(2), nullable=True)
+    measure: Mapped[str] = mapped_column(db.String(7), nullable=False)  # respond or resolve
+    bucket: Mapped[int] = mapped_column(db.SmallInteger, nullable=False)  # index into DURATION_BUCKETS
+    count: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0)
+
+
+class DashboardCounter(db.Model):
+    """
+    Number of records of each COUNTED_TABLES table per ticket type, status, priority, team and supporter, so the
+    dashboard charts read a few hundred counter rows instead of grouping the records themselves. Kept up to date as
+    records are written and repaired nightly by common/dashboard_counters.py
+    """
+    __tablename__ = 'dashboard_counters'
+    __table_args__ = (
+        sa.UniqueConstraint('model', 'ticket_type', 'status', 'priority', 'support_team_id', 'supporter_id',
+                            postgresql_nulls_not_distinct=True),
+    )
+
+    id: Mapped[int] = mapped_column(sa.Identity(), primary_key=True)
+    model: Mapped[str] = mapped_column(db.String(30), nullable=False)  # table name of the records counted
+    ticket_type: Mapped[Optional[str]] = mapped_column(db.String(50), nullable=True)
+    status: Mapped[Optional[str]] = mapped_column(db.String(50), nullable=True)
+    priority: Mapped[Optional[str]] = mapped_column(db.String(2), nullable=True)
+    # named as on the records so common_methods.scope_filters applies to counters too. No FKs so counters outlive
+    # the team or user
+    support_team_id: Mapped[Optional[int]] = mapped_column(db.Integer, nullable=True)
+    supporter_id: Mapped[Optional[int]] = mapped_column(db.Integer, nullable=True)
+    count: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0)
@@ -1,7 +1,7 @@
 from typing import Optional
 from datetime import datetime
 from flask_security import RoleMixin, UserMixin
-from sqlalchemy import and_, Identity, select
+from sqlalchemy import and_, func, Identity, Index, select
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import expression
 from . import db
@@ -437,3 +437,12 @@ class User(UserMixin, db.Model):
 
     def __repr__(self):
         return self.full_name
+
+
+# Case-insensitive prefix search from the people tables (lower(column) LIKE 'value%', see apply_filters)
+Index('ix_user_full_name_lower', func.lower(User.full_name).label('full_name_lower'),
+      postgresql_ops={'full_name_lower': 'text_pattern_ops'})
+Index('ix_user_email_lower', func.lower(User.email).label('email_lower'),
+      postgresql_ops={'email_lower': 'text_pattern_ops'})
+Index('ix_user_phone_lower', func.lower(User.phone).label('phone_lower'),
+      postgresql_ops={'phone_lower': 'text_pattern_ops'})
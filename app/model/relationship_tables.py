@@ -77,7 +77,9 @@ cmdb_hardware_dependencies = db.Table(
     'cmdb_hardware _dependencies',
     db.metadata,
     db.Column('parent_id', db.Integer, db.ForeignKey('cmdb_configuration_item.id'), primary_key=True),
-    db.Column('child_id', db.Integer, db.ForeignKey('cmdb_configuration_item.id'), primary_key=True)
+    db.Column('child_id', db.Integer, db.ForeignKey('cmdb_configuration_item.id'), primary_key=True),
+    # the primary key covers lookups by parent, this covers what depends on a CI
+    db.Index('ix_cmdb_hardware_dependencies_child_id', 'child_id')
 )
 
 # Association table for CmdbSoftware installed on CmdbHardware
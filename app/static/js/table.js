@@ -54,7 +54,12 @@ export class CustomTabulator {
         this.selector = selector;
         this.url = url;
         this.paginate = paginate;
-
+        // with 'paging': 'cursor' in args pages are fetched by keyset cursor rather than by offset
+        this.cursorPaging = this.apiArgs['paging'] === 'cursor';
+        this.cursors = {}; // page number -> cursor that fetches it, filled in as pages are loaded
+        this.cursorSize = null;
+        this.totalExact = true; // false when the server estimated the total rather than counting it
+        this.responses = new Map(); // request body -> {etag, data} of the last response to it, oldest first
 
         this.init();
     }
@@ -76,19 +81,24 @@ export class CustomTabulator {
             paginationSize: 10,
             paginationMode: 'remote',
             paginationSizeSelector: [10, 20, 50, 100],
-            paginationCounter: 'rows',
+            paginationCounter: this.cursorPaging && !this.apiArgs['exact_total'] ? false : this.rowCounter,
             ajaxURL: this.url,
             ajaxConfig: 'POST',
             ajaxParams: this.apiArgs,
             ajaxContentType: 'json',
+            ajaxRequestFunc: this.cursorPaging ? this.cursorRequest : this.request,
             ajaxResponse: (url, params, response) => {
                 this.updateFilterInfo(response['filter_description']);
                 if (this.paginate) {
-                    return {
+                    const page = {
                         last_page: response.last_page,
-                        last_row: response.last_row,
                         data: response.data
                     };
+                    if (response.last_row !== undefined) {
+                        page.last_row = response.last_row; // left out in cursor paging unless an exact total was asked for
+                        this.totalExact = response.total_exact !== false;
+                    }
+                    return page;
                 } else {
                     return response.data; // Return only the data array when pagination is disabled
                 }
@@ -101,6 +111,60 @@ export class CustomTabulator {
 
     }
 
+    // Sends the cursor for the requested page, if there is one, and keeps the cursor of the page after it
+    cursorRequest = (url, config, params) => {
+        if (params.page === 1 || params.size !== this.cursorSize) {
+            this.cursors = {}; // cursors only hold for the filter and page size they were fetched with
+            this.cursorSize = params.size;
+        }
+        const after = this.cursors[params.page];
+        return this.request(url, config, after ? {...params, after: after} : params)
+            .then((response) => {
+                if (response.next_cursor) {
+                    this.cursors[params.page + 1] = response.next_cursor;
+                }
+                return response;
+            });
+    };
+
+    // Posts params as JSON. A page fetched before is asked for with its ETag, and if the server answers 304 Not
+    // Modified the copy held here is used rather than fetching and rendering the same rows again
+    request = async (url, config, params) => {
+        const body = JSON.stringify(params);
+        const cached = this.responses.get(body);
+        const headers = {'Content-Type': 'application/json', 'Accept': 'application/json'};
+        if (cached) {
+            headers['If-None-Match'] = cached.etag;
+        }
+
+        const response = await fetch(url, {...config, headers: headers, body: body, credentials: 'same-origin'});
+        if (response.status === 304 && cached) {
+            return cached.data;
+        }
+        if (!response.ok) {
+            console.error(`Ajax Load Error - Connection Error: ${response.status}`, response.statusText);
+            throw response;
+        }
+
+        const data = await response.json();
+        const etag = response.headers.get('ETag');
+        this.responses.delete(body);
+        if (etag) {
+            if (this.responses.size >= 50) {
+                this.responses.delete(this.responses.keys().next().value);
+            }
+            this.responses.set(body, {etag: etag, data: data});
+        }
+        return data;
+    };
+
+    // Tabulator's 'rows' counter, marking totals the server estimated
+    rowCounter = (pageSize, currentRow, currentPage, totalRows) => {
+        const first = totalRows ? currentRow : 0;
+        const last = Math.min(currentRow + pageSize - 1, totalRows);
+        return `Showing ${first}-${last} of ${this.totalExact ? '' : 'about '}${totalRows} rows`;
+    };
+
     // Method to update the filter info
     updateFilterInfo(filterDescription) {
         if (this.filterInfoElement && filterDescription !== 'None') {
@@ -188,12 +252,45 @@ export class CustomTabulator {
                 return `${filename}.${extension}`;
             }
         }).then((result) => {
-            if (result.isConfirmed) {
+            if (!result.isConfirmed) {
+                return;
+            }
+            if (this.apiArgs['model'] && (extension === 'csv' || extension === 'xlsx')) {
+                this.exportTable(extension, result.value.slice(0, -(extension.length + 1)));
+            } else {
                 this.table.download(extension, result.value);
             }
         });
     }
 
+    // Every row of the table, with its current scope and filters, written out by the server rather than in the
+    // browser from the pages loaded so far
+    async exportTable(extension, filename) {
+        const filters = this.table.getFilters(true).map(({field, type, value}) => ({field, type, value}));
+        // The columns the user can see, under the titles they see, as table.download would write them
+        const columns = this.table.getColumns()
+            .filter((column) => column.isVisible() && column.getField() && column.getDefinition().download !== false)
+            .map((column) => ({field: column.getField(), title: column.getDefinition().title}));
+        const response = await fetch('/api/export-table/', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({
+                ...this.apiArgs, filter: filters, format: extension, filename: filename, columns: columns,
+            }),
+        });
+        if (!response.ok) {
+            const error = await response.json().catch(() => ({}));
+            await showSwal('Error', error.error || 'The export failed', 'error');
+            return;
+        }
+
+        const link = document.createElement('a');
+        link.href = URL.createObjectURL(await response.blob());
+        link.download = `${filename}.${extension}`;
+        link.click();
+        URL.revokeObjectURL(link.href);
+    }
+
     getTableInstance() {
         return this.table;
     }
@@ -69,6 +69,7 @@ export class ChangeAdminDashboard {
             '/api/get_paginated/',
             '#all-changes-table',
             {
+                'paging': 'cursor',
                 'scope': 'all',
                 'timezone': timezone,
                 'model': 'Change'
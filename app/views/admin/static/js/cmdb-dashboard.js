@@ -87,6 +87,7 @@ class CmdbAdminDashboard {
             '/api/get_paginated/',
             '#all-cmdb-table',
             {
+                'paging': 'cursor',
                 'scope': 'all',
                 'timezone': timezone,
                 'model': 'cmdb',
@@ -1,5 +1,6 @@
 import {CustomTabulator} from '../../../../../static/js/table.js';
 import {handleTableEdit} from './table-edit.js';
+import {showSwal} from '../../../../../static/js/includes/form-classes/form-utils.js';
 
 class SlaConfigClass {
     constructor() {
@@ -24,6 +25,22 @@ class SlaConfigClass {
         );
         const tableInstance = this.prioritiesTable.getTableInstance();
         tableInstance.on('cellEdited', (cell) => handleTableEdit('/api/sla/set-app-default-sla-priority/', cell));
+        document.getElementById('recalculate-slas-btn').addEventListener('click', () => this.recalculateOpenSlas());
+    }
+
+    async recalculateOpenSlas() {
+        // Priority changes only apply to new tickets until open ones are recalculated
+        const confirm = await showSwal('Recalculate SLAs?', 'Open tickets will be moved to the current priority targets.', 'question');
+        if (!confirm.isConfirmed) {
+            return;
+        }
+        const response = await fetch('/api/sla/recalculate-open-slas/', {method: 'POST'});
+        const data = await response.json();
+        if (!response.ok) {
+            await showSwal('Error', data.error || 'SLAs could not be recalculated', 'error');
+            return;
+        }
+        await showSwal('Done', `${data.updated} open tickets updated.`, 'success');
     }
 
     async getPrioritiesColumns() {
@@ -59,6 +59,7 @@ class IdeaAdminDashboard {
             '/api/get_paginated/',
             '#all-idea-table',
             {
+                'paging': 'cursor',
                 'scope': 'all',
                 'timezone': timezone,
                 'model': 'idea'
@@ -84,6 +84,7 @@ class InteractionAdminDashboard {
             '/api/get_paginated/',
             '#all-tickets-table',
             {
+                'paging': 'cursor',
                 'scope': 'all',
                 'timezone': timezone,
                 'model': 'interaction'
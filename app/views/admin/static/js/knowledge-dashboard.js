@@ -68,6 +68,7 @@ class KnowledgeAdminDashboard {
             '/api/get_paginated/',
             '#all-knowledge-table',
             {
+                'paging': 'cursor',
                 'scope': 'all',
                 'timezone': timezone,
                 'model': 'knowledge'
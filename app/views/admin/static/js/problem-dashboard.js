@@ -70,6 +70,7 @@ class ProblemAdminDashboard {
             '/api/get_paginated/',
             '#all-problems-table',
             {
+                'paging': 'cursor',
                 'scope': 'all',
                 'timezone': timezone,
                 'model': 'problem'
@@ -58,6 +58,7 @@ class ReleaseAdminDashboard {
             '/api/get_paginated/',
             '#all-releases-table',
             {
+                'paging': 'cursor',
                 'scope': 'all',
                 'model': 'release'
             },
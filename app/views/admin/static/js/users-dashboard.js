@@ -102,6 +102,7 @@ export class UserDashboard {
             '/api/get_paginated/',
             '#users-table',
             {
+                paging: 'cursor',
                 scope: 'all',
                 timezone: timezone,
                 model: 'users'
@@ -5,9 +5,10 @@ from flask_login import current_user
 
 from ...model.model_change import Change
 from ...model.model_user import User
-from ...model.lookup_tables import AppDefaults, ChangeTypeLookup, RiskLookup, StatusLookup
+from ...model.lookup_tables import AppDefaults
 from ...common.common_utils import send_email
 from ...common.exception_handler import log_exception
+from ...common.filter_vocabulary import resolve_filter_name
 from ...model import db
 
 
@@ -18,34 +19,16 @@ def handle_change_params(stmt, params):
     p_name = params['name']
     p_name = p_name.replace('\n', ' ')
 
-    change_types = {
-        change_type.change_type for change_type in
-        db.session.execute(
-            sa.select(ChangeTypeLookup)
-        ).scalars().all()
-    }
-
-    risks = {
-        risk.risk for risk in db.session.execute(
-            sa.select(RiskLookup)
-        ).scalars().all()
-    }
-
-    statuses = {
-        status.status for status in
-        db.session.execute(
-            sa.select(StatusLookup)
-        ).scalars().all()
-    }
+    kind, _ = resolve_filter_name(p_name, 'risk', 'change_type', 'status')
 
-    if p_name in risks:
+    if kind == 'risk':
         return stmt.where(Change.risk_set == p_name), f'Change with risk \'{params["name"]}\''
 
-    elif p_name in change_types:
-        return stmt.where(Change.change_type == p_name), f'Change with risk \'{params["name"]}\''
+    elif kind == 'change_type':
+        return stmt.where(Change.change_type == p_name), f'Change with type \'{params["name"]}\''
 
-    elif p_name in statuses:
-        return stmt.where(Change.status == p_name), f'Change with risk \'{params["name"]}\''
+    elif kind == 'status':
+        return stmt.where(Change.status == p_name), f'Change with status \'{params["name"]}\''
 
     else:
         return stmt, 'No filtering applied'
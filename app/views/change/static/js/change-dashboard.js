@@ -54,6 +54,7 @@ class ChangeDashboard {
             '/api/get_paginated/',
             '#all-changes-table',
             {
+                'paging': 'cursor',
                 'scope': 'all',
                 'timezone': timezone,
                 'model': 'change'
@@ -71,6 +72,7 @@ class ChangeDashboard {
             '/api/get_paginated/',
             '#cab-tickets-table',
             {
+                'paging': 'cursor',
                 'scope': 'cab',
                 'timezone': timezone,
                 'model': 'change'
@@ -51,6 +51,7 @@ class CmdbDashboard {
             '/api/get_paginated/',
             '#all-cis-table',
             {
+                'paging': 'cursor',
                 'scope': 'all',
                 'timezone': timezone,
                 'model': 'cmdb'
@@ -1,9 +1,9 @@
 from flask import render_template
 from flask_security import login_required, current_user
 import sqlalchemy as sa
+from sqlalchemy.orm import aliased
 from . import dashboard_bp
 from .form import DashboardForm
-from ...common.common_utils import get_highest_ticket_number, check_sla_breach
 from ...model import db
 from ...model.model_interaction import Ticket
 from ...model.model_user import Team, User
@@ -16,92 +16,93 @@ def dashboard():
     form.dash_title = "Dashboard"
     form.dash_subtitle = "Current Work Load"
 
-    check_sla_breach()  # Update SLA breach flags
+    # SLA breach flags are kept current by the breach scheduler in common/sla_scheduler.py
 
-    # Total tickets
-    total = db.session.execute(
-        sa.select(sa.func.count())
-        .select_from(Ticket)
-        .where(Ticket.status != 'closed')
-    ).scalar()
-
-    # Fetch agents and their ticket counts
-    agents_with_counts = db.session.execute(
-        sa.select(
-            User.id,
-            User.full_name,
-            User.team_id,
-            Team.name,
-            sa.func.count(Ticket.id)
-        )
-        .join(Ticket, User.id == Ticket.supporter_id)
-        .join(Team, User.team_id == Team.id, isouter=True)
-        .where(Ticket.status != 'Closed')
-        .group_by(User.id, User.full_name, User.team_id, Team.name)
-    ).all()
+    workload = open_ticket_workload()
+    total = workload['total']
 
     agent_tickets = [
         {
-            'supporter': full_name,
-            'ticket_count': ticket_count,
-            'percent': round(ticket_count / total * 100) if total else 0,
-            'team': team_name or "No Team"
+            'supporter': agent['name'],
+            'ticket_count': agent['ticket_count'],
+            'percent': round(agent['ticket_count'] / total * 100) if total else 0,
+            'team': agent['team'] or "No Team"
         }
-        for user_id, full_name, team_id, team_name, ticket_count in agents_with_counts
+        for agent in workload['agents']
     ]
 
-    # Fetch team ticket counts and names
-    all_teams = db.session.execute(
-        sa.select(Ticket.support_team_id)
-        .where(Ticket.support_team_id.isnot(None))
-        .distinct()
-    ).scalars().all()
-
-    team_counts = db.session.execute(
-        sa.select(Ticket.support_team_id, sa.func.count())
-        .where(Ticket.support_team_id.isnot(None))
-        .group_by(Ticket.support_team_id)
-    ).all()
-
-    team_names = db.session.execute(
-        sa.select(Team.id, Team.name)
-        .where(Team.id.in_(all_teams))
-    ).all()
-
-    team_name_dict = {team_id: name for team_id, name in team_names}
-    team_count_dict = {team_id: count for team_id, count in team_counts}
-
     team_tickets = [
         {
-            'team': team_name_dict.get(team_id, "Unknown"),
-            'ticket_count': team_count_dict.get(team_id, 0),
-            'percent': round(team_count_dict.get(team_id, 0) / total * 100) if total else 0
+            'team': team['name'] or "Unknown",
+            'ticket_count': team['ticket_count'],
+            'percent': round(team['ticket_count'] / total * 100) if total else 0
         }
-        for team_id in all_teams
+        for team in workload['teams']
     ]
 
-    # Reusable helper for ticket counts
-    def count_tickets(filter_conditions):
-        return db.session.execute(
-            sa.select(sa.func.count())
-            .select_from(Ticket)
-            .where(*filter_conditions)
-        ).scalar() or 0
-
-    # Specific ticket counts
-    incidents_total_open = count_tickets([Ticket.status != 'closed', Ticket.ticket_type == 'Incident'])
-    requests_total_open = count_tickets([Ticket.status != 'closed', Ticket.ticket_type == 'Request'])
-    open_sla_respond_breach = count_tickets([Ticket.sla_response_breach, Ticket.status != 'closed'])
-    open_sla_resolve_breach = count_tickets([Ticket.sla_resolve_breach, Ticket.status != 'closed'])
-
     return render_template('dashboard/dashboard.html',
-                           incidents_total_open=incidents_total_open,
-                           requests_total_open=requests_total_open,
-                           open_sla_respond_breach=open_sla_respond_breach,
-                           open_sla_resolve_breach=open_sla_resolve_breach,
+                           incidents_total_open=workload['incidents'],
+                           requests_total_open=workload['requests'],
+                           open_sla_respond_breach=workload['response_breaches'],
+                           open_sla_resolve_breach=workload['resolve_breaches'],
                            form=form,
                            agent_tickets=agent_tickets,
                            team_tickets=team_tickets,
                            total_tickets=total,
-                           highest_number=get_highest_ticket_number(Ticket))
+                           highest_number=workload['highest_number'])
+
+
+def open_ticket_workload():
+    """
+    Everything the dashboard shows about open tickets, from one pass over them: GROUPING SETS give the overall
+    totals, a row per supporter and a row per support team in the same result, and the per type and SLA breach
+    counts are FILTERed counts alongside each. The next ticket number rides along as a scalar subquery.
+
+    Returns:
+        dict: total, incidents, requests, response_breaches and resolve_breaches of all open tickets,
+        highest_number as get_highest_ticket_number gives it, agents as [{'name', 'team', 'ticket_count'}] and
+        teams as [{'name', 'ticket_count'}].
+    """
+    supporter = aliased(User)
+    supporter_team = aliased(Team)
+    support_team = aliased(Team)
+    by_supporter = (Ticket.supporter_id, supporter.full_name, supporter_team.name)
+    by_team = (Ticket.support_team_id, support_team.name)
+
+    rows = db.session.execute(
+        sa.select(
+            sa.func.grouping(Ticket.supporter_id, Ticket.support_team_id).label('grouped'),
+            Ticket.supporter_id,
+            supporter.full_name.label('supporter_name'),
+            supporter_team.name.label('supporter_team_name'),
+            Ticket.support_team_id,
+            support_team.name.label('support_team_name'),
+            sa.func.count().label('total'),
+            sa.func.count().filter(Ticket.ticket_type == 'Incident').label('incidents'),
+            sa.func.count().filter(Ticket.ticket_type == 'Request').label('requests'),
+            sa.func.count().filter(Ticket.sla_response_breach).label('response_breaches'),
+            sa.func.count().filter(Ticket.sla_resolve_breach).label('resolve_breaches'),
+            sa.select(sa.func.max(Ticket.ticket_number)).scalar_subquery().label('highest_number'),
+        )
+        .outerjoin(supporter, supporter.id == Ticket.supporter_id)
+        .outerjoin(supporter_team, supporter_team.id == supporter.team_id)
+        .outerjoin(support_team, support_team.id == Ticket.support_team_id)
+        .where(Ticket.status != 'closed')
+        .group_by(sa.func.grouping_sets(sa.tuple_(), sa.tuple_(*by_supporter), sa.tuple_(*by_team)))
+        .order_by(supporter.full_name, support_team.name)
+    ).all()
 
+    # grouped has a bit set for each column rolled up: 2 supporter_id, 1 support_team_id. The () grouping set gives
+    # the totals row even when no ticket is open
+    workload = {'agents': [], 'teams': []}
+    for row in rows:
+        if row.grouped == 3:
+            workload.update({key: getattr(row, key) for key in
+                             ('total', 'incidents', 'requests', 'response_breaches', 'resolve_breaches')})
+            workload['highest_number'] = row.highest_number + 1 if row.highest_number else 1001
+        elif row.grouped == 1 and row.supporter_id is not None:
+            workload['agents'].append({'name': row.supporter_name, 'team': row.supporter_team_name,
+                                       'ticket_count': row.total})
+        elif row.grouped == 2 and row.support_team_id is not None:
+            workload['teams'].append({'name': row.support_team_name, 'ticket_count': row.total})
+    return workload
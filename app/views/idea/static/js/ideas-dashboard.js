@@ -39,6 +39,7 @@ export class IdeasDashboard {
             '/api/get_paginated/',
             '#all-ideas-table',
             {
+                'paging': 'cursor',
                 'scope': 'all',
                 'timezone': timezone,
                 'model': 'idea',
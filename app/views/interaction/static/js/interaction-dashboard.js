@@ -68,6 +68,7 @@ class InteractionDashboard {
             '/api/get_paginated/',
             '#my-tickets-table',
             {
+                'paging': 'cursor',
                 'scope': 'me',
                 'timezone': timezone,
                 'model': 'interaction'
@@ -81,6 +82,7 @@ class InteractionDashboard {
             '/api/get_paginated/',
             '#team-tickets-table',
             {
+                'paging': 'cursor',
                 'scope': 'team',
                 'timezone': timezone,
                 'model': 'interaction'
@@ -94,6 +96,7 @@ class InteractionDashboard {
             '/api/get_paginated/',
             '#all-tickets-table',
             {
+                'paging': 'cursor',
                 'scope': 'all',
                 'timezone': timezone,
                 'model': 'interaction'
@@ -22,6 +22,7 @@ export class KnowledgeDashboard {
             '/api/get_paginated/',
             '#all-knowledge-table',
             {
+                'paging': 'cursor',
                 'scope': 'all',
                 'model': 'knowledge'
             },
@@ -49,6 +49,7 @@ export class PortalIdeasDashboardClass {
             '/api/get_paginated/',
             '#all-ideas-table',
             {
+                'paging': 'cursor',
                 'scope': 'all',
                 'timezone': timezone,
                 'model': 'idea',
@@ -64,6 +65,7 @@ export class PortalIdeasDashboardClass {
             '/api/get_paginated/',
             '#votable-ideas-table',
             {
+                'paging': 'cursor',
                 'scope': 'votable',
                 'timezone': timezone,
                 'model': 'idea',
@@ -50,6 +50,7 @@ export class InteractionDashboard {
             '/api/get_paginated/',
             '#my-tickets-table',
             {
+                'paging': 'cursor',
                 'scope': 'portal',
                 'timezone': timezone,
                 'model': 'interaction'
@@ -68,6 +68,7 @@ export class ProblemDashboard {
             '/api/get_paginated/',
             '#my-problems-table',
             {
+                'paging': 'cursor',
                 'scope': 'me',
                 'timezone': timezone,
                 'model': 'problem'
@@ -85,6 +86,7 @@ export class ProblemDashboard {
             '/api/get_paginated/',
             '#team-problems-table',
             {
+                'paging': 'cursor',
                 'scope': 'team',
                 'timezone': timezone,
                 'model': 'problem'
@@ -102,6 +104,7 @@ export class ProblemDashboard {
             '/api/get_paginated/',
             '#all-problems-table',
             {
+                'paging': 'cursor',
                 'scope': 'all',
                 'timezone': timezone,
                 'model': 'problem'
@@ -68,6 +68,7 @@ export class ReleaseDashboard {
             '/api/get_paginated/',
             '#my-releases-table',
             {
+                'paging': 'cursor',
                 'scope': 'me',
                 'timezone': timezone,
                 'model': 'release'
@@ -85,6 +86,7 @@ export class ReleaseDashboard {
             '/api/get_paginated/',
             '#team-releases-table',
             {
+                'paging': 'cursor',
                 'scope': 'team',
                 'timezone': timezone,
                 'model': 'release'
@@ -102,6 +104,7 @@ export class ReleaseDashboard {
             '/api/get_paginated/',
             '#all-releases-table',
             {
+                'paging': 'cursor',
                 'scope': 'all',
                 'timezone': timezone,
                 'model': 'release'
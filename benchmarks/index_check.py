@@ -0,0 +1,167 @@
+"""
+EXPLAIN checks for the index pack on the queue, dashboard and child-record paths:
+
+    open queues         get_paginated_results with no scope, 'me', 'team' and 'portal'
+    dashboard counts    get_priority_counts, get_status_counts and the open ticket counters
+    child records       get_children for tickets, problems and releases of a parent record
+    journals            notes and comms journal entries of one record
+    CMDB                what depends on a hardware CI
+
+Each hot query is built the way the app builds it, explained against the configured Postgres database and the plan
+is searched for the index it should use. A small or freshly seeded database is cheaper to read end to end than
+through an index, so by default sequential scans are switched off for the checks. That asks whether the planner can
+answer the query from the index at all, which is what a missing index or a predicate that does not match a partial
+index gets wrong. Use --natural against a database with production sized tables to check the plans it would really
+choose.
+
+Run from the repository root after `flask db upgrade`:
+
+    python benchmarks/index_check.py                    # check every query, sequential scans off
+    python benchmarks/index_check.py --natural          # leave the planner settings alone
+    python benchmarks/index_check.py --verbose          # print the plan of every query
+
+Exits with status 1 if any query is not answered from its index. FLASK_CONFIG picks the database as it does for the
+app. Nothing is written, the checks run in a transaction that is rolled back.
+"""
+import argparse
+import json
+import os
+import sys
+
+import sqlalchemy as sa
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app  # noqa: E402
+from app.model import db  # noqa: E402
+from app.model.model_change import Change  # noqa: E402
+from app.model.model_interaction import Ticket  # noqa: E402
+from app.model.model_notes import CommsJournal, Notes  # noqa: E402
+from app.model.model_problem import Problem  # noqa: E402
+from app.model.model_release import Release  # noqa: E402
+from app.model.relationship_tables import cmdb_hardware_dependencies  # noqa: E402
+
+# ids the queries are explained with, the plans do not depend on whether they exist
+USER_ID = 1
+TEAM_ID = 1
+PARENT_ID = 1
+PAGE_SIZE = 10
+
+
+def _open_queue(model, *where):
+    return (sa.select(model.id).where(model.status != 'closed', *where)
+            .order_by(model.ticket_number.asc()).limit(PAGE_SIZE))
+
+
+def _team_scope(model):
+    return (sa.or_(model.supporter_id.is_(None), model.supporter_id != USER_ID),
+            model.support_team_id == TEAM_ID)
+
+
+def _children(model, column):
+    return sa.select(model.id).where(column == PARENT_ID).order_by(model.ticket_number.asc()).limit(PAGE_SIZE)
+
+
+# name -> (statement, names of the indexes that may answer it)
+CHECKS = {
+    'ticket queue': (_open_queue(Ticket), ('ix_ticket_open_number',)),
+    'ticket queue, me': (_open_queue(Ticket, Ticket.supporter_id == USER_ID), ('ix_ticket_open_supporter',)),
+    'ticket queue, team': (_open_queue(Ticket, *_team_scope(Ticket)), ('ix_ticket_open_team',)),
+    'ticket queue, portal': (_open_queue(Ticket, Ticket.requester_id == USER_ID), ('ix_ticket_requester_id',)),
+    'problem queue, me': (_open_queue(Problem, Problem.supporter_id == USER_ID), ('ix_problem_open_supporter',)),
+    'problem queue, team': (_open_queue(Problem, *_team_scope(Problem)), ('ix_problem_open_team',)),
+    'change queue, me': (_open_queue(Change, Change.supporter_id == USER_ID), ('ix_change_open_supporter',)),
+    'change queue, team': (_open_queue(Change, *_team_scope(Change)), ('ix_change_open_team',)),
+    'release queue, me': (_open_queue(Release, Release.supporter_id == USER_ID), ('ix_release_open_supporter',)),
+    'release queue, team': (_open_queue(Release, *_team_scope(Release)), ('ix_release_open_team',)),
+    'ticket priority counts': (
+        sa.select(Ticket.priority, sa.func.count())
+        .where(Ticket.status != 'closed', Ticket.ticket_type.in_(['Incident']))
+        .group_by(sa.func.rollup(Ticket.priority)),
+        ('ix_ticket_open_type_priority',)
+    ),
+    'problem priority counts': (
+        sa.select(Problem.priority, sa.func.count())
+        .where(Problem.status != 'closed', Problem.ticket_type.in_(['Problem', 'Known Error', 'Workaround']))
+        .group_by(sa.func.rollup(Problem.priority)),
+        ('ix_problem_open_type_priority',)
+    ),
+    'ticket status counts': (
+        sa.select(Ticket.status, sa.func.count()).where(Ticket.status != 'closed')
+        .group_by(sa.func.rollup(Ticket.status)),
+        ('ix_ticket_open_status', 'ix_ticket_open_number')
+    ),
+    'open incidents counter': (
+        sa.select(sa.func.count(Ticket.id)).where(Ticket.status != 'closed', Ticket.ticket_type == 'Incident'),
+        ('ix_ticket_open_type_priority',)
+    ),
+    'child tickets of a ticket': (_children(Ticket, Ticket.parent_id), ('ix_ticket_parent_id',)),
+    'child tickets of a problem': (_children(Ticket, Ticket.problem_id), ('ix_ticket_problem_id',)),
+    'child tickets of a change': (_children(Ticket, Ticket.change_id), ('ix_ticket_change_id',)),
+    'child problems of a change': (_children(Problem, Problem.change_id), ('ix_problem_change_id',)),
+    'child releases of a change': (_children(Release, Release.change_id), ('ix_release_change_id',)),
+    'ticket notes': (sa.select(Notes.id).where(Notes.ticket_id == PARENT_ID), ('ix_notes_ticket_id',)),
+    'change notes': (sa.select(Notes.id).where(Notes.change_id == PARENT_ID), ('ix_notes_change_id',)),
+    'ticket comms journal': (
+        sa.select(CommsJournal.id).where(CommsJournal.ticket_id == PARENT_ID), ('ix_comms_journal_ticket_id',)
+    ),
+    'CIs depending on a CI': (
+        sa.select(cmdb_hardware_dependencies.c.parent_id).where(cmdb_hardware_dependencies.c.child_id == PARENT_ID),
+        ('ix_cmdb_hardware_dependencies_child_id',)
+    ),
+}
+
+
+def _index_names(plan):
+    """Every index a plan node or any node below it reads."""
+    names = {plan['Index Name']} if 'Index Name' in plan else set()
+    for child in plan.get('Plans', []):
+        names |= _index_names(child)
+    return names
+
+
+def _explain(connection, stmt):
+    compiled = stmt.compile(dialect=connection.dialect, compile_kwargs={'literal_binds': True})
+    return connection.exec_driver_sql(f'EXPLAIN (FORMAT JSON) {compiled}').scalar()[0]['Plan']
+
+
+def _missing_indexes(connection):
+    expected = {name for _, names in CHECKS.values() for name in names}
+    present = set(connection.scalars(
+        sa.text('SELECT indexname FROM pg_indexes WHERE indexname = ANY(:names)'), {'names': sorted(expected)}
+    ))
+    return sorted(expected - present)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check the hot queries are answered from their indexes.')
+    parser.add_argument('--natural', action='store_true', help='leave sequential scans on')
+    parser.add_argument('--verbose', action='store_true', help='print the plan of every query')
+    args = parser.parse_args()
+
+    app = create_app()
+    status = 0
+    with app.app_context(), db.engine.connect() as connection:
+        missing = _missing_indexes(connection)
+        if missing:
+            print(f'not in the database, run flask db upgrade: {", ".join(missing)}')
+
+        with connection.begin() as transaction:
+            if not args.natural:
+                connection.exec_driver_sql('SET LOCAL enable_seqscan = off')
+
+            for name, (stmt, indexes) in CHECKS.items():
+                plan = _explain(connection, stmt)
+                used = _index_names(plan)
+                passed = bool(used & set(indexes))
+                status = status or (0 if passed else 1)
+                print(f'{"ok  " if passed else "FAIL"} {name:<30} {", ".join(sorted(used)) or "no index"}')
+                if args.verbose or not passed:
+                    print(json.dumps(plan, indent=2))
+            transaction.rollback()
+
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
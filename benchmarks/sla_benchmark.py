@@ -0,0 +1,403 @@
+"""
+Benchmarks and equivalence checks for the SLA business-hours engines:
+
+    SLACalculator.add_business_hours     (common/sla_calculator.py, backed by common/business_calendar.py)
+    BusinessCalendar.add_business_hours_batch
+    BusinessHoursCalculator              (common/BusinessHours.py, outage minutes)
+    add_working_hours                    (the loop calculate_resolve_time used before it moved to the calendar)
+
+Each engine is timed over durations from minutes to months, business hours and 24/7, in ordinary, holiday dense and
+daylight saving periods. The same generated cases are checked against a plain day by day reference implementation
+and against properties every engine should hold, and the results are written as JSON so runs can be compared
+between releases.
+
+Run from the repository root:
+
+    python benchmarks/sla_benchmark.py                              # timings and equivalence report
+    python benchmarks/sla_benchmark.py --cases 2000 --output bench.json
+    python benchmarks/sla_benchmark.py --record baseline.json       # save the current answers for every case
+    python benchmarks/sla_benchmark.py --compare baseline.json      # check the current engines against a baseline
+
+The report exits with status 1 if the calendar engines disagree with the reference or break a property. The legacy
+engines, BusinessHoursCalculator and add_working_hours, follow other weekend, holiday and rounding conventions, so
+their mismatches are expected: they are labelled so in the report and do not fail the run. --compare exits with
+status 1 if any answer differs from the baseline, so a faster engine can be dropped in and checked against the
+results of the one it replaces. Cases are generated from --seed, so use the same seed and case
+count as the recording. The app package is imported so the environment it needs at start up (DB_PASSWORD and the
+mail settings) must be set, but no database is used.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time as clock
+from datetime import date, datetime, time, timedelta, timezone
+from importlib.metadata import version
+from types import SimpleNamespace
+
+import holidays
+import numpy as np
+import pendulum
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.common.BusinessHours import BusinessHoursCalculator  # noqa: E402
+from app.common.business_calendar import EPOCH, MICROSECOND, to_instant  # noqa: E402
+from app.common.sla_calculator import SLACalculator  # noqa: E402
+
+# office hours the cases run against: one without daylight saving, one with
+OFFICES = {
+    'brisbane': SimpleNamespace(open_hour=time(8), close_hour=time(17), timezone='Australia/Brisbane',
+                                country_code='AU', state='QLD', province=None),
+    'sydney': SimpleNamespace(open_hour=time(9), close_hour=time(17, 30), timezone='Australia/Sydney',
+                              country_code='AU', state='NSW', province=None),
+}
+
+# business hours added per case, (low, high)
+DURATIONS = {
+    'minutes': (5 / 60, 1),
+    'hours': (1, 8),
+    'days': (9, 72),
+    'weeks': (40, 200),
+    'months': (200, 800),
+}
+
+# local date ranges the start times are drawn from
+PERIODS = {
+    'ordinary': [(date(2026, 3, 9), date(2026, 3, 27)), (date(2026, 7, 6), date(2026, 8, 28))],
+    'holiday_dense': [(date(2025, 12, 15), date(2026, 1, 9)), (date(2026, 3, 30), date(2026, 4, 10))],
+    'dst': [(date(2026, 3, 30), date(2026, 4, 8)), (date(2026, 9, 28), date(2026, 10, 9))],
+}
+
+TOLERANCE_SECONDS = 1e-6
+# checks of the legacy engines, whose mismatches with the reference are expected and do not fail the run
+LEGACY_CHECKS = ('business_hours_minutes_vs_reference', 'add_working_hours_vs_reference')
+
+
+def add_working_hours(response_time, wait_hours, work_start, work_end):
+    """
+    The loop calculate_resolve_time in common/sla.py used before it moved onto the business calendar: naive local
+    time, Monday to Friday, no holidays. Kept so the old and new results can still be compared.
+    """
+    weekends = [6, 7]  # Saturday and Sunday
+    response_hour = response_time.time()
+
+    if response_hour < work_start or response_hour >= work_end:
+        if response_hour >= work_end:
+            response_time += timedelta(days=1)
+        response_time = response_time.replace(hour=work_start.hour, minute=0, second=0, microsecond=0)
+
+    remaining_hours = wait_hours
+    result_response_time = response_time
+
+    while remaining_hours > 0:
+        if result_response_time.isoweekday() in weekends:
+            result_response_time += timedelta(days=1)
+            result_response_time = result_response_time.replace(hour=work_start.hour, minute=0, second=0, microsecond=0)
+            continue
+
+        end_of_day = result_response_time.replace(hour=work_end.hour, minute=work_end.minute, second=0, microsecond=0)
+        hours_till_end_of_day = (end_of_day - result_response_time).total_seconds() / 3600
+
+        if remaining_hours <= hours_till_end_of_day:
+            result_response_time += timedelta(hours=remaining_hours)
+            remaining_hours = 0
+        else:
+            remaining_hours -= hours_till_end_of_day
+            result_response_time = end_of_day + timedelta(days=1)
+            result_response_time = result_response_time.replace(hour=work_start.hour, minute=0, second=0, microsecond=0)
+    return result_response_time
+
+
+def _generate_cases(count, seed):
+    """Deterministic cases spread over every office, duration class, period and business/24-7 mode."""
+    rng = random.Random(seed)
+    cases = []
+    for index in range(count):
+        office = rng.choice(list(OFFICES))
+        duration = rng.choice(list(DURATIONS))
+        period = rng.choice(list(PERIODS))
+        first, last = rng.choice(PERIODS[period])
+        day = first + timedelta(days=rng.randrange((last - first).days + 1))
+        start = pendulum.datetime(day.year, day.month, day.day, rng.randrange(24), rng.randrange(60),
+                                  tz=OFFICES[office].timezone)
+        low, high = DURATIONS[duration]
+        cases.append({
+            'index': index,
+            'office': office,
+            'duration': duration,
+            'period': period,
+            'twentyfour_seven': rng.random() < 0.2,
+            'start': start,
+            'hours': round(rng.uniform(low, high), 4),
+        })
+    return cases
+
+
+class Reference:
+    """
+    Business time worked out one local day at a time straight from the office hours and holiday list, with none of
+    the precomputation of the engines, to check them against.
+    """
+    def __init__(self, office):
+        self.office = office
+        self.tz = pendulum.timezone(office.timezone)
+        self.holidays = holidays.country_holidays(office.country_code, subdiv=office.state or office.province,
+                                                  years=range(2024, 2030))
+
+    def _window(self, day):
+        if day.weekday() >= 5 or day in self.holidays:
+            return None
+        open_at = pendulum.datetime(day.year, day.month, day.day, self.office.open_hour.hour,
+                                    self.office.open_hour.minute, tz=self.tz)
+        close_at = pendulum.datetime(day.year, day.month, day.day, self.office.close_hour.hour,
+                                     self.office.close_hour.minute, tz=self.tz)
+        return open_at, close_at
+
+    def add_business_hours(self, start, hours):
+        remaining = timedelta(hours=hours)
+        day = start.in_timezone(self.tz).date()
+        while True:
+            window = self._window(day)
+            if window:
+                open_at, close_at = window
+                begin = max(start, open_at)
+                if begin < close_at:
+                    if begin + remaining <= close_at:
+                        return begin + remaining
+                    remaining -= close_at - begin
+            day += timedelta(days=1)
+
+    def business_seconds(self, start, end):
+        total = 0.0
+        day = start.in_timezone(self.tz).date()
+        while day <= end.in_timezone(self.tz).date():
+            window = self._window(day)
+            if window:
+                begin, finish = max(start, window[0]), min(end, window[1])
+                total += max(0.0, (finish - begin).total_seconds())
+            day += timedelta(days=1)
+        return total
+
+
+def _time_calls(function, arguments, repeats):
+    """Median microseconds per call of function over the argument list."""
+    runs = []
+    for _ in range(repeats):
+        started = clock.perf_counter()
+        for args in arguments:
+            function(*args)
+        runs.append((clock.perf_counter() - started) / len(arguments) * 1_000_000)
+    return statistics.median(runs)
+
+
+def _answers(cases):
+    """Every engine's answer for every case, as plain JSON values."""
+    calculators = {name: SLACalculator(office) for name, office in OFFICES.items()}
+    answers = []
+    for case in cases:
+        office = OFFICES[case['office']]
+        start, hours = case['start'], case['hours']
+        deadline = calculators[case['office']].add_business_hours(start, hours, case['twentyfour_seven'])
+        outage = BusinessHoursCalculator(start, start.add(hours=hours), [office.open_hour, office.close_hour],
+                                         office.country_code, office.timezone, office.state, office.province)
+        local = start.in_timezone(office.timezone).naive()
+        answers.append({
+            'sla_calculator': deadline.in_timezone('UTC').isoformat(),
+            'business_hours_minutes': outage.get_minutes(),
+            'add_working_hours': add_working_hours(local, hours, office.open_hour, office.close_hour).isoformat(),
+        })
+    return answers
+
+
+def run_timings(cases, repeats):
+    """Per-call timings of each engine grouped by duration class and business/24-7 mode."""
+    calculators = {name: SLACalculator(office) for name, office in OFFICES.items()}
+    results = []
+
+    for duration in DURATIONS:
+        for twentyfour_seven in (False, True):
+            group = [case for case in cases
+                     if case['duration'] == duration and case['twentyfour_seven'] == twentyfour_seven]
+            if not group:
+                continue
+
+            timings = {
+                'sla_calculator': _time_calls(
+                    lambda case: calculators[case['office']].add_business_hours(
+                        case['start'], case['hours'], case['twentyfour_seven']),
+                    [(case,) for case in group], repeats),
+            }
+
+            if not twentyfour_seven:
+                def outage_minutes(case):
+                    office = OFFICES[case['office']]
+                    return BusinessHoursCalculator(
+                        case['start'], case['start'].add(hours=case['hours']), [office.open_hour, office.close_hour],
+                        office.country_code, office.timezone, office.state, office.province).get_minutes()
+
+                def working_hours(case):
+                    office = OFFICES[case['office']]
+                    return add_working_hours(case['start'].in_timezone(office.timezone).naive(), case['hours'],
+                                             office.open_hour, office.close_hour)
+
+                timings['business_hours_minutes'] = _time_calls(outage_minutes, [(case,) for case in group], repeats)
+                timings['add_working_hours'] = _time_calls(working_hours, [(case,) for case in group], repeats)
+
+                for office_name, calculator in calculators.items():
+                    office_cases = [case for case in group if case['office'] == office_name]
+                    if not office_cases:
+                        continue
+                    starts = np.array([to_instant(case['start']) for case in office_cases], dtype=np.int64)
+                    durations = np.array([round(case['hours'] * 3600 * 1_000_000) for case in office_cases],
+                                         dtype=np.int64)
+                    timings[f'calendar_batch_{office_name}'] = _time_calls(
+                        lambda: calculator.calendar.add_business_hours_batch(starts, durations),
+                        [()], repeats) / len(office_cases)
+
+            results.append({
+                'duration': duration,
+                'twentyfour_seven': twentyfour_seven,
+                'cases': len(group),
+                'microseconds_per_call': {name: round(value, 2) for name, value in timings.items()},
+            })
+    return results
+
+
+def run_equivalence(cases, examples=5):
+    """
+    Check every case against the reference and the properties each engine should hold. Mismatches are counted per
+    check with the first few kept as examples; the legacy engines use different weekend, holiday and rounding
+    conventions so their mismatch counts, marked mismatches_expected, show how far they are from the reference rather
+    than failures.
+    """
+    calculators = {name: SLACalculator(office) for name, office in OFFICES.items()}
+    references = {name: Reference(office) for name, office in OFFICES.items()}
+    checks = {}
+
+    def check(name, case, passed, **detail):
+        result = checks.setdefault(name, {'checked': 0, 'mismatched': 0, 'mismatches_expected': name in LEGACY_CHECKS,
+                                          'max_error_seconds': 0.0, 'examples': []})
+        result['checked'] += 1
+        error = abs(detail.get('error_seconds', 0.0))
+        result['max_error_seconds'] = max(result['max_error_seconds'], error)
+        if not passed:
+            result['mismatched'] += 1
+            if len(result['examples']) < examples:
+                result['examples'].append({'case': case['index'], 'office': case['office'],
+                                           'start': case['start'].isoformat(), 'hours': case['hours'], **detail})
+
+    for case in cases:
+        if case['twentyfour_seven']:
+            continue
+        office = OFFICES[case['office']]
+        calculator = calculators[case['office']]
+        reference = references[case['office']]
+        start, hours = case['start'], case['hours']
+
+        expected = reference.add_business_hours(start, hours)
+        deadline = calculator.add_business_hours(start, hours, False)
+        error = (deadline - expected).total_seconds()
+        check('sla_calculator_vs_reference', case, abs(error) <= TOLERANCE_SECONDS,
+              expected=expected.isoformat(), actual=deadline.isoformat(), error_seconds=error)
+
+        elapsed = calculator.calendar.business_seconds(start, deadline)
+        error = elapsed - hours * 3600
+        check('calendar_round_trip', case, abs(error) <= TOLERANCE_SECONDS, error_seconds=error)
+
+        longer = calculator.add_business_hours(start, hours * 1.5, False)
+        check('sla_calculator_monotonic', case, longer >= deadline,
+              shorter=deadline.isoformat(), longer=longer.isoformat())
+
+        batch = calculator.calendar.add_business_hours_batch(
+            np.array([to_instant(start)], dtype=np.int64),
+            np.array([round(hours * 3600 * 1_000_000)], dtype=np.int64))[0]
+        batch_deadline = EPOCH + int(batch) * MICROSECOND
+        error = (batch_deadline - deadline).total_seconds()
+        check('calendar_batch_vs_scalar', case, error == 0, error_seconds=error)
+
+        end = start.add(hours=hours)
+        outage = BusinessHoursCalculator(start, end, [office.open_hour, office.close_hour], office.country_code,
+                                         office.timezone, office.state, office.province).get_minutes()
+        expected = reference.business_seconds(start, end)
+        error = outage * 60 - expected
+        check('business_hours_minutes_vs_reference', case, abs(error) < 60,
+              expected_minutes=expected / 60, actual_minutes=outage, error_seconds=error)
+
+        local = start.in_timezone(office.timezone).naive()
+        legacy = add_working_hours(local, hours, office.open_hour, office.close_hour)
+        expected = reference.add_business_hours(start, hours).in_timezone(office.timezone).naive()
+        error = (legacy - expected).total_seconds()
+        check('add_working_hours_vs_reference', case, abs(error) <= TOLERANCE_SECONDS,
+              expected=expected.isoformat(), actual=legacy.isoformat(), error_seconds=error)
+
+    return checks
+
+
+def _metadata(args):
+    return {
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pendulum': version('pendulum'),
+        'holidays': version('holidays'),
+        'seed': args.seed,
+        'cases': args.cases,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark and cross-check the SLA business-hours engines.')
+    parser.add_argument('--cases', type=int, default=500, help='number of generated cases')
+    parser.add_argument('--seed', type=int, default=20260101, help='seed for the generated cases')
+    parser.add_argument('--repeats', type=int, default=3, help='timing runs per group, the median is reported')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    parser.add_argument('--record', help='write every engine answer for every case to this baseline file')
+    parser.add_argument('--compare', help='check every engine answer against this baseline file')
+    args = parser.parse_args()
+
+    cases = _generate_cases(args.cases, args.seed)
+    report = {'meta': _metadata(args)}
+    status = 0
+
+    if args.record:
+        with open(args.record, 'w') as baseline:
+            json.dump({'meta': report['meta'], 'answers': _answers(cases)}, baseline, indent=1)
+        report['recorded'] = args.record
+    elif args.compare:
+        with open(args.compare) as baseline:
+            recorded = json.load(baseline)
+        if (recorded['meta']['seed'], recorded['meta']['cases']) != (args.seed, args.cases):
+            parser.error(f"baseline was recorded with --seed {recorded['meta']['seed']} "
+                         f"--cases {recorded['meta']['cases']}")
+        differences = []
+        for case, expected, actual in zip(cases, recorded['answers'], _answers(cases)):
+            for engine, value in expected.items():
+                if actual.get(engine) != value:
+                    differences.append({'case': case['index'], 'engine': engine, 'baseline': value,
+                                        'current': actual.get(engine)})
+        report['compared_to'] = {'file': args.compare, 'meta': recorded['meta']}
+        report['differences'] = differences
+        status = 1 if differences else 0
+    else:
+        report['timings'] = run_timings(cases, args.repeats)
+        report['equivalence'] = run_equivalence(cases)
+        failed = [name for name, result in report['equivalence'].items()
+                  if result['mismatched'] and not result['mismatches_expected']]
+        report['failed_checks'] = failed
+        status = 1 if failed else 0
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as output:
+            output.write(text)
+    else:
+        print(text)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
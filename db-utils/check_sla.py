@@ -1,39 +1,37 @@
-import datetime
+from sqlalchemy import and_, func, update
 from config import Ticket, Session
 
 
 def check_sla_breach():
     """
-    Checks for SLA Respond and Resolve breach and updates ticket Boolean for dashboard display
+    Checks for SLA Respond and Resolve breach and updates ticket Boolean for dashboard display. The app flags breaches
+    itself as each deadline passes (app/common/sla_scheduler.py); this set-based sweep is for running from cron when
+    the scheduler is switched off. Flags are only ever set, never cleared, so a breach the scheduler flagged stands.
     :return: Nothing but ticket should be updated if SLA breached else does nothing
     """
     session = Session()
-    from sqlalchemy import or_
+    now = func.now()
+    open_unpaused = and_(Ticket.status != 'closed', Ticket.sla_paused.is_(False))
 
-    all_open_tickets = session.query(Ticket).filter(or_(Ticket.status == "New",
-                                                        Ticket.status == "In Progress")).all()
-    current_time = datetime.datetime.now()
+    session.execute(
+        update(Ticket)
+        .where(open_unpaused, Ticket.sla_responded.is_(False))
+        .where(Ticket.sla_response_breach.is_(False), Ticket.sla_respond_by < now)
+        .values(sla_response_breach=True)
+        .execution_options(synchronize_session=False)
+    )
 
-    for ticket in all_open_tickets:
-        if not ticket.sla_paused:
-            if ticket.sla_respond_by < current_time:
-                ticket.sla_response_breach = True
-                ticket.worklog = (f'<span name="worklog-time">{current_time}'
-                                  f'</span>SLA response time breached'
-                                  f'<br>{ticket.worklog}')
-                session.commit()
+    session.execute(
+        update(Ticket)
+        .where(open_unpaused, Ticket.sla_resolved.is_(False))
+        .where(Ticket.sla_resolve_breach.is_(False), Ticket.sla_resolve_by < now)
+        .values(sla_resolve_breach=True)
+        .execution_options(synchronize_session=False)
+    )
 
-            if ticket.sla_resolve_by < current_time:
-                ticket.sla_resolve_breach = True
-                ticket.worklog = (f'<span name="worklog-time">{current_time}'
-                                  f'</span>SLA resolution time breached'
-                                  f'<br>{ticket.worklog}')
-                session.commit()
+    session.commit()
+    session.close()
 
 
 if __name__ == '__main__':
     check_sla_breach()
-
-
-def check_for_response_breach():
-    pass
\ No newline at end of file
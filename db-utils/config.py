@@ -16,6 +16,10 @@ class Ticket(Base):
     sla_paused = Column(Boolean)
     sla_respond_by = Column(DateTime, nullable=True)
     sla_resolve_by = Column(DateTime, nullable=True)
+    sla_responded = Column(Boolean)
+    sla_resolved = Column(Boolean)
+    sla_response_breach = Column(Boolean)
+    sla_resolve_breach = Column(Boolean)
     resolved_at = Column(DateTime, nullable=True)
     closed_at = Column(DateTime, nullable=True)
 
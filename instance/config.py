@@ -89,6 +89,27 @@ class BaseConfig:
 
     # Pagination default
     ROWS_PER_PAGE = 10
+    # Table totals are remembered between page requests for this long. Unfiltered tables with at least this many
+    # rows show the planner's estimate of their size rather than being counted
+    COUNT_CACHE_SECONDS = int(os.getenv('COUNT_CACHE_SECONDS', 30))
+    ESTIMATED_COUNT_MIN_ROWS = int(os.getenv('ESTIMATED_COUNT_MIN_ROWS', 100000))
+    # Names that dashboard charts filter tables by are read from the lookup tables at most this often per worker
+    FILTER_VOCABULARY_SECONDS = int(os.getenv('FILTER_VOCABULARY_SECONDS', 300))
+    # Table exports are read from the database and written out this many rows at a time
+    EXPORT_BATCH_ROWS = int(os.getenv('EXPORT_BATCH_ROWS', 1000))
+
+    # SLA breaches are flagged by a background scheduler as each deadline passes. The resync reloads its deadlines
+    # from the database to catch changes made by other workers
+    SLA_BREACH_SCHEDULER = os.getenv('SLA_BREACH_SCHEDULER', 'true').lower() == 'true'
+    SLA_BREACH_RESYNC_SECONDS = int(os.getenv('SLA_BREACH_RESYNC_SECONDS', 3600))
+
+    # Dashboard charts count records from the dashboard_counters table, which is kept up to date as records are
+    # written and recounted from the records each night at this hour (UTC) to repair any drift. Switched off, records
+    # are written without touching the table and charts count the records themselves
+    DASHBOARD_COUNTERS = os.getenv('DASHBOARD_COUNTERS', 'true').lower() == 'true'
+    DASHBOARD_COUNTERS_RECONCILE_HOUR = int(os.getenv('DASHBOARD_COUNTERS_RECONCILE_HOUR', 2))
+    # Dashboard chart counts are shared between requests for this long, or until a record of the model is saved
+    DASHBOARD_CACHE_SECONDS = int(os.getenv('DASHBOARD_CACHE_SECONDS', 5))
 
     # Prevent jsonify from alphabetically ordering and screwing up the order I need
     JSON_SORT_KEYS = False
@@ -0,0 +1,139 @@
+"""Indexes and SLA and dashboard tables
+
+Indexes for the open queue, dashboard and child record paths, the SLA ledger and compliance rollup tables and the
+dashboard counters. The ledger rows are written as tickets are next settled and the counters are filled by the
+reconciler the first time the app starts with them empty, so no data is copied here.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 08:57:57.970517
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+OPEN = sa.text("status != 'closed'")
+
+# (index, table, columns, partial on open records)
+INDEXES = [
+    ('ix_change_open_supporter', 'change', ['supporter_id', 'ticket_number'], True),
+    ('ix_change_open_team', 'change', ['support_team_id', 'ticket_number'], True),
+    ('ix_change_requester_id', 'change', ['requester_id'], False),
+    ('ix_cmdb_hardware_dependencies_child_id', 'cmdb_hardware _dependencies', ['child_id'], False),
+    ('ix_comms_journal_problem_id', 'comms_journal', ['problem_id'], False),
+    ('ix_comms_journal_ticket_id', 'comms_journal', ['ticket_id'], False),
+    ('ix_idea_requester_id', 'idea', ['requester_id'], False),
+    ('ix_idea_support_team_id', 'idea', ['support_team_id'], False),
+    ('ix_notes_change_id', 'notes', ['change_id'], False),
+    ('ix_notes_cmdb_id', 'notes', ['cmdb_id'], False),
+    ('ix_notes_idea_id', 'notes', ['idea_id'], False),
+    ('ix_notes_knowledgebase_id', 'notes', ['knowledgebase_id'], False),
+    ('ix_notes_problem_id', 'notes', ['problem_id'], False),
+    ('ix_notes_release_id', 'notes', ['release_id'], False),
+    ('ix_notes_ticket_id', 'notes', ['ticket_id'], False),
+    ('ix_problem_change_id', 'problem', ['change_id', 'ticket_number'], False),
+    ('ix_problem_open_supporter', 'problem', ['supporter_id', 'ticket_number'], True),
+    ('ix_problem_open_team', 'problem', ['support_team_id', 'ticket_number'], True),
+    ('ix_problem_open_type_priority', 'problem', ['ticket_type', 'priority'], True),
+    ('ix_problem_requester_id', 'problem', ['requester_id'], False),
+    ('ix_release_change_id', 'release', ['change_id', 'ticket_number'], False),
+    ('ix_release_open_supporter', 'release', ['supporter_id', 'ticket_number'], True),
+    ('ix_release_open_team', 'release', ['support_team_id', 'ticket_number'], True),
+    ('ix_release_requester_id', 'release', ['requester_id'], False),
+    ('ix_ticket_change_id', 'ticket', ['change_id', 'ticket_number'], False),
+    ('ix_ticket_open_number', 'ticket', ['ticket_number'], True),
+    ('ix_ticket_open_status', 'ticket', ['status'], True),
+    ('ix_ticket_open_supporter', 'ticket', ['supporter_id', 'ticket_number'], True),
+    ('ix_ticket_open_team', 'ticket', ['support_team_id', 'ticket_number'], True),
+    ('ix_ticket_open_type_priority', 'ticket', ['ticket_type', 'priority'], True),
+    ('ix_ticket_parent_id', 'ticket', ['parent_id', 'ticket_number'], False),
+    ('ix_ticket_problem_id', 'ticket', ['problem_id', 'ticket_number'], False),
+    ('ix_ticket_requester_id', 'ticket', ['requester_id', 'ticket_number'], False),
+]
+
+# case-insensitive prefix searches, (index, table, column)
+LOWER_INDEXES = [
+    ('ix_cmdb_configuration_item_name_lower', 'cmdb_configuration_item', 'name'),
+    ('ix_user_email_lower', 'user', 'email'),
+    ('ix_user_full_name_lower', 'user', 'full_name'),
+    ('ix_user_phone_lower', 'user', 'phone'),
+]
+
+
+def upgrade():
+    op.create_table('dashboard_counters',
+    sa.Column('id', sa.Integer(), sa.Identity(always=False), nullable=False),
+    sa.Column('model', sa.String(length=30), nullable=False),
+    sa.Column('ticket_type', sa.String(length=50), nullable=True),
+    sa.Column('status', sa.String(length=50), nullable=True),
+    sa.Column('priority', sa.String(length=2), nullable=True),
+    sa.Column('support_team_id', sa.Integer(), nullable=True),
+    sa.Column('supporter_id', sa.Integer(), nullable=True),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('model', 'ticket_type', 'status', 'priority', 'support_team_id', 'supporter_id',
+                        postgresql_nulls_not_distinct=True)
+    )
+    op.create_table('sla_compliance_rollup',
+    sa.Column('id', sa.Integer(), sa.Identity(always=False), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('team_id', sa.Integer(), nullable=True),
+    sa.Column('priority', sa.String(length=2), nullable=True),
+    sa.Column('tickets', sa.Integer(), nullable=False),
+    sa.Column('respond_met', sa.Integer(), nullable=False),
+    sa.Column('respond_breached', sa.Integer(), nullable=False),
+    sa.Column('resolve_met', sa.Integer(), nullable=False),
+    sa.Column('resolve_breached', sa.Integer(), nullable=False),
+    sa.Column('paused', sa.Integer(), nullable=False),
+    sa.Column('respond_seconds', sa.Float(), nullable=False),
+    sa.Column('respond_count', sa.Integer(), nullable=False),
+    sa.Column('resolve_seconds', sa.Float(), nullable=False),
+    sa.Column('resolve_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('day', 'team_id', 'priority', postgresql_nulls_not_distinct=True)
+    )
+    op.create_table('sla_duration_histogram',
+    sa.Column('id', sa.Integer(), sa.Identity(always=False), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('team_id', sa.Integer(), nullable=True),
+    sa.Column('priority', sa.String(length=2), nullable=True),
+    sa.Column('measure', sa.String(length=7), nullable=False),
+    sa.Column('bucket', sa.SmallInteger(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('day', 'team_id', 'priority', 'measure', 'bucket', postgresql_nulls_not_distinct=True)
+    )
+    op.create_table('ticket_sla_ledger',
+    sa.Column('ticket_id', sa.Integer(), nullable=False),
+    sa.Column('business_seconds_consumed', sa.Float(), nullable=False),
+    sa.Column('business_seconds_paused', sa.Float(), nullable=False),
+    sa.Column('counted_to', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('clock_state', sa.String(length=10), nullable=False),
+    sa.Column('compliance_recorded_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['ticket_id'], ['ticket.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('ticket_id')
+    )
+
+    for name, table, columns, open_only in INDEXES:
+        op.create_index(name, table, columns, unique=False, postgresql_where=OPEN if open_only else None)
+    for name, table, column in LOWER_INDEXES:
+        op.create_index(name, table, [sa.text(f'lower({column}) text_pattern_ops')], unique=False)
+
+
+def downgrade():
+    for name, table, _ in reversed(LOWER_INDEXES):
+        op.drop_index(name, table_name=table)
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+
+    op.drop_table('ticket_sla_ledger')
+    op.drop_table('sla_duration_histogram')
+    op.drop_table('sla_compliance_rollup')
+    op.drop_table('dashboard_counters')
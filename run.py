@@ -1,6 +1,7 @@
-from app import create_app
+from app import create_app, start_background_jobs
 
 app = create_app('development')
 
 if __name__ == '__main__':
+    start_background_jobs(app)
     app.run(host='0.0.0.0', port=5000, threaded=True)
@@ -1,7 +1,8 @@
-from app import create_app
+from app import create_app, start_background_jobs
 
 # Always use production config for Docker deployment
 app = create_app('production')
+start_background_jobs(app)
 
 if __name__ == "__main__":
     app.run()
\ No newline at end of file